@@ -56,7 +56,7 @@ JOB_EXPIRATION_HOURS = int(os.environ.get("VIDEOVOICE_JOB_EXPIRATION", "24"))
 # AI Model Configuration
 WHISPER_MODEL = os.environ.get("VIDEOVOICE_WHISPER_MODEL", "large-v3")
 WHISPER_BATCH_SIZE = int(os.environ.get("VIDEOVOICE_WHISPER_BATCH", "4"))
-WHISPER_COMPUTE_TYPE = os.environ.get("VIDEOVOICE_WHISPER_COMPUTE", "float16")
+WHISPER_COMPUTE_TYPE = os.environ.get("VIDEOVOICE_WHISPER_COMPUTE", "")  # "" = auto (int8_float16 on CC >= 7.5)
 
 OLLAMA_HOST = os.environ.get("VIDEOVOICE_OLLAMA_HOST", "http://localhost:11434")
 OLLAMA_MODEL = os.environ.get("VIDEOVOICE_OLLAMA_MODEL", "qwen3:14b")
@@ -79,6 +79,28 @@ STT_ENGINE = os.environ.get("VIDEOVOICE_STT_ENGINE", "local")  # local, groq, op
 # Gemini API (for translation quality validation)
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
 GEMINI_MODEL = os.environ.get("GEMINI_MODEL", "gemini-2.5-flash")
+# Extra comma-separated keys; translation calls rotate over GEMINI_API_KEY plus these, each with its own limits
+GEMINI_API_KEYS = list(dict.fromkeys(
+    k for k in (k.strip() for k in [GEMINI_API_KEY, *os.environ.get("GEMINI_API_KEYS", "").split(",")]) if k
+))
+GEMINI_KEY_COOLDOWN = float(os.environ.get("GEMINI_KEY_COOLDOWN", "60"))  # seconds a rate-limited key sits out
+
+# Gemini rate limits per tier: (requests/min, tokens/min, requests/day); a 90% safety margin is applied.
+# Unset tier = no local caps: the limiter only backs off after real 429 responses.
+GEMINI_TIER = os.environ.get("GEMINI_TIER", "").strip().lower()  # free, tier1, tier2
+_GEMINI_TIER_LIMITS = {
+    "free": (10, 250_000, 250),
+    "tier1": (1_000, 1_000_000, 10_000),
+    "tier2": (2_000, 3_000_000, 100_000),
+}
+if GEMINI_TIER:
+    _tier_rpm, _tier_tpm, _tier_rpd = _GEMINI_TIER_LIMITS.get(GEMINI_TIER, _GEMINI_TIER_LIMITS["free"])
+else:
+    _tier_rpm = _tier_tpm = _tier_rpd = 0
+# Each can be set on its own (empty = tier default, 0 = no cap)
+GEMINI_RPM_LIMIT = int(os.environ.get("GEMINI_RPM_LIMIT") or _tier_rpm)
+GEMINI_TPM_LIMIT = int(os.environ.get("GEMINI_TPM_LIMIT") or _tier_tpm)
+GEMINI_RPD_LIMIT = int(os.environ.get("GEMINI_RPD_LIMIT") or _tier_rpd)
 
 
 TTS_MODEL = os.environ.get("VIDEOVOICE_TTS_MODEL", "tts_models/multilingual/multi-dataset/xtts_v2")
@@ -118,11 +140,19 @@ QUALITY_EVAL_TIMEOUT = int(os.environ.get("VIDEOVOICE_QUALITY_TIMEOUT", "120"))
 SUBTITLE_MIN_SUCCESS_RATE = int(os.environ.get("VIDEOVOICE_SUBTITLE_MIN_SUCCESS_RATE", "90"))
 # #5 Fix: Configurable batch success threshold (0-100), below this triggers individual translation
 SUBTITLE_BATCH_THRESHOLD = int(os.environ.get("VIDEOVOICE_SUBTITLE_BATCH_THRESHOLD", "60"))
-# Subtitle batch chunk size (segments per LLM call)
-SUBTITLE_CHUNK_SIZE = int(os.environ.get("VIDEOVOICE_SUBTITLE_CHUNK_SIZE", "10"))
+# Subtitle batch chunk size (max segments per LLM call)
+SUBTITLE_CHUNK_SIZE = int(os.environ.get("VIDEOVOICE_SUBTITLE_CHUNK_SIZE", "40"))
+# Character budget per subtitle batch (tagged input text); batches close at whichever limit hits first
+SUBTITLE_MAX_BATCH_CHARS = int(os.environ.get("VIDEOVOICE_SUBTITLE_MAX_BATCH_CHARS", "6000"))
+# Subtitle batch chunks translated in parallel (API engines only; local Ollama stays sequential)
+SUBTITLE_MAX_CONCURRENT = int(os.environ.get("VIDEOVOICE_SUBTITLE_MAX_CONCURRENT", "8"))
+# NVENC burn-in tuned for text overlays (p5 + AQ + lookahead; B-frame refs need a Turing or newer GPU)
+SUBTITLE_BURN_QUALITY_MODE = os.environ.get("VIDEOVOICE_SUBTITLE_BURN_QUALITY", "0") == "1"
 
 # Quality Validation
 QUALITY_MAX_TEXT_LENGTH = int(os.environ.get("VIDEOVOICE_QUALITY_MAX_TEXT", "10000"))  # Max chars for quality eval
+QUALITY_MAX_CONCURRENT_CALLS = int(os.environ.get("VIDEOVOICE_QUALITY_MAX_CONCURRENT", "4"))  # In-flight Gemini eval calls
+QUALITY_LAZY_MODEL = os.environ.get("VIDEOVOICE_LAZY_MODEL", "0") == "1"  # Skip background Gemini warm-up
 
 # Rate Limiting
 RATE_LIMIT_CLEANUP_THRESHOLD = int(os.environ.get("VIDEOVOICE_RATE_LIMIT_CLEANUP", "100"))  # Cleanup when IPs exceed this
@@ -132,10 +162,26 @@ CACHE_DIR = STATIC_DIR / "cache" / "translations"
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 TRANSLATION_CACHE_ENABLED = os.environ.get("VIDEOVOICE_CACHE_ENABLED", "true").lower() == "true"
 CACHE_EXPIRATION_DAYS = int(os.environ.get("VIDEOVOICE_CACHE_EXPIRATION_DAYS", "30"))
+SEGMENT_CACHE_PATH = CACHE_DIR / "segments.sqlite3"  # per-segment subtitle translations
+
+# Quality Evaluation Cache
+QUALITY_CACHE_DIR = STATIC_DIR / "cache" / "quality"
+QUALITY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+QUALITY_CACHE_ENABLED = os.environ.get("VIDEOVOICE_QUALITY_CACHE_ENABLED", "true").lower() == "true"
+QUALITY_CACHE_EXPIRATION_DAYS = int(os.environ.get("VIDEOVOICE_QUALITY_CACHE_EXPIRATION_DAYS", "7"))
 
 # Device Configuration (auto-detected if not set)
 DEVICE = os.environ.get("VIDEOVOICE_DEVICE", "")  # "cuda", "cpu", or "" for auto
 
+# PyTorch CUDA allocator: XTTS/Silero are loaded and freed every job, so let the caching
+# allocator return fragmented blocks. Read at first CUDA use, so setting it here is early enough.
+# expandable_segments is not supported on Windows.
+os.environ.setdefault(
+    "PYTORCH_CUDA_ALLOC_CONF",
+    "max_split_size_mb:512,garbage_collection_threshold:0.8"
+    + ("" if os.name == "nt" else ",expandable_segments:True")
+)
+
 
 def get_device():
     """Get the compute device (cuda or cpu)."""
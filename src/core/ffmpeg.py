@@ -1,8 +1,14 @@
+import asyncio
 import subprocess
 import os
 import re
 import json
 
+# Video codecs that can be stream-copied into an MP4 container without re-encoding
+MP4_COPY_VIDEO_CODECS = {"h264", "hevc", "mpeg4", "av1", "vp9"}
+# Used when a stream copy is impossible or the copy merge failed
+_REENCODE_VIDEO_ARGS = ["-c:v", "libx264", "-preset", "fast", "-crf", "23"]
+
 
 class FFmpegModule:
     # Timeout for FFmpeg operations - loaded from config
@@ -42,6 +48,46 @@ class FFmpegModule:
             print("FFprobe Failed: ffprobe not found in PATH")
             return 0.0
 
+    def get_video_codec(self, file_path: str) -> str:
+        """Get the codec name of the first video stream using ffprobe ("" if unknown)."""
+        cmd = [
+            "ffprobe", "-v", "quiet",
+            "-select_streams", "v:0",
+            "-show_entries", "stream=codec_name",
+            "-print_format", "json",
+            file_path
+        ]
+
+        try:
+            result = subprocess.run(cmd, check=True, capture_output=True, timeout=30)
+            streams = json.loads(result.stdout.decode('utf-8')).get('streams', [])
+            return streams[0].get('codec_name', '') if streams else ""
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, json.JSONDecodeError,
+                FileNotFoundError, IndexError):
+            return ""
+
+    def _video_copy_args(self, video_path: str, output_path: str) -> list[str]:
+        """Return video codec args: stream copy unless the codec is known not to fit the container.
+
+        An unknown codec (ffprobe failed or timed out) is copied too; the _run*_with_fallback
+        runners re-encode only if that copy merge actually fails.
+        """
+        if not output_path.lower().endswith(".mp4"):
+            return ["-c:v", "copy"]
+        codec = self.get_video_codec(video_path)
+        if not codec or codec in MP4_COPY_VIDEO_CODECS:
+            return ["-c:v", "copy"]
+        print(f"Video codec '{codec}' cannot be copied into MP4 - re-encoding with libx264")
+        return list(_REENCODE_VIDEO_ARGS)
+
+    @staticmethod
+    def _reencode_cmd(cmd: list[str]) -> list[str] | None:
+        """cmd with its video stream copy replaced by libx264, or None if it does not copy video."""
+        for i in range(len(cmd) - 1):
+            if cmd[i] == "-c:v" and cmd[i + 1] == "copy":
+                return [*cmd[:i], *_REENCODE_VIDEO_ARGS, *cmd[i + 2:]]
+        return None
+
     def _validate_path(self, path: str, must_exist: bool = True) -> bool:
         """
         Validate file path for security.
@@ -89,70 +135,81 @@ class FFmpegModule:
             print(f"Failed to create output directory: {e}")
             return False
 
-    def extract_audio(self, video_path: str, output_audio_path: str) -> bool:
-        """Extract 16kHz mono audio for Whisper."""
+    def _extract_audio_cmd(self, video_path: str, output_audio_path: str) -> list[str] | None:
+        """Validate paths and build the audio extraction command (None if invalid)."""
         # Validate input path
         if not self._validate_path(video_path, must_exist=True):
             print(f"FFmpeg Extract Failed: Invalid or missing input path: {video_path}")
-            return False
+            return None
 
         # Validate output path (should not exist yet)
         if not self._validate_path(output_audio_path, must_exist=False):
             print(f"FFmpeg Extract Failed: Invalid output path: {output_audio_path}")
-            return False
+            return None
 
         # Ensure output directory exists
         if not self._ensure_output_dir(output_audio_path):
-            return False
+            return None
 
-        cmd = [
+        return [
             "ffmpeg", "-i", video_path,
             "-vn", "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1",
             output_audio_path, "-y"
         ]
 
-        try:
-            result = subprocess.run(
-                cmd,
-                check=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE,
-                timeout=self.TIMEOUT_SECONDS
-            )
-            return True
-        except subprocess.TimeoutExpired:
-            print(f"FFmpeg Extract Failed: Operation timed out after {self.TIMEOUT_SECONDS}s")
+    def extract_audio(self, video_path: str, output_audio_path: str) -> bool:
+        """Extract 16kHz mono audio for Whisper."""
+        cmd = self._extract_audio_cmd(video_path, output_audio_path)
+        return cmd is not None and self._run(cmd, "Extract")
+
+    async def extract_audio_async(self, video_path: str, output_audio_path: str,
+                                  progress_callback=None, cancel_event=None) -> bool:
+        """Async extract_audio with live progress and immediate cancellation."""
+        cmd = self._extract_audio_cmd(video_path, output_audio_path)
+        if cmd is None:
             return False
-        except subprocess.CalledProcessError as e:
-            stderr_msg = e.stderr.decode('utf-8', errors='replace') if e.stderr else 'Unknown error'
-            print(f"FFmpeg Extract Failed: {stderr_msg[:500]}")  # Limit error message length
+        duration = await asyncio.to_thread(self.get_media_duration, video_path) if progress_callback else 0.0
+        return await self._run_async(cmd, "Extract", duration, progress_callback, cancel_event)
+
+    def trim_audio(self, audio_path: str, output_path: str, max_seconds: float) -> bool:
+        """Write the first max_seconds of audio_path as 16-bit PCM WAV."""
+        if not self._validate_path(audio_path, must_exist=True):
+            print(f"FFmpeg Trim Failed: Invalid or missing input path: {audio_path}")
             return False
-        except FileNotFoundError:
-            print("FFmpeg Extract Failed: ffmpeg not found in PATH")
+
+        if not self._validate_path(output_path, must_exist=False):
+            print(f"FFmpeg Trim Failed: Invalid output path: {output_path}")
             return False
 
-    def merge_video(self, video_path: str, audio_path: str, output_path: str) -> bool:
-        """Merge original video with new audio, always preserving full video duration.
+        if not self._ensure_output_dir(output_path):
+            return False
 
-        If audio is shorter than video, pads audio with silence.
-        If audio is longer than video, trims audio to video duration.
-        """
+        cmd = [
+            "ffmpeg", "-i", audio_path,
+            "-t", str(max_seconds),
+            "-vn", "-acodec", "pcm_s16le",
+            output_path, "-y"
+        ]
+        return self._run(cmd, "Trim")
+
+    def _merge_video_cmd(self, video_path: str, audio_path: str, output_path: str) -> tuple[list[str], float] | None:
+        """Validate inputs, probe durations and build the merge command (None if invalid)."""
         # Validate all paths
         if not self._validate_path(video_path, must_exist=True):
             print(f"FFmpeg Merge Failed: Invalid or missing video path: {video_path}")
-            return False
+            return None
 
         if not self._validate_path(audio_path, must_exist=True):
             print(f"FFmpeg Merge Failed: Invalid or missing audio path: {audio_path}")
-            return False
+            return None
 
         if not self._validate_path(output_path, must_exist=False):
             print(f"FFmpeg Merge Failed: Invalid output path: {output_path}")
-            return False
+            return None
 
         # Ensure output directory exists
         if not self._ensure_output_dir(output_path):
-            return False
+            return None
 
         video_duration = self.get_media_duration(video_path)
         audio_duration = self.get_media_duration(audio_path)
@@ -160,15 +217,16 @@ class FFmpegModule:
         # #10 Fix: Check for zero duration to prevent empty output files
         if video_duration <= 0:
             print(f"FFmpeg Merge Failed: Invalid video duration ({video_duration}s)")
-            return False
+            return None
 
         print(f"Optimize merge - Video: {video_duration:.2f}s, Audio: {audio_duration:.2f}s")
 
         # Use audio filter to pad with silence or trim to match video duration
         # apad pads with silence, and -t limits output to video duration
+        # Video is remuxed without re-encoding whenever the codec fits the container
         cmd = [
             "ffmpeg", "-i", video_path, "-i", audio_path,
-            "-c:v", "copy",
+            *self._video_copy_args(video_path, output_path),
             "-af", "apad",
             "-c:a", "aac",
             "-map", "0:v:0", "-map", "1:a:0",
@@ -176,48 +234,45 @@ class FFmpegModule:
             output_path, "-y"
         ]
 
-        try:
-            result = subprocess.run(
-                cmd,
-                check=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE,
-                timeout=self.TIMEOUT_SECONDS
-            )
-            return True
-        except subprocess.TimeoutExpired:
-            print(f"FFmpeg Merge Failed: Operation timed out after {self.TIMEOUT_SECONDS}s")
-            return False
-        except subprocess.CalledProcessError as e:
-            stderr_msg = e.stderr.decode('utf-8', errors='replace') if e.stderr else 'Unknown error'
-            print(f"FFmpeg Merge Failed: {stderr_msg[:500]}")
-            return False
-        except FileNotFoundError:
-            print("FFmpeg Merge Failed: ffmpeg not found in PATH")
-            return False
+        return cmd, video_duration
 
-    def extend_video_to_audio(self, video_path: str, audio_path: str, output_path: str) -> bool:
-        """
-        Merge video with audio, stretching video to match audio duration.
-        Always outputs the full original video content (slowed down if needed).
-        If audio is shorter, pads audio with silence to preserve full video.
+    def merge_video(self, video_path: str, audio_path: str, output_path: str) -> bool:
+        """Merge original video with new audio, always preserving full video duration.
+
+        If audio is shorter than video, pads audio with silence.
+        If audio is longer than video, trims audio to video duration.
         """
+        prepared = self._merge_video_cmd(video_path, audio_path, output_path)
+        return prepared is not None and self._run_with_fallback(prepared[0], "Merge")
+
+    async def merge_video_async(self, video_path: str, audio_path: str, output_path: str,
+                                progress_callback=None, cancel_event=None) -> bool:
+        """Async merge_video with live progress and immediate cancellation."""
+        # Path checks and ffprobe calls are short but blocking - keep them off the loop
+        prepared = await asyncio.to_thread(self._merge_video_cmd, video_path, audio_path, output_path)
+        if prepared is None:
+            return False
+        cmd, duration = prepared
+        return await self._run_async_with_fallback(cmd, "Merge", duration, progress_callback, cancel_event)
+
+    def _extend_video_to_audio_cmd(self, video_path: str, audio_path: str, output_path: str) -> tuple[list[str], float] | None:
+        """Validate inputs, probe durations and build the stretch-merge command (None if invalid)."""
         # Validate all paths
         if not self._validate_path(video_path, must_exist=True):
             print(f"FFmpeg Extend Failed: Invalid or missing video path: {video_path}")
-            return False
+            return None
 
         if not self._validate_path(audio_path, must_exist=True):
             print(f"FFmpeg Extend Failed: Invalid or missing audio path: {audio_path}")
-            return False
+            return None
 
         if not self._validate_path(output_path, must_exist=False):
             print(f"FFmpeg Extend Failed: Invalid output path: {output_path}")
-            return False
+            return None
 
         # Ensure output directory exists
         if not self._ensure_output_dir(output_path):
-            return False
+            return None
 
         # Get durations
         video_duration = self.get_media_duration(video_path)
@@ -225,7 +280,7 @@ class FFmpegModule:
 
         if video_duration <= 0 or audio_duration <= 0:
             print(f"FFmpeg Extend Failed: Could not determine durations (video={video_duration}s, audio={audio_duration}s)")
-            return False
+            return None
 
         print(f"Video duration: {video_duration:.2f}s, Audio duration: {audio_duration:.2f}s")
 
@@ -250,7 +305,7 @@ class FFmpegModule:
             print("Audio fits within video duration - padding audio with silence")
             cmd = [
                 "ffmpeg", "-i", video_path, "-i", audio_path,
-                "-c:v", "copy",
+                *self._video_copy_args(video_path, output_path),
                 "-af", "apad",
                 "-c:a", "aac",
                 "-map", "0:v:0", "-map", "1:a:0",
@@ -258,61 +313,59 @@ class FFmpegModule:
                 output_path, "-y"
             ]
 
-        try:
-            result = subprocess.run(
-                cmd,
-                check=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.PIPE,
-                timeout=self.TIMEOUT_SECONDS
-            )
-            return True
-        except subprocess.TimeoutExpired:
-            print(f"FFmpeg Extend Failed: Operation timed out after {self.TIMEOUT_SECONDS}s")
-            return False
-        except subprocess.CalledProcessError as e:
-            stderr_msg = e.stderr.decode('utf-8', errors='replace') if e.stderr else 'Unknown error'
-            print(f"FFmpeg Extend Failed: {stderr_msg[:500]}")
-            return False
-        except FileNotFoundError:
-            print("FFmpeg Extend Failed: ffmpeg not found in PATH")
-            return False
+        return cmd, max(video_duration, audio_duration)
 
-    def speed_audio_to_video(self, video_path: str, audio_path: str, output_path: str) -> bool:
+    def extend_video_to_audio(self, video_path: str, audio_path: str, output_path: str) -> bool:
         """
-        Merge video with audio, adjusting audio speed to match video duration.
-        Video stays at original speed (no re-encoding). Audio is sped up or slowed down.
-        Always outputs the full original video.
+        Merge video with audio, stretching video to match audio duration.
+        Always outputs the full original video content (slowed down if needed).
+        If audio is shorter, pads audio with silence to preserve full video.
         """
+        prepared = self._extend_video_to_audio_cmd(video_path, audio_path, output_path)
+        return prepared is not None and self._run_with_fallback(prepared[0], "Extend")
+
+    async def extend_video_to_audio_async(self, video_path: str, audio_path: str, output_path: str,
+                                          progress_callback=None, cancel_event=None) -> bool:
+        """Async extend_video_to_audio with live progress and immediate cancellation."""
+        # Path checks and ffprobe calls are short but blocking - keep them off the loop
+        prepared = await asyncio.to_thread(self._extend_video_to_audio_cmd, video_path, audio_path, output_path)
+        if prepared is None:
+            return False
+        cmd, duration = prepared
+        return await self._run_async_with_fallback(cmd, "Extend", duration, progress_callback, cancel_event)
+
+    def _speed_audio_to_video_cmd(self, video_path: str, audio_path: str, output_path: str) -> tuple[list[str], float] | None:
+        """Validate inputs, probe durations and build the tempo-merge command (None if invalid)."""
         if not self._validate_path(video_path, must_exist=True):
             print(f"FFmpeg SpeedAudio Failed: Invalid or missing video path: {video_path}")
-            return False
+            return None
         if not self._validate_path(audio_path, must_exist=True):
             print(f"FFmpeg SpeedAudio Failed: Invalid or missing audio path: {audio_path}")
-            return False
+            return None
         if not self._validate_path(output_path, must_exist=False):
             print(f"FFmpeg SpeedAudio Failed: Invalid output path: {output_path}")
-            return False
+            return None
         if not self._ensure_output_dir(output_path):
-            return False
+            return None
 
         video_duration = self.get_media_duration(video_path)
         audio_duration = self.get_media_duration(audio_path)
 
         if video_duration <= 0 or audio_duration <= 0:
             print(f"FFmpeg SpeedAudio Failed: Could not determine durations (video={video_duration}s, audio={audio_duration}s)")
-            return False
+            return None
 
         print(f"SpeedAudio - Video: {video_duration:.2f}s, Audio: {audio_duration:.2f}s")
 
         tempo = audio_duration / video_duration
+        video_args = self._video_copy_args(video_path, output_path)
 
         if abs(tempo - 1.0) < 0.02:
             # Nearly identical - just merge normally with silence padding
             print("Audio duration matches video - performing normal merge")
             cmd = [
                 "ffmpeg", "-i", video_path, "-i", audio_path,
-                "-c:v", "copy", "-af", "apad", "-c:a", "aac",
+                *video_args, "-af", "apad", "-c:a", "aac",
                 "-map", "0:v:0", "-map", "1:a:0",
                 "-t", str(video_duration),
                 output_path, "-y"
@@ -328,7 +381,7 @@ class FFmpegModule:
 
             cmd = [
                 "ffmpeg", "-i", video_path, "-i", audio_path,
-                "-c:v", "copy",
+                *video_args,
                 "-af", audio_filter,
                 "-c:a", "aac", "-b:a", "192k",
                 "-map", "0:v:0", "-map", "1:a:0",
@@ -336,8 +389,53 @@ class FFmpegModule:
                 output_path, "-y"
             ]
 
+        return cmd, video_duration
+
+    def speed_audio_to_video(self, video_path: str, audio_path: str, output_path: str) -> bool:
+        """
+        Merge video with audio, adjusting audio speed to match video duration.
+        Video stays at original speed (no re-encoding unless the codec cannot be copied
+        into the output container). Audio is sped up or slowed down.
+        Always outputs the full original video.
+        """
+        prepared = self._speed_audio_to_video_cmd(video_path, audio_path, output_path)
+        return prepared is not None and self._run_with_fallback(prepared[0], "SpeedAudio")
+
+    async def speed_audio_to_video_async(self, video_path: str, audio_path: str, output_path: str,
+                                         progress_callback=None, cancel_event=None) -> bool:
+        """Async speed_audio_to_video with live progress and immediate cancellation."""
+        # Path checks and ffprobe calls are short but blocking - keep them off the loop
+        prepared = await asyncio.to_thread(self._speed_audio_to_video_cmd, video_path, audio_path, output_path)
+        if prepared is None:
+            return False
+        cmd, duration = prepared
+        return await self._run_async_with_fallback(cmd, "SpeedAudio", duration, progress_callback, cancel_event)
+
+    def _run_with_fallback(self, cmd: list[str], label: str) -> bool:
+        """_run(), retrying with a libx264 re-encode if a video stream copy failed."""
+        if self._run(cmd, label):
+            return True
+        reencode = self._reencode_cmd(cmd)
+        if reencode is None:
+            return False
+        print(f"FFmpeg {label}: stream copy failed - retrying with libx264 re-encode")
+        return self._run(reencode, label)
+
+    async def _run_async_with_fallback(self, cmd: list[str], label: str, duration: float = 0.0,
+                                       progress_callback=None, cancel_event=None) -> bool:
+        """_run_async(), retrying with a libx264 re-encode if a video stream copy failed."""
+        if await self._run_async(cmd, label, duration, progress_callback, cancel_event):
+            return True
+        reencode = self._reencode_cmd(cmd)
+        if reencode is None:
+            return False
+        print(f"FFmpeg {label}: stream copy failed - retrying with libx264 re-encode")
+        return await self._run_async(reencode, label, duration, progress_callback, cancel_event)
+
+    def _run(self, cmd: list[str], label: str) -> bool:
+        """Run an FFmpeg command to completion in the calling thread."""
         try:
-            result = subprocess.run(
+            subprocess.run(
                 cmd,
                 check=True,
                 stdout=subprocess.DEVNULL,
@@ -346,16 +444,81 @@ class FFmpegModule:
             )
             return True
         except subprocess.TimeoutExpired:
-            print(f"FFmpeg SpeedAudio Failed: Operation timed out after {self.TIMEOUT_SECONDS}s")
+            print(f"FFmpeg {label} Failed: Operation timed out after {self.TIMEOUT_SECONDS}s")
             return False
         except subprocess.CalledProcessError as e:
             stderr_msg = e.stderr.decode('utf-8', errors='replace') if e.stderr else 'Unknown error'
-            print(f"FFmpeg SpeedAudio Failed: {stderr_msg[:500]}")
+            print(f"FFmpeg {label} Failed: {stderr_msg[:500]}")  # Limit error message length
             return False
         except FileNotFoundError:
-            print("FFmpeg SpeedAudio Failed: ffmpeg not found in PATH")
+            print(f"FFmpeg {label} Failed: ffmpeg not found in PATH")
             return False
 
+    async def _run_async(self, cmd: list[str], label: str, duration: float = 0.0,
+                         progress_callback=None, cancel_event=None) -> bool:
+        """Run an FFmpeg command as a native asyncio subprocess.
+
+        Progress is read from ``-progress pipe:1`` and reported to progress_callback
+        as a 0.0-1.0 fraction of ``duration``. If cancel_event is set, FFmpeg is
+        killed right away and InterruptedError is raised. Event loops without
+        subprocess support (Windows selector loop) fall back to a worker thread.
+        """
+        full_cmd = [cmd[0], "-progress", "pipe:1", "-nostats", *cmd[1:]]
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *full_cmd,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except NotImplementedError:
+            return await asyncio.to_thread(self._run, cmd, label)
+        except FileNotFoundError:
+            print(f"FFmpeg {label} Failed: ffmpeg not found in PATH")
+            return False
+
+        async def read_progress():
+            async for raw in proc.stdout:
+                key, _, value = raw.decode('utf-8', errors='replace').strip().partition("=")
+                # out_time_ms is in microseconds despite its name
+                if key != "out_time_ms" or not progress_callback or duration <= 0:
+                    continue
+                try:
+                    progress_callback(min(1.0, max(0.0, int(value) / 1_000_000 / duration)))
+                except ValueError:
+                    continue
+
+        progress_task = asyncio.create_task(read_progress())
+        stderr_task = asyncio.create_task(proc.stderr.read())
+        wait_task = asyncio.create_task(proc.wait())
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.TIMEOUT_SECONDS
+        try:
+            while not wait_task.done():
+                await asyncio.wait({wait_task}, timeout=0.5)
+                if wait_task.done():
+                    break
+                if cancel_event is not None and cancel_event.is_set():
+                    raise InterruptedError(f"FFmpeg {label} cancelled")
+                if loop.time() > deadline:
+                    print(f"FFmpeg {label} Failed: Operation timed out after {self.TIMEOUT_SECONDS}s")
+                    return False
+
+            await progress_task
+            stderr = await stderr_task
+            if proc.returncode != 0:
+                stderr_msg = stderr.decode('utf-8', errors='replace') if stderr else 'Unknown error'
+                print(f"FFmpeg {label} Failed: {stderr_msg[:500]}")
+                return False
+            return True
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            for task in (progress_task, stderr_task, wait_task):
+                if not task.done():
+                    task.cancel()
+
     def _build_atempo_chain(self, tempo: float) -> str:
         """Build chained atempo filters for values outside [0.5, 100.0].
         Each atempo instance handles [0.5, 100.0] range."""
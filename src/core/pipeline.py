@@ -1,15 +1,20 @@
 import os
 import re
+import logging
+import threading
+from dataclasses import dataclass
 from datetime import datetime
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from .stt import STTModule
 from .translate import Translator
-from .tts import TTSModule
+from .tts import TTSModule, XTTS_SPEAKER_REF_SECONDS
 from .ffmpeg import FFmpegModule
 from .quality import QualityValidator
 from .subtitle import generate_srt, translate_segments, burn_subtitles
 
+logger = logging.getLogger(__name__)
+
 def _check_key_term_preservation(original: str, refined: str) -> list[str]:
     """Check if key terms (numbers, proper nouns, technical terms) survived refinement.
     Returns list of lost terms. Empty list = OK."""
@@ -53,6 +58,33 @@ def get_engine_value(settings, field: str, default: str) -> str:
     return value.value if hasattr(value, 'value') else value
 
 
+@dataclass(frozen=True, slots=True)
+class _JobCfg:
+    """Immutable snapshot of a job's settings, resolved once at job start."""
+    source_lang: str
+    target_lang: str
+    sync_mode: str
+    mode: str
+    stt_engine: str
+    translation_engine: str
+    tts_engine: str
+    clone_voice: bool
+    verify: bool
+
+    @classmethod
+    def from_settings(cls, settings) -> "_JobCfg":
+        return cls(
+            source_lang=settings.source_lang,
+            target_lang=settings.target_lang,
+            sync_mode=getattr(settings, 'sync_mode', 'optimize'),
+            mode=get_engine_value(settings, 'mode', 'dubbing'),
+            stt_engine=get_engine_value(settings, 'stt_engine', 'local'),
+            translation_engine=get_engine_value(settings, 'translation_engine', 'local'),
+            tts_engine=get_engine_value(settings, 'tts_engine', 'auto'),
+            clone_voice=getattr(settings, 'clone_voice', True),
+            verify=settings.verify_translation,
+        )
+
 
 class PipelineStepError(Exception):
     """Raised when a pipeline step fails with context."""
@@ -63,19 +95,59 @@ class PipelineStepError(Exception):
 
 
 class Pipeline:
+    _UNSAFE_JOB_ID_RE = re.compile(r'[^a-zA-Z0-9\-]')
+
     def __init__(self):
         self.ffmpeg = FFmpegModule()
-
-    def _validate_input_path(self, input_path: str) -> bool:
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        # Module instances are created once and reused across jobs (warm start)
+        self._stt_modules: dict[str, STTModule] = {}
+        self._translator = Translator()
+        self._tts_modules: dict[str, TTSModule] = {}
+        self._validator = None
+        self._module_lock = asyncio.Lock()
+        # Per-job cancel flags polled by long-running STT/TTS work in worker threads
+        self._cancel_events: dict[str, threading.Event] = {}
+
+    async def _get_stt(self, engine: str) -> STTModule:
+        """Return the cached STTModule for an engine, creating it on first use."""
+        async with self._module_lock:
+            stt = self._stt_modules.get(engine)
+            if stt is None:
+                stt = await asyncio.to_thread(STTModule, engine=engine)
+                self._stt_modules[engine] = stt
+            return stt
+
+    async def _get_tts(self, engine: str) -> TTSModule:
+        """Return the cached TTSModule for an engine, creating it on first use."""
+        async with self._module_lock:
+            tts = self._tts_modules.get(engine)
+            if tts is None:
+                tts = await asyncio.to_thread(TTSModule, engine=engine)
+                self._tts_modules[engine] = tts
+            return tts
+
+    async def _get_validator(self) -> QualityValidator:
+        """Return the shared QualityValidator, creating it on first use."""
+        async with self._module_lock:
+            if self._validator is None:
+                self._validator = QualityValidator()
+            return self._validator
+
+    def _validate_input_path_sync(self, input_path: str) -> bool:
         """Validate that input path is within the allowed upload directory."""
         if not input_path:
             return False
         abs_path = os.path.abspath(input_path)
         return abs_path.startswith(UPLOAD_DIR) and os.path.isfile(abs_path)
 
+    async def _validate_input_path(self, input_path: str) -> bool:
+        """Run input path validation off the event loop (stat may be slow on network mounts)."""
+        return await asyncio.to_thread(self._validate_input_path_sync, input_path)
+
     def _sanitize_job_id(self, job_id: str) -> str:
         """Ensure job_id only contains safe characters."""
-        return re.sub(r'[^a-zA-Z0-9\-]', '', job_id)
+        return self._UNSAFE_JOB_ID_RE.sub('', job_id)
 
     def _cleanup_temp_files(self, *paths):
         """Clean up temporary files."""
@@ -89,43 +161,59 @@ class Pipeline:
     def _check_cancelled(self, job_id: str, job_manager) -> None:
         """Check if job has been cancelled and raise if so."""
         if job_manager.is_cancelled(job_id):
+            cancel_event = self._cancel_events.get(job_id)
+            if cancel_event is not None:
+                cancel_event.set()
             raise PipelineCancelledException("Job was cancelled by user")
 
-    async def _process_subtitle(self, job_id: str, job, input_path: str, job_manager, log):
+    async def _watch_cancellation(self, job_id: str, job_manager, cancel_event: threading.Event) -> None:
+        """Set the job's cancel event as soon as a cancel request arrives, even mid-stage."""
+        while not cancel_event.is_set():
+            if job_manager.is_cancelled(job_id):
+                cancel_event.set()
+                return
+            await asyncio.sleep(0.5)
+
+    async def _process_subtitle(self, job_id: str, cfg: _JobCfg, input_path: str, job_manager, log, complete):
         """Subtitle-only pipeline: Extract → STT (segments) → Translate → SRT → Burn-in."""
         temp_audio = os.path.join(UPLOAD_DIR, f"{job_id}_temp.wav")
         srt_path = os.path.join(OUTPUT_DIR, f"subtitle_{job_id}.srt")
         output_video = os.path.join(OUTPUT_DIR, f"subtitle_{job_id}.mp4")
         output_url = f"/static/outputs/subtitle_{job_id}.mp4"
 
-        os.makedirs(OUTPUT_DIR, exist_ok=True)
         current_step = "extract"
 
         try:
             # Step 1: Extract audio (20%)
             job_manager.update_step(job_id, "extract", "processing")
             log("영상에서 오디오를 추출하는 중...")
-            success = await asyncio.to_thread(self.ffmpeg.extract_audio, input_path, temp_audio)
+            success = await self.ffmpeg.extract_audio_async(
+                input_path, temp_audio,
+                progress_callback=lambda frac: job_manager.update_progress(job_id, int(20 * frac)),
+                cancel_event=self._cancel_events.get(job_id)
+            )
             if not success:
                 raise PipelineStepError("extract", "비디오에서 오디오 추출에 실패했습니다.")
-            job_manager.update_step(job_id, "extract", "done")
-            job_manager.update_progress(job_id, 20)
+            complete("extract", 20, "Audio extracted")
 
             self._check_cancelled(job_id, job_manager)
 
             # Step 2: Transcribe with segments (40%)
             current_step = "transcribe"
             job_manager.update_step(job_id, "transcribe", "processing")
-            stt_engine = get_engine_value(job.settings, 'stt_engine', 'local')
+            stt_engine = cfg.stt_engine
             log(f"음성 인식 시작 (엔진: {stt_engine})... 오디오 길이에 따라 수 분 소요될 수 있습니다.")
 
-            stt = STTModule(engine=stt_engine)
-            source_lang = job.settings.source_lang if job.settings.source_lang != 'auto' else None
+            stt = await self._get_stt(stt_engine)
+            source_lang = cfg.source_lang if cfg.source_lang != 'auto' else None
 
             from ..config import STT_TIMEOUT
             try:
                 result = await asyncio.wait_for(
-                    asyncio.to_thread(stt.transcribe, temp_audio, language=source_lang, with_segments=True),
+                    stt.atranscribe(
+                        temp_audio, language=source_lang, with_segments=True,
+                        cancel_event=self._cancel_events.get(job_id)
+                    ),
                     timeout=STT_TIMEOUT
                 )
             except asyncio.TimeoutError:
@@ -139,9 +227,7 @@ class Pipeline:
             if not segments:
                 raise PipelineStepError("transcribe", "STT에서 타임스탬프 세그먼트가 반환되지 않았습니다. 자막 모드에는 타임스탬프 데이터가 필요합니다.")
 
-            log(f"Transcribed {len(text)} chars, {len(segments)} segments")
-            job_manager.update_step(job_id, "transcribe", "done")
-            job_manager.update_progress(job_id, 40)
+            complete("transcribe", 40, f"Transcribed {len(text)} chars, {len(segments)} segments")
 
             # Critical Fix: Clear VRAM after STT to free memory before translation
             from .utils.vram import clear_vram
@@ -152,17 +238,21 @@ class Pipeline:
             # Step 3: Translate segments (60%)
             current_step = "translate"
             job_manager.update_step(job_id, "translate", "processing")
-            translation_engine = get_engine_value(job.settings, 'translation_engine', 'gemini')
+            translation_engine = cfg.translation_engine
             
             # Warn if using local translation with many segments (slow)
             # Local translation is recommended only for videos under 5 minutes (~60 segments)
             if translation_engine == "local" and len(segments) > 60:
                 log(f"⚠️ Warning: Local translation with {len(segments)} segments will be slow. Recommended for videos under 5 minutes only.")
             
-            log(f"Translating {len(segments)} segments to {job.settings.target_lang} (engine: {translation_engine})...")
-
-            translator = Translator()
-            from ..config import TRANSLATION_TIMEOUT
+            log(f"Translating {len(segments)} segments to {cfg.target_lang} (engine: {translation_engine})...")
+
+            translator = self._translator
+            from ..config import TRANSLATION_TIMEOUT, TRANSLATION_CACHE_ENABLED, SEGMENT_CACHE_PATH, CACHE_EXPIRATION_DAYS
+            from .translation_cache import SegmentTranslationCache
+            segment_cache = (
+                SegmentTranslationCache(SEGMENT_CACHE_PATH, CACHE_EXPIRATION_DAYS) if TRANSLATION_CACHE_ENABLED else None
+            )
             
             # Progress callback for incremental updates during translation
             def translation_progress(current_chunk, total_chunks):
@@ -174,8 +264,8 @@ class Pipeline:
                 translated_segments, success_rate = await asyncio.wait_for(
                     asyncio.to_thread(
                         translate_segments, segments, translator,
-                        job.settings.source_lang, job.settings.target_lang, translation_engine,
-                        progress_callback=translation_progress
+                        cfg.source_lang, cfg.target_lang, translation_engine,
+                        progress_callback=translation_progress, cache=segment_cache
                     ),
                     timeout=TRANSLATION_TIMEOUT
                 )
@@ -199,8 +289,8 @@ class Pipeline:
                             # #4 Fix: Use job's sync_mode instead of hardcoded "optimize"
                             result = await asyncio.to_thread(
                                 translator.translate,
-                                segments[idx]["text"], job.settings.source_lang,
-                                job.settings.target_lang, job.settings.sync_mode, translation_engine
+                                segments[idx]["text"], cfg.source_lang,
+                                cfg.target_lang, cfg.sync_mode, translation_engine
                             )
                             if result and result.strip():
                                 translated_segments[idx]["text"] = result.strip()
@@ -208,16 +298,15 @@ class Pipeline:
                             log(f"Retry failed for segment {idx}: {e}")
                     retried_ok = sum(1 for i in failed_indices if segments[i]["text"].strip() != translated_segments[i]["text"].strip())
                     log(f"Retry recovered {retried_ok}/{len(failed_indices)} segments")
-            job_manager.update_step(job_id, "translate", "done")
-            job_manager.update_progress(job_id, 60)
+            complete("translate", 60, f"Translated {len(translated_segments)} segments")
 
             self._check_cancelled(job_id, job_manager)
 
             # Step 3.5: Quality Validation (if enabled)
-            if job.settings.verify_translation:
+            if cfg.verify:
                 log("Evaluating translation quality (Gemini API)...")
                 try:
-                    validator = QualityValidator()
+                    validator = await self._get_validator()
                     # Combine all segments for quality evaluation
                     original_text = " ".join(seg["text"] for seg in segments if seg.get("text"))
                     translated_text = " ".join(seg["text"] for seg in translated_segments if seg.get("text"))
@@ -225,7 +314,7 @@ class Pipeline:
                     quality_result = await asyncio.to_thread(
                         validator.evaluate,
                         original_text, translated_text,
-                        job.settings.source_lang, job.settings.target_lang
+                        cfg.source_lang, cfg.target_lang
                     )
                     
                     score = quality_result.get("overall_score", 0)
@@ -245,9 +334,7 @@ class Pipeline:
             job_manager.update_step(job_id, "subtitle", "processing")
             log("Generating SRT subtitle file...")
             await asyncio.to_thread(generate_srt, translated_segments, srt_path)
-            log(f"SRT file created: {srt_path}")
-            job_manager.update_step(job_id, "subtitle", "done")
-            job_manager.update_progress(job_id, 70)
+            complete("subtitle", 70, f"SRT file created: {srt_path}")
 
             self._check_cancelled(job_id, job_manager)
 
@@ -261,7 +348,7 @@ class Pipeline:
             log("Embedding soft subtitles (instant, toggleable in player)...")
             try:
                 success = await asyncio.wait_for(
-                    asyncio.to_thread(embed_soft_subtitles, input_path, srt_path, output_video, job.settings.target_lang),
+                    asyncio.to_thread(embed_soft_subtitles, input_path, srt_path, output_video, cfg.target_lang),
                     timeout=60  # Soft embed should only take seconds
                 )
                 if not success:
@@ -283,14 +370,13 @@ class Pipeline:
             if not os.path.exists(output_video) or os.path.getsize(output_video) == 0:
                 raise PipelineStepError("burn", "출력 비디오가 올바르게 생성되지 않았습니다.")
 
-            job_manager.update_step(job_id, "burn", "done")
-            job_manager.update_progress(job_id, 100)
+            complete("burn", 100, "Subtitles added to video")
 
             job_manager.set_output_file(job_id, output_url)
             job_manager.set_completed(job_id)
             log("Subtitle processing complete!")
 
-        except PipelineCancelledException:
+        except (PipelineCancelledException, InterruptedError):
             log("Job cancelled by user")
             job_manager.update_step(job_id, current_step, "failed")
 
@@ -304,8 +390,7 @@ class Pipeline:
             log(error_msg)
             job_manager.update_step(job_id, current_step, "failed")
             job_manager.update_status(job_id, "failed", error=error_msg)
-            import traceback
-            traceback.print_exc()
+            logger.exception("Pipeline failure for job %s in step %s", job_id, current_step)
 
         finally:
             self._cleanup_temp_files(temp_audio)
@@ -330,7 +415,7 @@ class Pipeline:
         input_path = job_manager.get_input_file(job_id)
 
         # Validate input path is within allowed directory
-        if not self._validate_input_path(input_path):
+        if not await self._validate_input_path(input_path):
             job_manager.update_status(job_id, "failed", error="Invalid input file path")
             print(f"Security: Invalid input path for job {job_id}: {input_path}")
             return
@@ -341,6 +426,7 @@ class Pipeline:
 
         # Use job_id in temp file names to avoid collisions
         temp_audio = os.path.join(UPLOAD_DIR, f"{job_id}_temp.wav")
+        speaker_clip = os.path.join(UPLOAD_DIR, f"{job_id}_speaker.wav")
         output_wav = os.path.join(OUTPUT_DIR, f"dubbed_{job_id}.wav")
         output_video = os.path.join(OUTPUT_DIR, f"dubbed_{job_id}.mp4")
         
@@ -350,16 +436,24 @@ class Pipeline:
         else:
             output_url = f"/static/outputs/dubbed_{job_id}.mp4"
 
-        os.makedirs(OUTPUT_DIR, exist_ok=True)
-
         current_step = "init"
 
         def log(msg):
             print(f"[Job {job_id}] {msg}")
             job_manager.append_log(job_id, msg)
 
-        # Determine mode
-        job_mode = get_engine_value(job.settings, 'mode', 'dubbing')
+        def complete(step_key, progress, msg):
+            # Step status, progress and the step's log line land under one manager lock
+            print(f"[Job {job_id}] {msg}")
+            job_manager.complete_step(job_id, step_key, progress, message=msg)
+
+        # Snapshot settings once; every step reads from this
+        cfg = _JobCfg.from_settings(job.settings)
+        job_mode = cfg.mode
+
+        cancel_event = threading.Event()
+        self._cancel_events[job_id] = cancel_event
+        cancel_watcher = asyncio.create_task(self._watch_cancellation(job_id, job_manager, cancel_event))
 
         try:
             job_manager.update_status(job_id, "processing")
@@ -369,7 +463,7 @@ class Pipeline:
 
             # ===== SUBTITLE MODE =====
             if job_mode == "subtitle":
-                await self._process_subtitle(job_id, job, input_path, job_manager, log)
+                await self._process_subtitle(job_id, cfg, input_path, job_manager, log, complete)
                 return
 
             # ===== DUBBING MODE (original pipeline) =====
@@ -385,30 +479,35 @@ class Pipeline:
                 job_manager.update_step(job_id, "extract", "processing")
                 log("Extracting audio from video...")
                 
-                # Run blocking FFmpeg call in thread
-                success = await asyncio.to_thread(self.ffmpeg.extract_audio, input_path, temp_audio)
+                success = await self.ffmpeg.extract_audio_async(
+                    input_path, temp_audio,
+                    progress_callback=lambda frac: job_manager.update_progress(job_id, 10 + int(10 * frac)),
+                    cancel_event=cancel_event
+                )
                 if not success:
                     raise PipelineStepError("extract", "비디오에서 오디오 추출에 실패했습니다.")
-                
-                job_manager.update_step(job_id, "extract", "done")
-                job_manager.update_progress(job_id, 20)
+
+                complete("extract", 20, "Audio extracted")
 
             self._check_cancelled(job_id, job_manager)
 
             # Step 2: Transcribe
             current_step = "transcribe"
             job_manager.update_step(job_id, "transcribe", "processing")
-            stt_engine = get_engine_value(job.settings, 'stt_engine', 'local')
+            stt_engine = cfg.stt_engine
             log(f"Transcribing audio (engine: {stt_engine})...")
 
-            stt = STTModule(engine=stt_engine)
-            source_lang = job.settings.source_lang if job.settings.source_lang != 'auto' else None
+            stt = await self._get_stt(stt_engine)
+            source_lang = cfg.source_lang if cfg.source_lang != 'auto' else None
             
             # Run blocking STT call in thread with timeout
             from ..config import STT_TIMEOUT
             try:
                 text = await asyncio.wait_for(
-                    asyncio.to_thread(stt.transcribe, temp_audio, language=source_lang),
+                    stt.atranscribe(
+                        temp_audio, language=source_lang,
+                        cancel_event=self._cancel_events.get(job_id)
+                    ),
                     timeout=STT_TIMEOUT
                 )
             except asyncio.TimeoutError:
@@ -420,9 +519,7 @@ class Pipeline:
                 raise PipelineStepError("transcribe", "오디오에서 음성이 감지되지 않았습니다.")
 
             log(f"Transcribed {len(text)} characters")
-            log(f"Preview: {text[:100]}...")
-            job_manager.update_step(job_id, "transcribe", "done")
-            job_manager.update_progress(job_id, 40)
+            complete("transcribe", 40, f"Preview: {text[:100]}...")
 
             # #1 Fix: Clear VRAM after STT to free memory before TTS
             from .utils.vram import clear_vram
@@ -433,11 +530,11 @@ class Pipeline:
             # Step 3: Translate (with cache)
             current_step = "translate"
             job_manager.update_step(job_id, "translate", "processing")
-            sync_mode = getattr(job.settings, 'sync_mode', 'optimize')
-            translation_engine = get_engine_value(job.settings, 'translation_engine', 'local')
-            log(f"Translating to {job.settings.target_lang}... (sync_mode: {sync_mode}, engine: {translation_engine})")
+            sync_mode = cfg.sync_mode
+            translation_engine = cfg.translation_engine
+            log(f"Translating to {cfg.target_lang}... (sync_mode: {sync_mode}, engine: {translation_engine})")
 
-            translator = Translator()
+            translator = self._translator
 
             # Initialize translation cache
             from ..config import TRANSLATION_CACHE_ENABLED, CACHE_DIR, CACHE_EXPIRATION_DAYS
@@ -445,16 +542,17 @@ class Pipeline:
             cache = TranslationCache(CACHE_DIR, CACHE_EXPIRATION_DAYS) if TRANSLATION_CACHE_ENABLED else None
 
             quality_result = None
+            fused_quality = None
             cache_hit = False
 
             # Skip translation if source and target are the same
-            if job.settings.source_lang == job.settings.target_lang:
+            if cfg.source_lang == cfg.target_lang:
                 log("Source and target languages are the same, skipping translation")
                 translated_text = text
             else:
                 # Check cache first
                 CACHE_MIN_QUALITY = 60  # Discard cached translations below this score
-                cached = cache.get(text, job.settings.source_lang, job.settings.target_lang, sync_mode) if cache else None
+                cached = cache.get(text, cfg.source_lang, cfg.target_lang, sync_mode) if cache else None
                 if cached:
                     cached_quality = cached.get("quality_result")
                     cached_score = cached_quality.get("overall_score", 0) if cached_quality else None
@@ -463,7 +561,7 @@ class Pipeline:
                         # Low quality cache — discard and re-translate
                         log(f"Cache hit but quality too low ({cached_score}%) — re-translating")
                         if cache:
-                            cache.invalidate(text, job.settings.source_lang, job.settings.target_lang, sync_mode)
+                            cache.invalidate(text, cfg.source_lang, cfg.target_lang, sync_mode)
                         cached = None
                     else:
                         translated_text = cached["translated_text"]
@@ -473,16 +571,25 @@ class Pipeline:
                         if cached_quality:
                             log(f"Cached Quality Score: {cached_score}%")
 
-                if not cached and not (job.settings.source_lang == job.settings.target_lang):
+                if not cached and not (cfg.source_lang == cfg.target_lang):
                     # Run blocking translation call in thread
                     from ..config import TRANSLATION_TIMEOUT
                     try:
-                        translated_text = await asyncio.wait_for(
-                            asyncio.to_thread(
-                                translator.translate, text, job.settings.source_lang, job.settings.target_lang, sync_mode, translation_engine
-                            ),
-                            timeout=TRANSLATION_TIMEOUT
-                        )
+                        if cfg.verify and translation_engine == "gemini":
+                            # One Gemini round-trip returns both translation and first quality score
+                            translated_text, fused_quality = await asyncio.wait_for(
+                                asyncio.to_thread(
+                                    translator.translate_and_evaluate, text, cfg.source_lang, cfg.target_lang, sync_mode
+                                ),
+                                timeout=TRANSLATION_TIMEOUT
+                            )
+                        else:
+                            translated_text = await asyncio.wait_for(
+                                asyncio.to_thread(
+                                    translator.translate, text, cfg.source_lang, cfg.target_lang, sync_mode, translation_engine
+                                ),
+                                timeout=TRANSLATION_TIMEOUT
+                            )
                     except asyncio.TimeoutError:
                         raise PipelineStepError("translate", f"번역이 {TRANSLATION_TIMEOUT}초 후 시간 초과되었습니다.")
 
@@ -491,9 +598,7 @@ class Pipeline:
                 raise PipelineStepError("translate", "번역 결과가 비어 있습니다.")
 
             log(f"Translated {len(translated_text)} characters")
-            log(f"Preview: {translated_text[:100]}...")
-            job_manager.update_step(job_id, "translate", "done")
-            job_manager.update_progress(job_id, 55)
+            complete("translate", 55, f"Preview: {translated_text[:100]}...")
 
             self._check_cancelled(job_id, job_manager)
 
@@ -512,10 +617,10 @@ class Pipeline:
                     cache_hit = False
                     quality_result = None
 
-            if not cache_hit and job.settings.verify_translation:
+            if not cache_hit and cfg.verify:
                 log("Evaluating translation quality (Gemini API)...")
                 try:
-                    validator = QualityValidator()
+                    validator = await self._get_validator()
                     best_text = translated_text
                     best_score = 0
                     best_quality = None
@@ -524,12 +629,15 @@ class Pipeline:
                     for qi in range(MAX_QUALITY_RETRIES):
                         self._check_cancelled(job_id, job_manager)
 
-                        # Evaluate current translation
-                        quality_result = await asyncio.to_thread(
-                            validator.evaluate,
-                            text, best_text,
-                            job.settings.source_lang, job.settings.target_lang
-                        )
+                        # Evaluate current translation (first round may reuse the fused score)
+                        if qi == 0 and fused_quality is not None:
+                            quality_result = fused_quality
+                        else:
+                            quality_result = await asyncio.to_thread(
+                                validator.evaluate,
+                                text, best_text,
+                                cfg.source_lang, cfg.target_lang
+                            )
 
                         score = quality_result.get("overall_score", 0)
                         recommendation = quality_result.get("recommendation", "REVIEW_NEEDED")
@@ -558,7 +666,7 @@ class Pipeline:
                             refined_text = await asyncio.to_thread(
                                 translator.refine,
                                 text, best_text,
-                                job.settings.source_lang, job.settings.target_lang,
+                                cfg.source_lang, cfg.target_lang,
                                 issues, sync_mode, translation_engine
                             )
                             if refined_text and refined_text.strip() and refined_text != best_text:
@@ -578,7 +686,7 @@ class Pipeline:
                                 log("Refinement returned same/empty — re-translating from scratch")
                                 retranslated = await asyncio.to_thread(
                                     translator.translate, text,
-                                    job.settings.source_lang, job.settings.target_lang,
+                                    cfg.source_lang, cfg.target_lang,
                                     sync_mode, translation_engine
                                 )
                                 if retranslated and retranslated.strip():
@@ -596,8 +704,8 @@ class Pipeline:
                     job_manager.set_quality_result(job_id, quality_result)
 
                     # Only cache if quality is acceptable
-                    if cache and job.settings.source_lang != job.settings.target_lang:
-                        cache.put(text, job.settings.source_lang, job.settings.target_lang,
+                    if cache and cfg.source_lang != cfg.target_lang:
+                        cache.put(text, cfg.source_lang, cfg.target_lang,
                                   sync_mode, translated_text, quality_result)
                         log(f"Translation cached (score: {quality_result.get('overall_score', 0)}%)")
                 except Exception as e:
@@ -605,8 +713,8 @@ class Pipeline:
                 job_manager.update_progress(job_id, 60)
             else:
                 # No quality validation, still cache the translation
-                if cache and job.settings.source_lang != job.settings.target_lang and not cache_hit:
-                    cache.put(text, job.settings.source_lang, job.settings.target_lang,
+                if cache and cfg.source_lang != cfg.target_lang and not cache_hit:
+                    cache.put(text, cfg.source_lang, cfg.target_lang,
                               sync_mode, translated_text)
                     log("Translation cached to disk")
                 job_manager.update_progress(job_id, 60)
@@ -618,8 +726,8 @@ class Pipeline:
             job_manager.update_step(job_id, "tts", "processing")
 
             # Resolve TTS engine
-            tts_engine = get_engine_value(job.settings, 'tts_engine', 'auto')
-            clone_voice = getattr(job.settings, 'clone_voice', True)
+            tts_engine = cfg.tts_engine
+            clone_voice = cfg.clone_voice
 
 
             if tts_engine == "auto":
@@ -629,32 +737,37 @@ class Pipeline:
                 elif clone_voice:
                     tts_engine = "xtts"
                 else:
-                    tts_engine = TTS_AUTO_SELECT.get(job.settings.target_lang, "edge")
+                    tts_engine = TTS_AUTO_SELECT.get(cfg.target_lang, "edge")
 
             log(f"Generating Speech ({tts_engine.upper()}, clone_voice={clone_voice})...")
-            tts = TTSModule(engine=tts_engine)
+            tts = await self._get_tts(tts_engine)
 
-            # Use extracted audio as speaker reference for voice cloning
+            # Use extracted audio as speaker reference for voice cloning.
+            # XTTS only listens to the first 30s, so cut that window once instead of
+            # having every TTS chunk load and resample the whole extracted track.
             speaker_ref = temp_audio
+            if tts_engine == "xtts" and await asyncio.to_thread(
+                self.ffmpeg.trim_audio, temp_audio, speaker_clip, XTTS_SPEAKER_REF_SECONDS
+            ):
+                speaker_ref = speaker_clip
 
             # Edge TTS is natively async; others run in thread
             if tts_engine == "edge":
-                await tts.generate_async(
+                output_size = await tts.generate_async(
                     translated_text, speaker_ref, output_wav,
-                    language=job.settings.target_lang
+                    language=cfg.target_lang, cancel_event=cancel_event
                 )
             else:
-                await asyncio.to_thread(
+                output_size = await asyncio.to_thread(
                     tts.generate, translated_text, speaker_ref, output_wav,
-                    language=job.settings.target_lang
+                    language=cfg.target_lang, cancel_event=cancel_event
                 )
 
-            # Verify TTS output
-            if not os.path.exists(output_wav) or os.path.getsize(output_wav) == 0:
+            # Verify TTS output (engines return the written file size)
+            if not output_size or output_size <= 0:
                 raise PipelineStepError("tts", "TTS 음성 생성에 실패했습니다.")
 
-            job_manager.update_step(job_id, "tts", "done")
-            job_manager.update_progress(job_id, 80)
+            complete("tts", 80, f"TTS audio generated ({output_size} bytes)")
 
             self._check_cancelled(job_id, job_manager)
 
@@ -676,23 +789,20 @@ class Pipeline:
                 job_manager.update_step(job_id, "merge", "processing")
 
                 # Choose merge method based on sync_mode
-                sync_mode = getattr(job.settings, 'sync_mode', 'optimize')
-
                 if sync_mode == "stretch":
                     log("Merging audio and video (stretch mode - extending video if needed)...")
-                    success = await asyncio.to_thread(
-                        self.ffmpeg.extend_video_to_audio, input_path, output_wav, output_video
-                    )
+                    merge = self.ffmpeg.extend_video_to_audio_async
                 elif sync_mode == "speed_audio":
                     log("Merging audio and video (speed_audio mode - adjusting audio speed)...")
-                    success = await asyncio.to_thread(
-                        self.ffmpeg.speed_audio_to_video, input_path, output_wav, output_video
-                    )
+                    merge = self.ffmpeg.speed_audio_to_video_async
                 else:
                     log("Merging audio and video (optimize mode - standard merge)...")
-                    success = await asyncio.to_thread(
-                        self.ffmpeg.merge_video, input_path, output_wav, output_video
-                    )
+                    merge = self.ffmpeg.merge_video_async
+                success = await merge(
+                    input_path, output_wav, output_video,
+                    progress_callback=lambda frac: job_manager.update_progress(job_id, 80 + int(20 * frac)),
+                    cancel_event=cancel_event
+                )
 
                 if not success:
                     raise PipelineStepError("merge", "오디오와 비디오 병합에 실패했습니다.")
@@ -701,15 +811,14 @@ class Pipeline:
                 if not os.path.exists(output_video) or os.path.getsize(output_video) == 0:
                     raise PipelineStepError("merge", "최종 비디오 파일이 올바르게 생성되지 않았습니다.")
 
-                job_manager.update_step(job_id, "merge", "done")
-                job_manager.update_progress(job_id, 100)
+                complete("merge", 100, "Final video created")
 
             # Set output file URL and mark as completed
             job_manager.set_output_file(job_id, output_url)
             job_manager.set_completed(job_id)
             log("Processing Complete!")
 
-        except PipelineCancelledException:
+        except (PipelineCancelledException, InterruptedError):
             log("Job cancelled by user")
             job_manager.update_step(job_id, current_step, "failed")
             # Status already set to cancelled by cancel_job()
@@ -724,11 +833,13 @@ class Pipeline:
             log(error_msg)
             job_manager.update_step(job_id, current_step, "failed")
             job_manager.update_status(job_id, "failed", error=error_msg)
-            import traceback
-            traceback.print_exc()
+            logger.exception("Pipeline failure for job %s in step %s", job_id, current_step)
 
         finally:
+            cancel_watcher.cancel()
+            self._cancel_events.pop(job_id, None)
             # Clean up temporary files
+            self._cleanup_temp_files(speaker_clip)
             if is_audio_input:
                 # #1 Fix: Don't delete output_wav for audio input (it's the final output)
                 pass
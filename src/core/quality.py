@@ -3,54 +3,244 @@ Translation Quality Validation using Gemini API
 
 Evaluates translation quality and provides a score from 1-100%.
 """
+import asyncio
 import os
 import json
+import logging
 import re
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-# Load .env from project root
+from .utils.llm import call_with_retry, call_with_retry_async
+from .utils.rate_limit import gemini_rate_limiter, usage_tokens
+
+# C-accelerated JSON parsing when available (orjson errors subclass json.JSONDecodeError)
 try:
-    from dotenv import load_dotenv
-    # Find project root (parent of src directory)
-    project_root = Path(__file__).parent.parent.parent
-    env_path = project_root / ".env"
-    if env_path.exists():
-        load_dotenv(env_path)
-        print(f"[QualityValidator] Loaded .env from {env_path}")
-    else:
-        print(f"[QualityValidator] .env not found at {env_path}")
+    import orjson as _fast_json
 except ImportError:
-    print("[QualityValidator] python-dotenv not installed")
+    _fast_json = json
 
-# Configuration
+# Configuration (refreshed by _ensure_env once .env has been loaded)
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
-print(f"[QualityValidator] GEMINI_API_KEY from env: {'SET' if GEMINI_API_KEY else 'NOT SET'}")
 GEMINI_MODEL = os.environ.get("GEMINI_MODEL", "gemini-2.0-flash")
 
+logger = logging.getLogger(__name__)
+
+_env_loaded = False
+_genai_module = None
+
+
+def _ensure_env() -> None:
+    """Load .env from the project root on first use instead of at import time."""
+    global _env_loaded, GEMINI_API_KEY, GEMINI_MODEL
+    if _env_loaded:
+        return
+    _env_loaded = True
+    try:
+        from dotenv import load_dotenv
+        env_path = Path(__file__).parent.parent.parent / ".env"
+        if env_path.exists():
+            load_dotenv(env_path)
+            logger.debug("Loaded .env from %s", env_path)
+        else:
+            logger.debug(".env not found at %s", env_path)
+    except ImportError:
+        logger.debug("python-dotenv not installed")
+    GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
+    GEMINI_MODEL = os.environ.get("GEMINI_MODEL", "gemini-2.0-flash")
+
+
+def _import_genai():
+    """Import google.generativeai once per process."""
+    global _genai_module
+    if _genai_module is None:
+        import google.generativeai as genai
+        _genai_module = genai
+    return _genai_module
+
+
 # Import constants from config (with fallback for standalone usage)
 try:
-    from ..config import QUALITY_EVAL_TIMEOUT, QUALITY_MAX_TEXT_LENGTH
+    from ..config import (
+        QUALITY_EVAL_TIMEOUT, QUALITY_MAX_TEXT_LENGTH, QUALITY_MAX_CONCURRENT_CALLS, QUALITY_LAZY_MODEL,
+        QUALITY_CACHE_DIR, QUALITY_CACHE_ENABLED, QUALITY_CACHE_EXPIRATION_DAYS,
+    )
 except ImportError:
     QUALITY_EVAL_TIMEOUT = 120  # 2 minutes default
     QUALITY_MAX_TEXT_LENGTH = 10000  # Max chars for quality eval
+    QUALITY_MAX_CONCURRENT_CALLS = 4  # In-flight Gemini eval calls
+    QUALITY_LAZY_MODEL = False
+    QUALITY_CACHE_DIR = Path(__file__).parent.parent.parent / "static" / "cache" / "quality"
+    QUALITY_CACHE_ENABLED = True
+    QUALITY_CACHE_EXPIRATION_DAYS = 7
+
+# Bump when the evaluation prompt changes so cached scores from older prompts are not reused
+_PROMPT_VERSION = 3
+
+# Prompt language names and target-specific evaluation notes
+_LANG_NAMES = {
+    "en": "English", "ko": "Korean", "ja": "Japanese",
+    "zh": "Chinese", "ru": "Russian", "es": "Spanish",
+    "fr": "French", "de": "German", "it": "Italian",
+    "pt": "Portuguese", "nl": "Dutch", "pl": "Polish",
+    "tr": "Turkish", "vi": "Vietnamese", "th": "Thai",
+    "ar": "Arabic", "hi": "Hindi", "auto": "Auto-detected",
+}
+_LANG_NOTES = {
+    "ko": """
+Additional criteria for Korean:
+- Sentence endings (어미/어투) should sound natural and spoken, not literary.
+- Polite speech level (존댓말) should be consistent unless the source is casual.
+- Dubbing fit: Korean is often shorter than English — check if padding feels forced.""",
+    "ru": """
+Additional criteria for Russian:
+- Grammatical case and gender agreement must be correct.
+- Formal/informal register (ты/Вы) should match the source tone.""",
+    "ja": """
+Additional criteria for Japanese:
+- Politeness level (敬語/丁寧語/普通体) should match the source tone.
+- Sentence-final particles should sound natural for spoken Japanese.""",
+}
+
+# Scoring rubric shared by single and batch prompts (language notes are appended per target)
+_RUBRIC = """SCORING (integers 1-100, be strict and consistent):
+- accuracy (40%): 90+ every sentence fully and correctly translated; 70-89 minor inaccuracies; 50-69 sentences missing or mistranslated; <50 major omissions. Any incomplete or cut-off sentence caps accuracy at 70.
+- naturalness (30%): 90+ native spoken style; 70-89 correct but stiff or literal; 50-69 awkward to a native; <50 machine-like word order.
+- dubbing_fit (20%): 90+ length matches, easy to speak at natural pace; 70-89 slightly off but speakable; 50-69 noticeably too long or short; <50 mismatched.
+- consistency (10%): 90+ same terms and tone throughout; 70-89 minor terminology drift; <70 conflicting terms or tone shifts.
+"""
+_SCORING_FOOTER = """overall_score = accuracy*0.4 + naturalness*0.3 + dubbing_fit*0.2 + consistency*0.1
+
+List ONLY actionable issues that can be fixed (max 5). Be specific: quote the problematic text."""
+
+# Structured output schema for Gemini evaluation rounds
+_BREAKDOWN_KEYS = ("accuracy", "naturalness", "dubbing_fit", "consistency")
+_RECOMMENDATIONS = ("APPROVED", "REVIEW_NEEDED", "REJECT")
+_RESPONSE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "overall_score": {"type": "INTEGER"},
+        "breakdown": {
+            "type": "OBJECT",
+            "properties": {key: {"type": "INTEGER"} for key in _BREAKDOWN_KEYS},
+            "required": list(_BREAKDOWN_KEYS),
+        },
+        "issues": {"type": "ARRAY", "items": {"type": "STRING"}},
+        "recommendation": {"type": "STRING", "enum": list(_RECOMMENDATIONS)},
+    },
+    "required": ["overall_score", "breakdown", "issues", "recommendation"],
+}
+# Both dual-eval rounds come back in one response: {"evaluations": [obj, obj]}
+_DUAL_RESPONSE_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {"evaluations": {"type": "ARRAY", "items": _RESPONSE_SCHEMA}},
+    "required": ["evaluations"],
+}
+_BATCH_RESPONSE_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {"i": {"type": "INTEGER"}, **_RESPONSE_SCHEMA["properties"]},
+        "required": ["i", *_RESPONSE_SCHEMA["required"]],
+    },
+}
+
+# A first evaluation this clear-cut (with sub-scores within _CONFIDENT_SPREAD) skips the second
+_CONFIDENT_HIGH = 92
+_CONFIDENT_LOW = 30
+_CONFIDENT_SPREAD = 10
+
+# Batch evaluation limits: prompt size and items per request (bounded by output tokens)
+_BATCH_MAX_CHARS = 50_000
+_BATCH_MAX_ITEMS = 20
+
+# Deterministic checks that skip the LLM: translation much shorter than the source
+# (CJK targets are naturally shorter, so they get a lower floor) or ending mid-clause
+_TRUNCATION_RATIO = 0.25
+_TRUNCATION_RATIO_CJK = 0.12
+_TRUNCATION_MIN_SOURCE_CHARS = 40
+_CJK_LANGS = ("ko", "ja", "zh")
+_DANGLING_ENDINGS = (",", "，", "、", "\ufffd")
+
+# Response parsing patterns (compiled once; used for every evaluation round)
+_RE_MD = re.compile(r'^```(?:json)?\s*')
+_RE_MD_END = re.compile(r'\s*```$')
+_RE_SCORE = re.compile(r'"overall_score"\s*:\s*(\d+)')
+_RE_BREAKDOWN = re.compile(rf'"(?P<key>{"|".join(_BREAKDOWN_KEYS)})"\s*:\s*(?P<value>\d+)')
+_RE_REC = re.compile(r'"recommendation"\s*:\s*"(\w+)"')
+_RE_ISSUES_ARR = re.compile(r'"issues"\s*:\s*\[(.*)', re.DOTALL)
+_RE_ISSUE = re.compile(r'"([^"]{5,})"')
+# Marker between the front/middle/end samples of a long text
+_OMISSION_SEP = "\n[...중략...]\n"
+# Sentence boundary for sampling long texts: Latin terminators need trailing space
+# (so "3.5" is not split), CJK terminators do not
+_RE_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+|(?<=[。！？])\s*')
+
+# Caps in-flight Gemini evaluation calls across all threads
+_GEMINI_SLOTS = threading.BoundedSemaphore(QUALITY_MAX_CONCURRENT_CALLS)
+# Same cap for evaluate_async callers, one semaphore per event loop: an asyncio.Semaphore
+# binds to the first loop that waits on it (repeated asyncio.run() would otherwise break it)
+_ASYNC_GEMINI_SLOTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _async_gemini_slots() -> asyncio.Semaphore:
+    """Return the evaluation semaphore for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    sem = _ASYNC_GEMINI_SLOTS.get(loop)
+    if sem is None:
+        # A semaphore that waited under contention references its loop, so the weak key
+        # alone would keep closed loops alive
+        for stale in [l for l in _ASYNC_GEMINI_SLOTS if l.is_closed()]:
+            _ASYNC_GEMINI_SLOTS.pop(stale, None)
+        sem = _ASYNC_GEMINI_SLOTS[loop] = asyncio.Semaphore(QUALITY_MAX_CONCURRENT_CALLS)
+    return sem
+
+# Initialized Gemini models keyed by (api_key, model name), shared across validator instances
+_MODEL_CACHE: dict[tuple[str, str], tuple[object, object]] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
 
 
 class QualityValidator:
     """Validates translation quality using Gemini API."""
 
     def __init__(self, api_key: str = None):
+        _ensure_env()
         self.api_key = api_key or GEMINI_API_KEY
         self._model = None
-        print(f"[QualityValidator] Initialized with API key: {'SET (' + self.api_key[:10] + '...)' if self.api_key else 'NOT SET'}")
+        self._prompt_templates: dict[tuple[str, str], tuple[str, str, str]] = {}
+        self._cache = None
+        if QUALITY_CACHE_ENABLED:
+            from .quality_cache import QualityCache
+            self._cache = QualityCache(QUALITY_CACHE_DIR, QUALITY_CACHE_EXPIRATION_DAYS)
+        logger.debug("Initialized with API key: %s", "SET" if self.api_key else "NOT SET")
+        if self.api_key and not QUALITY_LAZY_MODEL:
+            # Import and configure the SDK off the critical path so the first evaluate() finds it ready
+            threading.Thread(target=self._warm_model, name="gemini-warmup", daemon=True).start()
+
+    def _warm_model(self) -> None:
+        """Background warm-up for _get_model; failures are left for evaluate() to surface."""
+        try:
+            self._get_model()
+        except Exception as e:
+            logger.debug("Gemini warm-up failed: %s", e)
 
     def _get_model(self):
-        """Lazy load the Gemini model."""
+        """Lazy load the Gemini model, shared with other validators using the same key and model."""
         if self._model is None:
             try:
-                import google.generativeai as genai
-                genai.configure(api_key=self.api_key)
-                self._model = genai.GenerativeModel(GEMINI_MODEL)
-                self._genai = genai
+                key = (self.api_key, GEMINI_MODEL)
+                with _MODEL_CACHE_LOCK:
+                    cached = _MODEL_CACHE.get(key)
+                    if cached is None:
+                        genai = _import_genai()
+                        genai.configure(api_key=self.api_key)
+                        cached = (genai.GenerativeModel(GEMINI_MODEL), genai)
+                        _MODEL_CACHE[key] = cached
+                # _genai first: other threads treat a non-None _model as ready
+                self._genai = cached[1]
+                self._model = cached[0]
             except ImportError:
                 raise RuntimeError(
                     "google-generativeai package not installed. "
@@ -65,7 +255,8 @@ class QualityValidator:
         original_text: str,
         translated_text: str,
         source_lang: str,
-        target_lang: str
+        target_lang: str,
+        force_llm: bool = False
     ) -> dict:
         """
         Evaluate translation quality.
@@ -75,6 +266,7 @@ class QualityValidator:
             translated_text: Translated text
             source_lang: Source language code (e.g., 'en')
             target_lang: Target language code (e.g., 'ko')
+            force_llm: Always ask Gemini, even when _fast_path can decide
 
         Returns:
             dict with overall_score, breakdown, issues, recommendation
@@ -85,6 +277,71 @@ class QualityValidator:
         if not original_text or not translated_text:
             return self._default_result("Empty text provided")
 
+        if not force_llm:
+            fast = self._fast_path(original_text, translated_text, source_lang, target_lang)
+            if fast is not None:
+                return fast
+
+        # Identical inputs were already scored - skip both Gemini rounds
+        cache_args = (f"{GEMINI_MODEL}:v{_PROMPT_VERSION}", original_text, translated_text, source_lang, target_lang)
+        if self._cache is not None:
+            cached = self._cache.get(*cache_args)
+            if cached is not None:
+                logger.debug("Cache hit - score: %s%%", cached.get("overall_score"))
+                return cached
+
+        result = self._evaluate_uncached(original_text, translated_text, source_lang, target_lang)
+        if self._cache is not None and not result.get("error"):
+            self._cache.put(*cache_args, result)
+        return result
+
+    def _fast_path(self, original_text: str, translated_text: str, source_lang: str, target_lang: str) -> dict | None:
+        """Score cases that need no LLM: untranslated, truncated or dangling translations."""
+        original = original_text.strip()
+        translated = translated_text.strip()
+
+        if original == translated:
+            # Same language, or code / number-only text, is legitimately unchanged
+            if source_lang == target_lang or not any(ch.isalpha() for ch in original):
+                return self._fast_result(100, [])
+            return self._fast_result(10, ["Translation is identical to the source text (not translated)"])
+
+        ratio = _TRUNCATION_RATIO_CJK if target_lang in _CJK_LANGS and source_lang not in _CJK_LANGS else _TRUNCATION_RATIO
+        if len(original) >= _TRUNCATION_MIN_SOURCE_CHARS and len(translated) / len(original) < ratio:
+            return self._fast_result(10, ["Translation truncated (much shorter than the source)"])
+
+        if translated.endswith(_DANGLING_ENDINGS):
+            return self._fast_result(30, ["Translation truncated (ends mid-sentence)"])
+
+        return None
+
+    def _fast_result(self, score: int, issues: list[str]) -> dict:
+        """Build a result for a deterministic _fast_path verdict."""
+        logger.debug("Fast path - score: %d%%", score)
+        return {
+            "overall_score": score,
+            "breakdown": {
+                "accuracy": score,
+                "naturalness": score,
+                "dubbing_fit": score,
+                "consistency": score
+            },
+            "issues": issues,
+            "recommendation": "APPROVED" if score >= 85 else "REJECT",
+        }
+
+    def _evaluate_uncached(
+        self,
+        original_text: str,
+        translated_text: str,
+        source_lang: str,
+        target_lang: str
+    ) -> dict:
+        """Run the dual evaluation (with Groq fallback) without consulting the cache.
+
+        Both evaluations are requested in a single Gemini call, so the prompt is
+        prefilled once and only one round-trip is paid.
+        """
         # #8 Fix: Sample long texts (front/middle/end) instead of simple truncation
         original_text = self._sample_long_text(original_text, QUALITY_MAX_TEXT_LENGTH)
         translated_text = self._sample_long_text(translated_text, QUALITY_MAX_TEXT_LENGTH)
@@ -95,56 +352,382 @@ class QualityValidator:
 
         try:
             model = self._get_model()
+            # Constrained decoding: Gemini returns bare JSON matching the schema
             gen_config = self._genai.types.GenerationConfig(
                 temperature=0.1,
-                max_output_tokens=2048,
+                max_output_tokens=4096,
+                response_mime_type="application/json",
+                response_schema=_DUAL_RESPONSE_SCHEMA,
             )
 
-            # Dual evaluation for reliability — run twice and average
-            results = []
-            gemini_quota_error = False
-            for i in range(2):
-                try:
-                    response = model.generate_content(
-                        prompt,
-                        generation_config=gen_config,
-                        request_options={"timeout": QUALITY_EVAL_TIMEOUT}
-                    )
-                    parsed = self._parse_response(response.text)
-                    if parsed.get("error"):
-                        continue
-                    results.append(parsed)
-                except Exception as e:
-                    error_str = str(e).lower()
-                    # #2 Fix: Detect Gemini quota errors
-                    if "429" in error_str or "resource exhausted" in error_str or "quota" in error_str:
-                        gemini_quota_error = True
-                        print(f"[QualityValidator] Gemini quota exceeded")
-                        break
-                    try:
-                        print(f"[QualityValidator] Round {i+1} error: {e}")
-                    except UnicodeEncodeError:
-                        print(f"[QualityValidator] Round {i+1} error (encoding issue)")
-                    continue
+            def generate():
+                usage = gemini_rate_limiter.acquire(est_tokens=len(prompt) // 4)
+                response = model.generate_content(
+                    prompt,
+                    generation_config=gen_config,
+                    request_options={"timeout": QUALITY_EVAL_TIMEOUT},
+                    stream=True
+                )
+                text = self._read_json_stream(response, stop_after_first=self._is_confident)
+                gemini_rate_limiter.record(usage, usage_tokens(response))
+                return text
 
-            # #2 Fix: Fallback to Groq if Gemini quota exceeded
-            if gemini_quota_error or not results:
-                result = self._fallback_groq_evaluate(prompt)
-                if result and not result.get("error"):
-                    return result
-                if not results:
-                    return self._default_result("All evaluation rounds failed")
+            # Dual evaluation for reliability — two independent evaluations, then averaged
+            try:
+                # Shared slots keep concurrent evaluate() callers from multiplying requests
+                with _GEMINI_SLOTS:
+                    text = call_with_retry(generate)
+                outcomes = self._parse_response(text)
+            except Exception as e:
+                outcomes = [e]
 
-            if len(results) == 1:
-                return results[0]
+            results, gemini_quota_error = self._collect_rounds(outcomes)
+            return self._finish_rounds(results, gemini_quota_error, prompt)
 
-            # Average the two evaluations
-            return self._merge_evaluations(results)
+        except Exception as e:
+            logger.warning("Quality evaluation failed: %s", e)
+            return self._default_result(f"API error: {str(e)}")
+
+    async def evaluate_async(
+        self,
+        original_text: str,
+        translated_text: str,
+        source_lang: str,
+        target_lang: str,
+        force_llm: bool = False
+    ) -> dict:
+        """
+        Async variant of evaluate() for callers already running on an event loop.
+
+        The dual-evaluation request is awaited via generate_content_async, so
+        concurrent evaluations share the loop instead of holding worker threads.
+        Returns the same dict as evaluate() and shares its cache.
+        """
+        if not self.api_key:
+            return self._default_result("Gemini API key not configured")
+
+        if not original_text or not translated_text:
+            return self._default_result("Empty text provided")
+
+        if not force_llm:
+            fast = self._fast_path(original_text, translated_text, source_lang, target_lang)
+            if fast is not None:
+                return fast
+
+        cache_args = (f"{GEMINI_MODEL}:v{_PROMPT_VERSION}", original_text, translated_text, source_lang, target_lang)
+        if self._cache is not None:
+            cached = self._cache.get(*cache_args)
+            if cached is not None:
+                logger.debug("Cache hit - score: %s%%", cached.get("overall_score"))
+                return cached
+
+        result = await self._evaluate_uncached_async(original_text, translated_text, source_lang, target_lang)
+        if self._cache is not None and not result.get("error"):
+            self._cache.put(*cache_args, result)
+        return result
+
+    async def _evaluate_uncached_async(
+        self,
+        original_text: str,
+        translated_text: str,
+        source_lang: str,
+        target_lang: str
+    ) -> dict:
+        """Async counterpart of _evaluate_uncached."""
+        original_text = self._sample_long_text(original_text, QUALITY_MAX_TEXT_LENGTH)
+        translated_text = self._sample_long_text(translated_text, QUALITY_MAX_TEXT_LENGTH)
+
+        prompt = self._build_prompt(
+            original_text, translated_text, source_lang, target_lang
+        )
+
+        try:
+            model = self._get_model()
+            gen_config = self._genai.types.GenerationConfig(
+                temperature=0.1,
+                max_output_tokens=4096,
+                response_mime_type="application/json",
+                response_schema=_DUAL_RESPONSE_SCHEMA,
+            )
+
+            async def generate():
+                # acquire() may sleep while the minute window is full - keep that off the loop
+                usage = await asyncio.to_thread(gemini_rate_limiter.acquire, len(prompt) // 4)
+                response = await model.generate_content_async(
+                    prompt,
+                    generation_config=gen_config,
+                    request_options={"timeout": QUALITY_EVAL_TIMEOUT}
+                )
+                gemini_rate_limiter.record(usage, usage_tokens(response))
+                return response.text
+
+            try:
+                async with _async_gemini_slots():
+                    text = await call_with_retry_async(generate)
+                outcomes = self._parse_response(text)
+            except Exception as e:
+                outcomes = [e]
+
+            results, gemini_quota_error = self._collect_rounds(outcomes)
+            if gemini_quota_error or not results:
+                # Groq fallback uses blocking requests
+                return await asyncio.to_thread(self._finish_rounds, results, gemini_quota_error, prompt)
+            return self._finish_rounds(results, gemini_quota_error, prompt)
 
         except Exception as e:
-            print(f"Quality evaluation failed: {e}")
+            logger.warning("Quality evaluation failed: %s", e)
             return self._default_result(f"API error: {str(e)}")
 
+    async def evaluate_many_async(
+        self,
+        pairs: list[tuple[str, str]],
+        source_lang: str,
+        target_lang: str,
+        concurrency: int = 5
+    ) -> list[dict]:
+        """
+        Run evaluate_async for many (original, translated) pairs concurrently.
+
+        At most `concurrency` evaluations are in flight; retries on 429/5xx happen
+        per request inside evaluate_async. Returns one result dict per pair, in order.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(original: str, translated: str) -> dict:
+            async with sem:
+                return await self.evaluate_async(original, translated, source_lang, target_lang)
+
+        outcomes = await asyncio.gather(*(one(o, t) for o, t in pairs), return_exceptions=True)
+        return [
+            self._default_result(f"API error: {r}") if isinstance(r, BaseException) else r
+            for r in outcomes
+        ]
+
+    def _collect_rounds(self, outcomes: list) -> tuple[list, bool]:
+        """Split evaluation outcomes (parsed dicts or exceptions) into usable results and a quota flag."""
+        results = []
+        gemini_quota_error = False
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                error_str = str(outcome).lower()
+                # #2 Fix: Detect Gemini quota errors
+                if "429" in error_str or "resource exhausted" in error_str or "quota" in error_str:
+                    if not gemini_quota_error:
+                        logger.warning("Gemini quota exceeded")
+                    gemini_quota_error = True
+                    continue
+                logger.warning("Round %d error: %s", i + 1, outcome)
+                continue
+            if outcome.get("error"):
+                continue
+            results.append(outcome)
+        return results, gemini_quota_error
+
+    def _finish_rounds(self, results: list, gemini_quota_error: bool, prompt: str) -> dict:
+        """Merge successful rounds, falling back to Groq when Gemini is out of quota or every round failed."""
+        # #2 Fix: Fallback to Groq if Gemini quota exceeded
+        if gemini_quota_error or not results:
+            result = self._fallback_groq_evaluate(prompt)
+            if result and not result.get("error"):
+                return result
+            if not results:
+                return self._default_result("All evaluation rounds failed")
+
+        if len(results) == 1:
+            return results[0]
+
+        # Average the two evaluations
+        return self._merge_evaluations(results)
+
+    def evaluate_batch(
+        self,
+        pairs: list[tuple[str, str]],
+        source_lang: str,
+        target_lang: str
+    ) -> list[dict]:
+        """
+        Evaluate many (original, translated) pairs with one Gemini call per batch.
+
+        Pairs are packed into batches of at most _BATCH_MAX_ITEMS items and
+        _BATCH_MAX_CHARS characters, and batches are sent concurrently. Each pair
+        is scored in a single round (no dual-eval averaging or Groq fallback),
+        which is what makes per-segment scoring affordable. Pairs that _fast_path
+        can decide never reach the LLM.
+
+        Returns:
+            One result dict per input pair, in input order
+        """
+        results: list[dict | None] = [None] * len(pairs)
+        if not self.api_key:
+            return [self._default_result("Gemini API key not configured") for _ in pairs]
+
+        # Single-round batch scores get their own namespace so evaluate() never
+        # returns one as a dual-eval result
+        cache_model = f"{GEMINI_MODEL}:v{_PROMPT_VERSION}:batch"
+        pending = []
+        for i, (original, translated) in enumerate(pairs):
+            if not original or not translated:
+                results[i] = self._default_result("Empty text provided")
+                continue
+            fast = self._fast_path(original, translated, source_lang, target_lang)
+            if fast is not None:
+                results[i] = fast
+                continue
+            cached = self._cache.get(cache_model, original, translated, source_lang, target_lang) if self._cache else None
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append(i)
+
+        batches, current, current_chars = [], [], 0
+        for i in pending:
+            size = len(pairs[i][0]) + len(pairs[i][1])
+            if current and (len(current) >= _BATCH_MAX_ITEMS or current_chars + size > _BATCH_MAX_CHARS):
+                batches.append(current)
+                current, current_chars = [], 0
+            current.append(i)
+            current_chars += size
+        if current:
+            batches.append(current)
+
+        if batches:
+            logger.debug("Batch eval: %d pairs in %d request(s), %d from cache/skipped",
+                         len(pending), len(batches), len(pairs) - len(pending))
+            with ThreadPoolExecutor(max_workers=min(len(batches), QUALITY_MAX_CONCURRENT_CALLS)) as pool:
+                futures = {
+                    pool.submit(self._evaluate_batch_request, batch, pairs, source_lang, target_lang): batch
+                    for batch in batches
+                }
+                for future in as_completed(futures):
+                    batch = futures[future]
+                    try:
+                        scored = future.result()
+                    except Exception as e:
+                        logger.warning("Batch request failed: %s", e)
+                        scored = {}
+                    for i in batch:
+                        result = scored.get(i)
+                        if result is None or result.get("error"):
+                            results[i] = result or self._default_result("Missing from batch response")
+                            continue
+                        results[i] = result
+                        if self._cache is not None:
+                            self._cache.put(cache_model, pairs[i][0], pairs[i][1], source_lang, target_lang, result)
+
+        return results
+
+    def _evaluate_batch_request(
+        self,
+        batch: list[int],
+        pairs: list[tuple[str, str]],
+        source_lang: str,
+        target_lang: str
+    ) -> dict[int, dict]:
+        """Score one batch of pairs in a single Gemini call. Returns results keyed by pair index."""
+        prompt = self._build_batch_prompt(
+            [{"i": i, "orig": pairs[i][0], "trans": pairs[i][1]} for i in batch],
+            source_lang, target_lang
+        )
+        model = self._get_model()
+        gen_config = self._genai.types.GenerationConfig(
+            temperature=0.1,
+            max_output_tokens=8192,
+            response_mime_type="application/json",
+            response_schema=_BATCH_RESPONSE_SCHEMA,
+        )
+        def generate():
+            usage = gemini_rate_limiter.acquire(est_tokens=len(prompt) // 4)
+            response = model.generate_content(
+                prompt,
+                generation_config=gen_config,
+                request_options={"timeout": QUALITY_EVAL_TIMEOUT}
+            )
+            gemini_rate_limiter.record(usage, usage_tokens(response))
+            return response
+
+        with _GEMINI_SLOTS:
+            response = call_with_retry(generate)
+
+        text = _RE_MD_END.sub('', _RE_MD.sub('', response.text.strip()))
+        items = _fast_json.loads(text)
+        if not isinstance(items, list):
+            raise ValueError("Batch response is not a JSON array")
+
+        wanted = set(batch)
+        scored = {}
+        for item in items:
+            if not isinstance(item, dict) or item.get("i") not in wanted:
+                continue
+            index = item.pop("i")
+            scored[index] = self._normalize_result(item)
+        return scored
+
+    def _read_json_stream(self, response, stop_after_first=None) -> str:
+        """Collect a streamed response, stopping once the top-level JSON object closes.
+
+        The model often keeps generating after the object we need; max_output_tokens
+        stays as the ceiling for responses that never close.
+
+        With stop_after_first, the first evaluation nested in {"evaluations": [...]}
+        is passed to it as soon as it closes; if it returns True the stream is
+        abandoned and the JSON is closed after that single evaluation.
+        """
+        parts = []
+        depth = 0
+        seen_object = False
+        in_string = False
+        escaped = False
+        for chunk in response:
+            try:
+                piece = chunk.text
+            except ValueError:
+                # Chunk without text parts (e.g. only a finish reason)
+                continue
+            for i, ch in enumerate(piece):
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif ch == "\\":
+                        escaped = True
+                    elif ch == '"':
+                        in_string = False
+                elif ch == '"':
+                    in_string = True
+                elif ch == "{":
+                    depth += 1
+                    seen_object = True
+                elif ch == "}":
+                    depth -= 1
+                    if seen_object and depth == 0:
+                        parts.append(piece[:i + 1])
+                        return "".join(parts)
+                    if depth == 1 and stop_after_first is not None:
+                        # First nested evaluation just closed - stop here if it is conclusive
+                        check, stop_after_first = stop_after_first, None
+                        head = "".join(parts) + piece[:i + 1] + "]}"
+                        try:
+                            first = _fast_json.loads(head)["evaluations"][0]
+                        except (ValueError, KeyError, IndexError, TypeError):
+                            continue
+                        if isinstance(first, dict) and check(first):
+                            return head
+            parts.append(piece)
+        return "".join(parts)
+
+    def _is_confident(self, evaluation: dict) -> bool:
+        """True when an evaluation is extreme and internally consistent enough that a second adds nothing."""
+        try:
+            score = int(evaluation["overall_score"])
+            subscores = [int(evaluation["breakdown"][key]) for key in _BREAKDOWN_KEYS]
+        except (KeyError, TypeError, ValueError):
+            return False
+        if _CONFIDENT_LOW < score < _CONFIDENT_HIGH:
+            return False
+        if max(subscores) - min(subscores) > _CONFIDENT_SPREAD:
+            return False
+        logger.debug("Skipping second evaluation - first is conclusive (score %d)", score)
+        return True
+
     def _merge_evaluations(self, results: list) -> dict:
         """Merge multiple evaluation results by averaging scores."""
         n = len(results)
@@ -161,9 +744,10 @@ class QualityValidator:
         seen = set()
         for r in results:
             for issue in r.get("issues", []):
-                normalized = issue.strip().lower()[:80]
-                if normalized not in seen:
-                    seen.add(normalized)
+                # Slice before case-folding so long issues are only lowered up to the prefix
+                key = hash(issue.strip()[:80].lower())
+                if key not in seen:
+                    seen.add(key)
                     all_issues.append(issue)
 
         # Recommendation based on averaged score
@@ -174,7 +758,8 @@ class QualityValidator:
         else:
             recommendation = "REJECT"
 
-        print(f"[QualityValidator] Dual eval scores: {[r['overall_score'] for r in results]} -> avg {avg_score}%")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Dual eval scores: %s -> avg %d%%", [r["overall_score"] for r in results], avg_score)
 
         return {
             "overall_score": avg_score,
@@ -188,26 +773,41 @@ class QualityValidator:
         if len(text) <= max_len:
             return text
         
-        # Split into 3 equal sections: front, middle, end
+        # Split into 3 sections: front, middle, end - each cut on sentence boundaries
+        # so the model never sees half sentences (which it would flag as issues)
         section_len = max_len // 3
-        front = text[:section_len]
-        middle_start = (len(text) - section_len) // 2
-        middle = text[middle_start:middle_start + section_len]
-        end = text[-section_len:]
-        
-        return f"{front}\n[...중략...]\n{middle}\n[...중략...]\n{end}"
+        middle_start = self._sentence_start(text, (len(text) - section_len) // 2, section_len)
+        return "".join((
+            text[:self._sentence_end(text, 0, section_len)],
+            _OMISSION_SEP,
+            text[middle_start:self._sentence_end(text, middle_start, middle_start + section_len)],
+            _OMISSION_SEP,
+            text[self._sentence_start(text, len(text) - section_len, section_len):],
+        ))
+
+    def _sentence_end(self, text: str, start: int, limit: int) -> int:
+        """Last sentence boundary in text[start:limit], or limit if cutting there would drop over half the section."""
+        cut = limit
+        for m in _RE_SENTENCE_BOUNDARY.finditer(text, start, limit):
+            cut = m.start()
+        return cut if cut - start >= (limit - start) // 2 else limit
+
+    def _sentence_start(self, text: str, pos: int, section_len: int) -> int:
+        """First sentence start at or after pos within half a section, or pos if there is none."""
+        m = _RE_SENTENCE_BOUNDARY.search(text, pos, pos + section_len // 2)
+        return m.end() if m else pos
 
     def _fallback_groq_evaluate(self, prompt: str) -> dict:
         """#2 Fix: Fallback to Groq API when Gemini quota is exceeded."""
         from ..config import GROQ_API_KEY
         if not GROQ_API_KEY:
-            print("[QualityValidator] No GROQ_API_KEY for fallback")
+            logger.warning("No GROQ_API_KEY for fallback")
             return None
         
-        import requests
-        print("[QualityValidator] Falling back to Groq for quality evaluation...")
+        from .utils.llm import groq_session
+        logger.info("Falling back to Groq for quality evaluation")
         try:
-            response = requests.post(
+            response = groq_session().post(
                 "https://api.groq.com/openai/v1/chat/completions",
                 headers={
                     "Authorization": f"Bearer {GROQ_API_KEY}",
@@ -221,13 +821,16 @@ class QualityValidator:
                 timeout=60
             )
             if response.status_code != 200:
-                print(f"[QualityValidator] Groq fallback failed: {response.status_code}")
+                logger.warning("Groq fallback failed: %s", response.status_code)
                 return None
             
             content = response.json()["choices"][0]["message"]["content"]
-            return self._parse_response(content)
+            results = [r for r in self._parse_response(content) if not r.get("error")]
+            if not results:
+                return None
+            return results[0] if len(results) == 1 else self._merge_evaluations(results)
         except Exception as e:
-            print(f"[QualityValidator] Groq fallback error: {e}")
+            logger.warning("Groq fallback error: %s", e)
             return None
 
     def _build_prompt(
@@ -237,113 +840,114 @@ class QualityValidator:
         source_lang: str,
         target_lang: str
     ) -> str:
-        """Build the evaluation prompt."""
-        lang_names = {
-            "en": "English", "ko": "Korean", "ja": "Japanese",
-            "zh": "Chinese", "ru": "Russian", "es": "Spanish",
-            "fr": "French", "de": "German", "it": "Italian",
-            "pt": "Portuguese", "nl": "Dutch", "pl": "Polish",
-            "tr": "Turkish", "vi": "Vietnamese", "th": "Thai",
-            "ar": "Arabic", "hi": "Hindi", "auto": "Auto-detected",
-        }
-        src_name = lang_names.get(source_lang, source_lang)
-        tgt_name = lang_names.get(target_lang, target_lang)
+        """Build the evaluation prompt from the cached per-language-pair template."""
+        key = (source_lang, target_lang)
+        template = self._prompt_templates.get(key)
+        if template is None:
+            template = self._prompt_templates.setdefault(key, self._compile_template(source_lang, target_lang))
+        head, middle, tail = template
+        return head + original + middle + translated + tail
 
-        # Language-specific evaluation notes
-        lang_notes = ""
-        if target_lang == "ko":
-            lang_notes = """
-Additional criteria for Korean:
-- Sentence endings (어미/어투) should sound natural and spoken, not literary.
-- Polite speech level (존댓말) should be consistent unless the source is casual.
-- Dubbing fit: Korean is often shorter than English — check if padding feels forced."""
-        elif target_lang == "ru":
-            lang_notes = """
-Additional criteria for Russian:
-- Grammatical case and gender agreement must be correct.
-- Formal/informal register (ты/Вы) should match the source tone."""
-        elif target_lang == "ja":
-            lang_notes = """
-Additional criteria for Japanese:
-- Politeness level (敬語/丁寧語/普通体) should match the source tone.
-- Sentence-final particles should sound natural for spoken Japanese."""
+    def _build_batch_prompt(self, items: list[dict], source_lang: str, target_lang: str) -> str:
+        """Build a prompt that scores every item independently and answers with a JSON array."""
+        src_name = _LANG_NAMES.get(source_lang, source_lang)
+        tgt_name = _LANG_NAMES.get(target_lang, target_lang)
+        lang_notes = _LANG_NOTES.get(target_lang, "")
+        pairs_json = json.dumps(items, ensure_ascii=False)
 
         return f"""You are a strict translation quality evaluator for video dubbing.
 
-Evaluate the following {src_name} → {tgt_name} translation.
+Evaluate each {src_name} → {tgt_name} translation pair below independently.
+Each pair has "i" (pair index), "orig" (original {src_name}) and "trans" (translation in {tgt_name}).
 
-Original ({src_name}):
-{original}
+{pairs_json}
 
-Translation ({tgt_name}):
-{translated}
+{_RUBRIC}{lang_notes}
 
-SCORING RUBRIC (be strict and consistent):
+{_SCORING_FOOTER}
 
-1. Accuracy (40% weight):
-   - 90-100: Every sentence fully translated, no omissions, no mistranslations
-   - 70-89: Minor inaccuracies but all sentences present
-   - 50-69: Some sentences missing or significantly mistranslated
-   - Below 50: Major omissions or incomplete sentences (e.g. sentence cut off mid-word)
-   CRITICAL: If ANY sentence is incomplete or cut off, accuracy MUST be 70 or below.
+Respond with a JSON array holding one object per pair: "i" plus "overall_score",
+"breakdown" (accuracy, naturalness, dubbing_fit, consistency), "issues" and
+"recommendation" ("APPROVED", "REVIEW_NEEDED" or "REJECT")."""
 
-2. Naturalness (30% weight):
-   - 90-100: Sounds like a native speaker wrote it, natural spoken style
-   - 70-89: Grammatically correct but slightly stiff or literal
-   - 50-69: Awkward phrasing that a native would notice immediately
-   - Below 50: Machine-translation quality, unnatural word order
+    def _compile_template(self, source_lang: str, target_lang: str) -> tuple[str, str, str]:
+        """Render the fixed rubric for a language pair, split around the two text slots."""
+        src_name = _LANG_NAMES.get(source_lang, source_lang)
+        tgt_name = _LANG_NAMES.get(target_lang, target_lang)
 
-3. Dubbing Fit (20% weight):
-   - 90-100: Length matches original, easy to speak aloud at natural pace
-   - 70-89: Slightly longer/shorter but still speakable
-   - 50-69: Noticeably too long or too short for the video timing
-   - Below 50: Completely mismatched length
+        # Language-specific evaluation notes
+        lang_notes = _LANG_NOTES.get(target_lang, "")
 
-4. Consistency (10% weight):
-   - 90-100: Same terms and tone throughout, no contradictions
-   - 70-89: Minor inconsistencies in terminology
-   - Below 70: Different terms used for the same concept, tone shifts
-{lang_notes}
+        head = f"""You are a strict translation quality evaluator for video dubbing.
 
-overall_score = accuracy*0.4 + naturalness*0.3 + dubbing_fit*0.2 + consistency*0.1
+Evaluate the following {src_name} → {tgt_name} translation.
 
-List ONLY actionable issues that can be fixed (max 5). Be specific: quote the problematic text.
+Original ({src_name}):
+"""
+        middle = f"""
+
+Translation ({tgt_name}):
+"""
+        tail = f"""
+
+{_RUBRIC}{lang_notes}
+
+{_SCORING_FOOTER}
+
+Produce TWO independent evaluations of this translation. Score the second one
+from scratch as a separate reviewer would; do not copy the first.
 
 Respond ONLY in this JSON format (no markdown, no code blocks):
 {{
-  "overall_score": <1-100>,
-  "breakdown": {{
-    "accuracy": <1-100>,
-    "naturalness": <1-100>,
-    "dubbing_fit": <1-100>,
-    "consistency": <1-100>
-  }},
-  "issues": ["issue1", "issue2"],
-  "recommendation": "APPROVED" or "REVIEW_NEEDED" or "REJECT"
+  "evaluations": [
+    {{
+      "overall_score": <1-100>,
+      "breakdown": {{
+        "accuracy": <1-100>,
+        "naturalness": <1-100>,
+        "dubbing_fit": <1-100>,
+        "consistency": <1-100>
+      }},
+      "issues": ["issue1", "issue2"],
+      "recommendation": "APPROVED" or "REVIEW_NEEDED" or "REJECT"
+    }},
+    {{ ...second evaluation, same fields... }}
+  ]
 }}"""
+        return head, middle, tail
+
+    def _parse_response(self, response_text: str) -> list[dict]:
+        """Parse a JSON evaluation response into a list of evaluations.
 
-    def _parse_response(self, response_text: str) -> dict:
-        """Parse JSON response from Gemini, with truncation recovery."""
+        Accepts {"evaluations": [...]} as well as a single evaluation object.
+        Gemini returns schema-constrained JSON; fence stripping and truncation
+        recovery remain for the Groq fallback and responses cut off at the token cap.
+        """
         # Remove markdown code blocks if present
         text = response_text.strip()
-        text = re.sub(r'^```json\s*', '', text)
-        text = re.sub(r'^```\s*', '', text)
-        text = re.sub(r'\s*```$', '', text)
+        text = _RE_MD.sub('', text)
+        text = _RE_MD_END.sub('', text)
 
         result = None
         try:
-            result = json.loads(text)
+            result = _fast_json.loads(text)
         except json.JSONDecodeError:
             # Gemini often truncates the issues array — try to recover
             result = self._recover_truncated_json(text)
 
         if not result:
-            print(f"Failed to parse Gemini response (even after recovery)")
-            print(f"Response was: {text[:500]}")
-            return self._default_result("Failed to parse API response")
+            logger.warning("Failed to parse Gemini response (even after recovery): %.500s", text)
+            return [self._default_result("Failed to parse API response")]
+
+        if isinstance(result, dict) and isinstance(result.get("evaluations"), list):
+            evaluations = [self._normalize_result(e) for e in result["evaluations"]]
+            return evaluations or [self._default_result("Empty evaluations list")]
+        return [self._normalize_result(result)]
 
+    def _normalize_result(self, result) -> dict:
+        """Validate a parsed evaluation and fill in missing fields."""
         # Validate response structure
-        if "overall_score" not in result:
+        if not isinstance(result, dict) or "overall_score" not in result:
             return self._default_result("Invalid response format")
 
         # Ensure score is within range
@@ -362,8 +966,8 @@ Respond ONLY in this JSON format (no markdown, no code blocks):
         if "issues" not in result or not isinstance(result["issues"], list):
             result["issues"] = []
 
-        # Ensure recommendation exists
-        if "recommendation" not in result:
+        # Ensure recommendation is one of the known values
+        if result.get("recommendation") not in _RECOMMENDATIONS:
             score = result["overall_score"]
             if score >= 85:
                 result["recommendation"] = "APPROVED"
@@ -377,26 +981,24 @@ Respond ONLY in this JSON format (no markdown, no code blocks):
     def _recover_truncated_json(self, text: str) -> dict | None:
         """Try to recover a truncated JSON response by closing open brackets."""
         # Strategy 1: Cut at last complete field before issues, add empty issues
-        score_match = re.search(r'"overall_score"\s*:\s*(\d+)', text)
+        score_match = _RE_SCORE.search(text)
         if not score_match:
             return None
 
-        # Try to extract breakdown
+        # Try to extract breakdown in one scan (first occurrence wins, as with the first evaluation's score)
         breakdown = {}
-        for key in ["accuracy", "naturalness", "dubbing_fit", "consistency"]:
-            m = re.search(rf'"{key}"\s*:\s*(\d+)', text)
-            if m:
-                breakdown[key] = int(m.group(1))
+        for m in _RE_BREAKDOWN.finditer(text):
+            breakdown.setdefault(m.group("key"), int(m.group("value")))
 
         # Try to extract recommendation
-        rec_match = re.search(r'"recommendation"\s*:\s*"(\w+)"', text)
+        rec_match = _RE_REC.search(text)
 
         # Try to extract any complete issue strings
-        issues = re.findall(r'"issues"\s*:\s*\[(.*)', text, re.DOTALL)
+        issues = _RE_ISSUES_ARR.findall(text)
         issue_list = []
         if issues:
             # Find complete quoted strings in the issues array
-            issue_list = re.findall(r'"([^"]{5,})"', issues[0])
+            issue_list = _RE_ISSUE.findall(issues[0])
 
         score = int(score_match.group(1))
         result = {
@@ -410,7 +1012,7 @@ Respond ONLY in this JSON format (no markdown, no code blocks):
                 "APPROVED" if score >= 85 else "REVIEW_NEEDED" if score >= 60 else "REJECT"
             ),
         }
-        print(f"[QualityValidator] Recovered truncated JSON - score: {score}%")
+        logger.debug("Recovered truncated JSON - score: %d%%", score)
         return result
 
     def _default_result(self, error_message: str) -> dict:
@@ -429,5 +1031,14 @@ Respond ONLY in this JSON format (no markdown, no code blocks):
         }
 
 
-# Global instance for convenience
-quality_validator = QualityValidator()
+_quality_validator = None
+
+
+def __getattr__(name):
+    # Global instance for convenience, created on first access rather than at import
+    global _quality_validator
+    if name == "quality_validator":
+        if _quality_validator is None:
+            _quality_validator = QualityValidator()
+        return _quality_validator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
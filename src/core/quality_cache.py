@@ -0,0 +1,92 @@
+"""
+Quality Cache — stores translation quality evaluations on disk.
+
+Cache key = blake2b of (model, source_lang, target_lang, original_text, translated_text).
+Each entry is a JSON file under static/cache/quality/, fronted by a small
+in-memory LRU so repeated checks within one process skip disk as well.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+
+class QualityCache:
+    def __init__(self, cache_dir: Path, expiration_days: int = 7, memory_size: int = 256):
+        self.cache_dir = cache_dir
+        self.expiration_seconds = expiration_days * 86400
+        self.memory_size = memory_size
+        self._memory: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _make_key(self, model: str, original: str, translated: str,
+                  source_lang: str, target_lang: str) -> str:
+        raw = f"{model}\0{source_lang}\0{target_lang}\0{original}\0{translated}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _remember(self, key: str, entry: dict) -> None:
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def get(self, model: str, original: str, translated: str,
+            source_lang: str, target_lang: str) -> dict | None:
+        """Return a cached quality result or None if miss/expired."""
+        key = self._make_key(model, original, translated, source_lang, target_lang)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+        if entry is None:
+            path = self._path(key)
+            if not path.exists():
+                return None
+            try:
+                entry = json.loads(path.read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, OSError):
+                path.unlink(missing_ok=True)
+                return None
+            self._remember(key, entry)
+
+        if time.time() - entry.get("timestamp", 0) > self.expiration_seconds:
+            with self._lock:
+                self._memory.pop(key, None)
+            self._path(key).unlink(missing_ok=True)
+            return None
+        return entry.get("quality_result")
+
+    def put(self, model: str, original: str, translated: str,
+            source_lang: str, target_lang: str, quality_result: dict) -> None:
+        """Store a quality result."""
+        key = self._make_key(model, original, translated, source_lang, target_lang)
+        entry = {
+            "timestamp": time.time(),
+            "model": model,
+            "source_lang": source_lang,
+            "target_lang": target_lang,
+            "quality_result": quality_result,
+        }
+        self._remember(key, entry)
+        tmp_path = None
+        try:
+            # Write a temp file and swap it in so readers never see a partial entry
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.cache_dir, prefix=f"{key}.", suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = f.name
+                json.dump(entry, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            print(f"[QualityCache] Failed to write: {e}")
+            if tmp_path:
+                Path(tmp_path).unlink(missing_ok=True)
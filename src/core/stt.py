@@ -1,13 +1,36 @@
+import asyncio
+import functools
+import json
 import os
-import torch
-from faster_whisper import WhisperModel
+import re
+import stat
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .utils.llm import is_auth_error, is_quota_error
 from .utils.vram import clear_vram
 
+# C-accelerated JSON parsing when available (orjson errors subclass json.JSONDecodeError)
+try:
+    import orjson as _fast_json
+except ImportError:
+    _fast_json = json
+
 # Configuration from environment variables
 DEFAULT_WHISPER_MODEL = os.environ.get("VIDEOVOICE_WHISPER_MODEL", "large-v3")
 DEFAULT_WHISPER_BATCH = int(os.environ.get("VIDEOVOICE_WHISPER_BATCH", "4"))
-DEFAULT_WHISPER_COMPUTE = os.environ.get("VIDEOVOICE_WHISPER_COMPUTE", "float16")
+# Greedy decoding by default (temperature fallback still retries bad segments); 5 restores beam search
+DEFAULT_WHISPER_BEAM = int(os.environ.get("VIDEOVOICE_WHISPER_BEAM", "1"))
+# Empty = auto: int8_float16 on GPUs with INT8 tensor cores (compute capability >= 7.5), else float16
+DEFAULT_WHISPER_COMPUTE = os.environ.get("VIDEOVOICE_WHISPER_COMPUTE", "")
 DEFAULT_DEVICE = os.environ.get("VIDEOVOICE_DEVICE", "")
+# CTranslate2 CPU threads (its own default is 4); int8 decoding stops scaling past ~8 cores
+DEFAULT_WHISPER_CPU_THREADS = int(os.environ.get("VIDEOVOICE_WHISPER_CPU_THREADS", str(min(8, os.cpu_count() or 1))))
+# Keep the Whisper model resident between transcriptions (needs VRAM headroom for TTS alongside it)
+WHISPER_KEEP_LOADED = os.environ.get("VIDEOVOICE_WHISPER_KEEP_LOADED", "0") == "1"
+# Load the local Whisper model alongside remote STT so a quota fallback to "local" skips the load wait
+STT_PREWARM_LOCAL = os.environ.get("VIDEOVOICE_STT_PREWARM_LOCAL", "0") == "1"
 
 # Supported languages (subset of what Whisper supports)
 SUPPORTED_LANGUAGES = {
@@ -15,13 +38,49 @@ SUPPORTED_LANGUAGES = {
     "nl", "pl", "tr", "vi", "th", "ar", "hi", "he", "id", "ms"
 }
 
-# Minimum VRAM (in GB) to run on GPU
+# Minimum VRAM (in GB) to run on GPU (int8 weights for large-v3 fit in ~2 GB)
 MIN_VRAM_GB = 4.0
+MIN_VRAM_GB_INT8 = 2.5
+
+# Audio still over Groq's upload limit after compression is sent as parallel fixed-length chunks
+GROQ_CHUNK_SECONDS = 600
+GROQ_CHUNK_WORKERS = 4
+
+# Groq uploads are re-encoded as mono 16 kHz Opus at a constant 24 kbps (3000 B/s);
+# for speech this matches 64 kbps MP3 at well under half the size
+GROQ_UPLOAD_BYTES_PER_SEC = 3000
+_GROQ_UPLOAD_CODEC_ARGS = [
+    "-acodec", "libopus", "-b:a", "24k", "-vbr", "off",
+    "-ac", "1", "-ar", "16000",
+    "-f", "ogg", "pipe:1",
+]
+
+# Loaded WhisperModels keyed by (model_name, device, compute_type, device_index)
+_MODEL_CACHE: dict[tuple, object] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+# Gemini segment-JSON cleanup patterns
+_RE_JSON_OBJECT = re.compile(r'(\{.*\})', re.DOTALL)
+_RE_FENCE_START = re.compile(r'^```(?:json)?\s*')
+_RE_FENCE_END = re.compile(r'\s*```$')
+
+# Groq/OpenAI SDK clients keyed by (provider, api_key); each keeps its own keep-alive connection pool
+_API_CLIENTS: dict[tuple[str, str], object] = {}
+_API_CLIENTS_LOCK = threading.Lock()
 
 
 def _get_free_vram_gb() -> float:
-    """Return free VRAM in GB. Returns 0 if CUDA is unavailable."""
+    """Return free VRAM in GB. Returns 0 if CUDA is unavailable.
+
+    Cached in 2-second buckets so back-to-back STTModule constructions share one CUDA probe.
+    """
+    return _free_vram_gb_cached(int(time.monotonic() * 0.5))
+
+
+@functools.lru_cache(maxsize=1)
+def _free_vram_gb_cached(time_bucket: int) -> float:
     try:
+        import torch
         if not torch.cuda.is_available():
             return 0.0
         free, _ = torch.cuda.mem_get_info()
@@ -30,8 +89,71 @@ def _get_free_vram_gb() -> float:
         return 0.0
 
 
+def _auto_cuda_compute_type() -> str:
+    """Pick int8_float16 on GPUs with INT8 tensor cores (Turing and newer), float16 otherwise."""
+    try:
+        import torch
+        if torch.cuda.get_device_capability() >= (7, 5):
+            return "int8_float16"
+    except Exception:
+        pass
+    return "float16"
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_audio_cached(path: str, mtime_ns: int, size: int) -> tuple[float, int, int] | None:
+    # mtime/size are part of the cache key so a rewritten file is probed again
+    result = subprocess.run(
+        ["ffprobe", "-v", "quiet", "-print_format", "json", "-show_streams", "-show_format", path],
+        capture_output=True, timeout=30
+    )
+    if result.returncode != 0:
+        raise ValueError(f"Unreadable audio file: {path}")
+    data = json.loads(result.stdout.decode("utf-8"))
+    audio = next((st for st in data.get("streams", []) if st.get("codec_type") == "audio"), None)
+    if audio is None:
+        return None
+    duration = float(audio.get("duration") or data.get("format", {}).get("duration") or 0)
+    return duration, int(audio.get("sample_rate") or 0), int(audio.get("channels") or 0)
+
+
+def _probe_audio(path: str, st: os.stat_result = None) -> tuple[float, int, int] | None:
+    """
+    Return (duration_s, sample_rate, channels) of the first audio stream via ffprobe.
+
+    Returns None when the file has no audio stream; raises ValueError when ffprobe
+    cannot read it. Probing is skipped (returns a zero duration) if ffprobe is unavailable.
+    Pass an existing stat result as st to skip the stat() call.
+    """
+    if st is None:
+        st = os.stat(path)
+    try:
+        return _probe_audio_cached(path, st.st_mtime_ns, st.st_size)
+    except (FileNotFoundError, subprocess.TimeoutExpired, json.JSONDecodeError):
+        return 0.0, 0, 0
+
+
+def _api_client(provider: str, api_key: str):
+    """Return a shared Groq or OpenAI client so repeated calls reuse its connections."""
+    key = (provider, api_key)
+    with _API_CLIENTS_LOCK:
+        client = _API_CLIENTS.get(key)
+        if client is None:
+            if provider == "groq":
+                from groq import Groq
+                client = Groq(api_key=api_key)
+            else:
+                from openai import OpenAI
+                client = OpenAI(api_key=api_key)
+            _API_CLIENTS[key] = client
+    return client
+
+
 def _normalize_segment(seg) -> dict:
-    """Normalize a segment to {"start": float, "end": float, "text": str} regardless of source format."""
+    """Normalize an API segment (Groq/OpenAI/Gemini) to {"start": float, "end": float, "text": str}.
+
+    Local faster-whisper segments are typed already and are built directly in _transcribe_local.
+    """
     if isinstance(seg, dict):
         return {
             "start": float(seg.get("start", 0)),
@@ -53,6 +175,18 @@ def _normalize_segments(raw_segments) -> list[dict]:
     return [s for s in (_normalize_segment(seg) for seg in raw_segments) if s["text"]]
 
 
+def _normalize_segments_with_text(raw_segments) -> tuple[list[dict], str]:
+    """Normalize segments and join their text in the same pass, for engines without a separate text field."""
+    segments = []
+    parts = []
+    for seg in raw_segments or ():
+        normalized = _normalize_segment(seg)
+        if normalized["text"]:
+            segments.append(normalized)
+            parts.append(normalized["text"])
+    return segments, " ".join(parts)
+
+
 class STTModule:
     def __init__(self, device: str = None, compute_type: str = None, model_name: str = None, engine: str = "local"):
         # Auto-detect device if not specified
@@ -60,6 +194,7 @@ class STTModule:
             if DEFAULT_DEVICE:
                 self.device = DEFAULT_DEVICE
             else:
+                import torch
                 self.device = "cuda" if torch.cuda.is_available() else "cpu"
         else:
             self.device = device
@@ -67,44 +202,43 @@ class STTModule:
         # Set compute type based on device
         if compute_type is None:
             if self.device == "cuda":
-                self.compute_type = DEFAULT_WHISPER_COMPUTE
+                self.compute_type = DEFAULT_WHISPER_COMPUTE or _auto_cuda_compute_type()
             else:
                 self.compute_type = "int8"  # CPU requires int8
         else:
             self.compute_type = compute_type
 
         self.model_name = model_name or DEFAULT_WHISPER_MODEL
-        
-        # Faster-Whisper does not use batch_size in init, but in transcribe
-        # We'll keep the env var logic for consistency if needed later
-        self.device_index = 0 if self.device == "cuda" else 0
 
-        # VRAM pre-check: fall back to CPU if needed
-        if self.device == "cuda":
-            free_vram = _get_free_vram_gb()
-            print(f"STT: Free VRAM = {free_vram:.1f} GB")
-            if free_vram < MIN_VRAM_GB:
-                print(f"STT: VRAM below {MIN_VRAM_GB} GB — falling back to CPU (int8)")
-                self.device = "cpu"
-                self.compute_type = "int8"
+        # Batch size for BatchedInferencePipeline (GPU only; 1 disables batching)
+        self.batch_size = DEFAULT_WHISPER_BATCH
+        self.device_index = 0 if self.device == "cuda" else 0
 
         self.engine = engine  # "local", "groq", "openai"
 
         if self.engine == "local" and self.device == "cpu":
             print("WARNING: Running Faster-Whisper on CPU. This will be significantly slower.")
 
-    def _validate_audio_path(self, audio_path: str) -> None:
-        """Validate that audio file exists and is accessible."""
+    def _validate_audio_path(self, audio_path: str) -> os.stat_result:
+        """Validate that audio file exists and is accessible; returns its stat result."""
         if not audio_path:
             raise ValueError("Audio path cannot be empty")
-        if not os.path.isfile(audio_path):
+        # One stat() gives both existence and size
+        try:
+            st = os.stat(audio_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        except OSError as e:
+            raise ValueError(f"Audio file is not accessible: {audio_path} ({e})") from e
+        if not stat.S_ISREG(st.st_mode):
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
         # Check file size (max 1GB for audio)
-        file_size = os.path.getsize(audio_path)
+        file_size = st.st_size
         if file_size > 1024 * 1024 * 1024:
             raise ValueError(f"Audio file too large: {file_size} bytes (max 1GB)")
         if file_size == 0:
             raise ValueError("Audio file is empty")
+        return st
 
     def _validate_language(self, language: str) -> str:
         """Validate and normalize language code."""
@@ -117,15 +251,23 @@ class STTModule:
             print(f"WARNING: Language '{lang}' may not be fully supported. Proceeding anyway.")
         return lang if lang else None
 
-    def transcribe(self, audio_path: str, language: str = None, with_segments: bool = False):
+    def transcribe(self, audio_path: str, language: str = None, with_segments: bool = False,
+                   cancel_event=None):
         """Transcribe audio - dispatches to the configured engine.
 
         If with_segments=True, returns dict: {"text": str, "segments": [{"start", "end", "text"}]}
         Otherwise returns str (backward compatible).
         
         Automatic fallback: If Gemini fails with 429/quota, tries Groq → OpenAI → Local.
+
+        cancel_event: optional threading.Event; local decoding stops with
+        InterruptedError as soon as it is set.
         """
-        self._validate_audio_path(audio_path)
+        st = self._validate_audio_path(audio_path)
+        # Reject corrupt or audio-less input before any model load or upload
+        probe = _probe_audio(audio_path, st)
+        if probe is None:
+            raise ValueError(f"No audio stream found in: {audio_path}")
         validated_lang = self._validate_language(language)
 
         # Define fallback order based on current engine
@@ -143,22 +285,21 @@ class STTModule:
         for engine in fallback_chain:
             try:
                 if engine == "groq":
-                    result = self._transcribe_groq(audio_path, validated_lang, with_segments=with_segments)
+                    result = self._transcribe_groq(audio_path, validated_lang, with_segments=with_segments,
+                                                   file_size=st.st_size, duration=probe[0])
                 elif engine == "openai":
                     result = self._transcribe_openai(audio_path, validated_lang, with_segments=with_segments)
                 elif engine == "gemini":
                     result = self._transcribe_gemini(audio_path, validated_lang, with_segments=with_segments)
                 else:
-                    result = self._transcribe_local(audio_path, validated_lang, with_segments=with_segments)
+                    result = self._transcribe_local(audio_path, validated_lang, with_segments=with_segments,
+                                                    cancel_event=cancel_event)
                 return result
             except Exception as e:
-                error_str = str(e).lower()
-                # Check for quota/rate limit errors that should trigger fallback
-                is_quota_error = any(kw in error_str for kw in ["429", "quota", "resource exhausted", "rate limit"])
-                is_api_key_missing = "api_key" in error_str or "not set" in error_str
-                
-                if is_quota_error or is_api_key_missing:
-                    print(f"STT ({engine}): {'Quota exceeded' if is_quota_error else 'API key missing'}, trying next engine...")
+                # Quota/rate-limit and missing/rejected API key errors trigger fallback
+                quota_exceeded = is_quota_error(e)
+                if quota_exceeded or is_auth_error(e):
+                    print(f"STT ({engine}): {'Quota exceeded' if quota_exceeded else 'API key missing'}, trying next engine...")
                     last_error = e
                     continue
                 else:
@@ -168,52 +309,191 @@ class STTModule:
         # All fallbacks failed
         raise RuntimeError(f"모든 STT 엔진이 실패했습니다. 마지막 오류: {last_error}")
 
-    def _transcribe_local(self, audio_path: str, language: str = None, with_segments: bool = False):
-        """Local Faster-Whisper transcription."""
-        model = None
+    async def atranscribe(self, audio_path: str, language: str = None, with_segments: bool = False,
+                          cancel_event=None, prewarm_local: bool = None):
+        """Async wrapper around transcribe() for event-loop callers.
+
+        With prewarm_local (default: STT_PREWARM_LOCAL) and a remote engine, the local
+        Whisper model loads on a worker thread while the remote upload runs, so falling
+        back to "local" doesn't start with a model load. The warmed model is released
+        afterwards unless WHISPER_KEEP_LOADED is set.
+        """
+        if prewarm_local is None:
+            prewarm_local = STT_PREWARM_LOCAL
+        warm = None
+        if prewarm_local and self.engine != "local":
+            warm = asyncio.ensure_future(asyncio.to_thread(self._prewarm_local))
         try:
-            print(f"STT: Loading Faster-Whisper model '{self.model_name}' on {self.device} ({self.compute_type})...")
+            return await asyncio.to_thread(
+                self.transcribe, audio_path, language=language, with_segments=with_segments,
+                cancel_event=cancel_event
+            )
+        finally:
+            if warm is not None and not WHISPER_KEEP_LOADED:
+                # A model load can't be interrupted; release it once it finishes
+                warm.add_done_callback(
+                    lambda _: asyncio.get_running_loop().run_in_executor(None, self.release)
+                )
+
+    def _prewarm_local(self) -> None:
+        try:
+            model, device = self._load_model()
+            if device == "cuda":
+                # One tiny decode runs cuDNN/cuBLAS kernel selection now rather than on the first real window
+                import numpy as np
+                segments, _ = model.transcribe(np.zeros(16000, dtype=np.float32), beam_size=1, language="en")
+                for _ in segments:  # segments decode lazily
+                    pass
+        except Exception as e:
+            print(f"STT: Local model prewarm failed ({e})")
+
+    def _model_key(self, device: str, compute_type: str) -> tuple:
+        return (self.model_name, device, compute_type, self.device_index)
+
+    def _resolve_device(self) -> tuple[str, str]:
+        """Pick (device, compute_type) for the next model load.
+
+        Checked on every load rather than once in __init__: the module is reused across
+        jobs, and a short VRAM shortage (e.g. XTTS still loaded) should only move that
+        one load to CPU.
+        """
+        if self.device != "cuda":
+            return self.device, self.compute_type
+        # VRAM pre-check: fall back to CPU if needed
+        free_vram = _get_free_vram_gb()
+        min_vram = MIN_VRAM_GB_INT8 if self.compute_type.startswith("int8") else MIN_VRAM_GB
+        print(f"STT: Free VRAM = {free_vram:.1f} GB")
+        if free_vram < min_vram:
+            print(f"STT: VRAM below {min_vram} GB — falling back to CPU (int8) for this run")
+            return "cpu", "int8"
+        return self.device, self.compute_type
+
+    def _load_model(self):
+        """Return (model, device) for this module's settings, loading the model on first use.
+
+        self.device/self.compute_type are the preferred settings and are never changed here;
+        a CPU fallback applies only to the returned model.
+        """
+        from faster_whisper import WhisperModel
+
+        # Held across the load so concurrent first calls don't load the model twice
+        with _MODEL_CACHE_LOCK:
+            # A resident model on the preferred device is itself what holds the VRAM
+            model = _MODEL_CACHE.get(self._model_key(self.device, self.compute_type))
+            if model is not None:
+                return model, self.device
+
+            device, compute_type = self._resolve_device()
+            model = _MODEL_CACHE.get(self._model_key(device, compute_type))
+            if model is not None:
+                return model, device
+
+            print(f"STT: Loading Faster-Whisper model '{self.model_name}' on {device} ({compute_type})...")
             try:
                 model = WhisperModel(
                     self.model_name,
-                    device=self.device,
-                    compute_type=self.compute_type,
-                    device_index=self.device_index
+                    device=device,
+                    compute_type=compute_type,
+                    device_index=self.device_index,
+                    cpu_threads=DEFAULT_WHISPER_CPU_THREADS
                 )
             except Exception as e:
-                if self.device == "cuda":
+                if device == "cuda":
                     print(f"STT: GPU model loading failed ({e}), retrying on CPU with int8...")
                     clear_vram("Faster-Whisper-fallback")
-                    self.device = "cpu"
-                    self.compute_type = "int8"
+                    device, compute_type = "cpu", "int8"
+                    model = _MODEL_CACHE.get(self._model_key(device, compute_type))
+                    if model is not None:
+                        return model, device
                     model = WhisperModel(
                         self.model_name,
-                        device=self.device,
-                        compute_type=self.compute_type
+                        device=device,
+                        compute_type=compute_type,
+                        cpu_threads=DEFAULT_WHISPER_CPU_THREADS
                     )
                 else:
                     raise
             print("STT: Model loaded successfully")
+            _MODEL_CACHE[self._model_key(device, compute_type)] = model
+            return model, device
+
+    def release(self) -> None:
+        """Drop the cached Whisper models for this module's model name and free their memory."""
+        with _MODEL_CACHE_LOCK:
+            keys = [k for k in _MODEL_CACHE if k[0] == self.model_name and k[3] == self.device_index]
+            models = [(k[1], _MODEL_CACHE.pop(k)) for k in keys]
+        if models:
+            on_cuda = any(device == "cuda" for device, _ in models)
+            del models
+            # A CPU model is freed by the del; only CUDA needs the allocator flush
+            if on_cuda:
+                clear_vram("Faster-Whisper")
+
+    def _transcribe_local(self, audio_path: str, language: str = None, with_segments: bool = False,
+                          cancel_event=None):
+        """Local Faster-Whisper transcription."""
+        # Imported here so API-only engines never load faster_whisper / CTranslate2
+        from faster_whisper import BatchedInferencePipeline
+        from faster_whisper.audio import decode_audio
+
+        model = None
+        try:
+            # Decode the audio on a worker thread while the model loads (PyAV releases the GIL)
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                audio_future = pool.submit(decode_audio, audio_path, sampling_rate=16000)
+                model, device = self._load_model()
+                audio = audio_future.result()
 
             print(f"STT: Transcribing {audio_path}...")
 
-            segments, info = model.transcribe(
-                audio_path,
+            decode_options = dict(
                 language=language,
-                beam_size=5
+                beam_size=DEFAULT_WHISPER_BEAM,
+                best_of=1,
+                temperature=[0.0, 0.2, 0.4],
+                # Not feeding previous text back avoids repetition/hallucination loops
+                condition_on_previous_text=False,
+                word_timestamps=False,
+                # Silero VAD skips silent stretches before the encoder (timestamps stay absolute)
+                vad_filter=True,
+                vad_parameters=dict(min_silence_duration_ms=500, speech_pad_ms=200),
             )
+            if device == "cuda" and self.batch_size > 1:
+                # Decode VAD-split speech chunks in parallel batches on the GPU
+                print(f"STT: Batched inference (batch_size={self.batch_size})")
+                segments, info = BatchedInferencePipeline(model=model).transcribe(
+                    audio, batch_size=self.batch_size, **decode_options
+                )
+            else:
+                # Sequential decoding; batching does not pay off on CPU
+                segments, info = model.transcribe(audio, **decode_options)
 
             print(f"STT: Detected language '{info.language}' with probability {info.language_probability:.2f}")
 
-            segment_list = list(segments)
+            # Segments are decoded lazily; check for cancellation between them.
+            # Only the text (and normalized timing when asked) is kept, not the Segment objects.
+            parts = []
+            normalized = []
+            any_seen = False
+            for seg in segments:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise InterruptedError("Transcription cancelled")
+                any_seen = True
+                text = seg.text.strip()
+                if not text:
+                    continue
+                parts.append(text)
+                if with_segments:
+                    # faster-whisper Segment fields are already floats; no generic normalization needed
+                    normalized.append({"start": seg.start, "end": seg.end, "text": text})
 
-            if not segment_list:
+            if not any_seen:
                 print("WARNING: No speech detected in audio")
                 if with_segments:
                     return {"text": "", "segments": []}
                 return ""
 
-            transcribed_text = " ".join([seg.text.strip() for seg in segment_list])
+            transcribed_text = " ".join(parts)
 
             if not transcribed_text.strip():
                 print("WARNING: Transcription resulted in empty text")
@@ -221,88 +501,139 @@ class STTModule:
             print("STT: Transcription complete")
 
             if with_segments:
-                return {"text": transcribed_text, "segments": _normalize_segments(segment_list)}
+                return {"text": transcribed_text, "segments": normalized}
             return transcribed_text
 
-        except FileNotFoundError:
-            raise
-        except ValueError:
+        except (FileNotFoundError, ValueError, InterruptedError):
             raise
         except Exception as e:
             print(f"STT Failed: {e}")
             raise RuntimeError(f"음성 인식 실패: {str(e)}") from e
         finally:
-            if model is not None:
-                del model
-            clear_vram("Faster-Whisper")
+            model = None
+            # Free VRAM for TTS unless the model is configured to stay resident
+            if not WHISPER_KEEP_LOADED:
+                self.release()
+
+    def _transcribe_groq(self, audio_path: str, language: str = None, with_segments: bool = False,
+                         file_size: int = None, duration: float = None):
+        """Groq Whisper API transcription with automatic compression for large files.
 
-    def _transcribe_groq(self, audio_path: str, language: str = None, with_segments: bool = False):
-        """Groq Whisper API transcription with automatic compression for large files."""
+        file_size/duration: already-known size and probed duration (looked up when omitted).
+        """
         from ..config import GROQ_API_KEY
         if not GROQ_API_KEY:
             raise RuntimeError("GROQ_API_KEY가 설정되지 않았습니다. Groq STT 엔진에 필요합니다.")
 
-        file_size = os.path.getsize(audio_path)
+        if file_size is None:
+            file_size = os.path.getsize(audio_path)
         max_groq_size = 25 * 1024 * 1024  # 25MB
-        
-        current_audio = audio_path
-        temp_compressed = None
+
+        # (filename, bytes) of an in-memory compressed upload; None uploads the original file
+        compressed = None
+        # Set when even the compressed audio is too large and must be chunked
+        chunked_duration = None
+
+        # Known-long audio would exceed the limit even after compression - chunk without a full compression pass
+        if duration is None:
+            duration = _probe_audio(audio_path)[0] if file_size > max_groq_size else 0.0
+        if file_size > max_groq_size and duration * GROQ_UPLOAD_BYTES_PER_SEC > max_groq_size:
+            chunked_duration = duration
+            print(f"STT (Groq): Audio ({duration / 60:.0f} min) too long for one upload — "
+                  f"splitting into {GROQ_CHUNK_SECONDS}s chunks")
 
         # Automatic compression if file exceeds Groq's 25MB limit
-        if file_size > max_groq_size:
+        elif file_size > max_groq_size:
             print(f"STT (Groq): Audio ({file_size // 1048576}MB) exceeds 25MB limit. Compressing...")
-            import subprocess
-            temp_compressed = audio_path + ".compressed.mp3"
             try:
-                # Convert to mono, 64kbps MP3 (perfect for STT, very small)
-                subprocess.run([
-                    "ffmpeg", "-i", audio_path,
-                    "-acodec", "libmp3lame",
-                    "-ab", "64k", "-ac", "1", "-ar", "16000",
-                    temp_compressed, "-y"
-                ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
-                
-                new_size = os.path.getsize(temp_compressed)
+                # Convert to mono 24 kbps Opus (plenty for STT, very small), streamed to stdout
+                result = subprocess.run(
+                    ["ffmpeg", "-i", audio_path, *_GROQ_UPLOAD_CODEC_ARGS],
+                    check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+                )
+
+                new_size = len(result.stdout)
                 if new_size > max_groq_size:
-                    raise RuntimeError(f"압축 불충분: {new_size // 1048576}MB (여전히 25MB 초과)")
-                
-                current_audio = temp_compressed
-                print(f"STT (Groq): Successfully compressed to {new_size // 1048576}MB")
+                    # Constant bitrate: the byte count gives the duration when ffprobe couldn't
+                    chunked_duration = duration or new_size / GROQ_UPLOAD_BYTES_PER_SEC
+                    print(f"STT (Groq): Compressed audio still {new_size // 1048576}MB — "
+                          f"splitting into {GROQ_CHUNK_SECONDS}s chunks")
+                else:
+                    compressed = (os.path.splitext(os.path.basename(audio_path))[0] + ".ogg", result.stdout)
+                    print(f"STT (Groq): Successfully compressed to {new_size // 1048576}MB")
             except Exception as e:
-                if temp_compressed and os.path.exists(temp_compressed):
-                    os.remove(temp_compressed)
                 print(f"STT (Groq): Compression failed ({e}), attempting with original (may fail)")
 
-        try:
-            from groq import Groq
-            client = Groq(api_key=GROQ_API_KEY)
-
-            print(f"STT (Groq): Transcribing {current_audio}...")
-            with open(current_audio, "rb") as audio_file:
-                kwargs = {
-                    "file": (os.path.basename(current_audio), audio_file),
-                    "model": "whisper-large-v3",
-                }
-                if language:
-                    kwargs["language"] = language
-                if with_segments:
-                    kwargs["response_format"] = "verbose_json"
+        client = _api_client("groq", GROQ_API_KEY)
+
+        print(f"STT (Groq): Transcribing {audio_path}...")
+        kwargs = {"model": "whisper-large-v3"}
+        if language:
+            kwargs["language"] = language
+        if with_segments:
+            kwargs["response_format"] = "verbose_json"
+
+        if chunked_duration is not None:
+            return self._transcribe_groq_chunked(client, audio_path, chunked_duration, kwargs, with_segments)
+
+        if compressed is not None:
+            transcription = client.audio.transcriptions.create(file=compressed, **kwargs)
+        else:
+            with open(audio_path, "rb") as audio_file:
+                transcription = client.audio.transcriptions.create(
+                    file=(os.path.basename(audio_path), audio_file), **kwargs
+                )
+
+        text = transcription.text.strip() if hasattr(transcription, 'text') else ""
+        if with_segments:
+            raw_segs = transcription.segments if hasattr(transcription, 'segments') and transcription.segments else []
+            segments = _normalize_segments(raw_segs)
+            print(f"STT (Groq): Transcription complete ({len(text)} chars, {len(segments)} segments)")
+            return {"text": text, "segments": segments}
 
-                transcription = client.audio.transcriptions.create(**kwargs)
+        print(f"STT (Groq): Transcription complete ({len(text)} chars)")
+        return text
 
-            text = transcription.text.strip() if hasattr(transcription, 'text') else ""
+    def _transcribe_groq_chunked(self, client, audio_path: str, duration: float, kwargs: dict,
+                                 with_segments: bool):
+        """Transcribe long audio as GROQ_CHUNK_SECONDS-long compressed chunks uploaded in parallel."""
+        import math
+
+        def transcribe_chunk(index: int):
+            offset = index * GROQ_CHUNK_SECONDS
+            result = subprocess.run(
+                ["ffmpeg", "-ss", str(offset), "-t", str(GROQ_CHUNK_SECONDS), "-i", audio_path,
+                 *_GROQ_UPLOAD_CODEC_ARGS],
+                check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+            return client.audio.transcriptions.create(file=(f"chunk_{index:03d}.ogg", result.stdout), **kwargs)
+
+        chunk_count = math.ceil(duration / GROQ_CHUNK_SECONDS)
+        with ThreadPoolExecutor(max_workers=min(GROQ_CHUNK_WORKERS, chunk_count)) as pool:
+            transcriptions = list(pool.map(transcribe_chunk, range(chunk_count)))
+
+        texts = []
+        segments = []
+        for index, transcription in enumerate(transcriptions):
+            chunk_text = transcription.text.strip() if hasattr(transcription, 'text') else ""
+            if chunk_text:
+                texts.append(chunk_text)
             if with_segments:
+                # Chunk timestamps start at 0 - shift them onto the full timeline
+                offset = index * GROQ_CHUNK_SECONDS
                 raw_segs = transcription.segments if hasattr(transcription, 'segments') and transcription.segments else []
-                segments = _normalize_segments(raw_segs)
-                print(f"STT (Groq): Transcription complete ({len(text)} chars, {len(segments)} segments)")
-                return {"text": text, "segments": segments}
+                for seg in _normalize_segments(raw_segs):
+                    seg["start"] += offset
+                    seg["end"] += offset
+                    segments.append(seg)
 
-            print(f"STT (Groq): Transcription complete ({len(text)} chars)")
-            return text
-        finally:
-            if temp_compressed and os.path.exists(temp_compressed):
-                try: os.remove(temp_compressed)
-                except Exception as e: print(f"Warning: Could not remove temp file: {e}")
+        text = " ".join(texts)
+        if with_segments:
+            print(f"STT (Groq): Transcription complete ({len(text)} chars, {len(segments)} segments, {chunk_count} chunks)")
+            return {"text": text, "segments": segments}
+
+        print(f"STT (Groq): Transcription complete ({len(text)} chars, {chunk_count} chunks)")
+        return text
 
     def _transcribe_openai(self, audio_path: str, language: str = None, with_segments: bool = False):
         """OpenAI Whisper API transcription."""
@@ -310,8 +641,7 @@ class STTModule:
         if not OPENAI_API_KEY:
             raise RuntimeError("OPENAI_API_KEY가 설정되지 않았습니다. OpenAI STT 엔진에 필요합니다.")
 
-        from openai import OpenAI
-        client = OpenAI(api_key=OPENAI_API_KEY)
+        client = _api_client("openai", OPENAI_API_KEY)
 
         print(f"STT (OpenAI): Transcribing {audio_path}...")
         with open(audio_path, "rb") as audio_file:
@@ -389,27 +719,25 @@ class STTModule:
             pass
 
         if with_segments:
-            import json
-            import re
             # Comprehensive JSON extraction
-            json_match = re.search(r'(\{.*\})', raw, re.DOTALL)
+            json_match = _RE_JSON_OBJECT.search(raw)
             cleaned = json_match.group(1) if json_match else raw
             
             # Remove markdown fences as a backup
-            cleaned = re.sub(r'^```(?:json)?\s*', '', cleaned)
-            cleaned = re.sub(r'\s*```$', '', cleaned)
+            cleaned = _RE_FENCE_START.sub('', cleaned)
+            cleaned = _RE_FENCE_END.sub('', cleaned)
             
             try:
-                data = json.loads(cleaned)
+                data = _fast_json.loads(cleaned)
                 raw_segs = data.get("segments", []) if isinstance(data, dict) else []
-                segments = _normalize_segments(raw_segs)
+                segments, joined = _normalize_segments_with_text(raw_segs)
                 
                 # #6 Fix: Return empty segments instead of dummy with wrong timestamps
                 if not segments and raw:
                     print("STT (Gemini): WARNING - No segments parsed from JSON, returning empty segments")
                     # Return text but empty segments - caller should handle this
                 
-                text = " ".join(s["text"] for s in segments) if segments else raw.strip()
+                text = joined if segments else raw.strip()
                 print(f"STT (Gemini): Transcription complete ({len(text)} chars, {len(segments)} segments)")
                 return {"text": text, "segments": segments}
             except (json.JSONDecodeError, KeyError) as e:
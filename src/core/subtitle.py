@@ -1,5 +1,7 @@
 """Subtitle generation module: SRT creation, segment translation, and FFmpeg burn-in."""
 
+import functools
+import glob
 import os
 import re
 import shutil
@@ -7,17 +9,51 @@ import subprocess
 import tempfile
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+
+# Zero-padded digit strings for timestamp fields, so formatting is a table lookup
+_D2 = [f"{i:02d}" for i in range(100)]
+_D3 = [f"{i:03d}" for i in range(1000)]
 
 
 def _format_srt_time(seconds: float) -> str:
     """Convert seconds to SRT timestamp format: HH:MM:SS,mmm"""
     # Use round to avoid floating-point precision loss
     total_ms = round(seconds * 1000)
-    hours = total_ms // 3_600_000
-    minutes = (total_ms % 3_600_000) // 60_000
-    secs = (total_ms % 60_000) // 1000
-    millis = total_ms % 1000
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+    hours, rem = divmod(total_ms, 3_600_000)
+    minutes, rem = divmod(rem, 60_000)
+    secs, millis = divmod(rem, 1000)
+    # Hours can pass 99 only on 100h+ media; fall back to formatting there
+    hh = _D2[hours] if hours < 100 else f"{hours:02d}"
+    return f"{hh}:{_D2[minutes]}:{_D2[secs]},{_D3[millis]}"
+
+
+# From this many timestamps on, the arithmetic runs vectorized in NumPy
+_VECTORIZE_MIN_TIMES = 512
+
+
+def _format_srt_times(seconds: list[float]) -> list[str]:
+    """Format many timestamps at once (same output as _format_srt_time)."""
+    if len(seconds) < _VECTORIZE_MIN_TIMES:
+        return [_format_srt_time(s) for s in seconds]
+    try:
+        import numpy as np
+    except ImportError:
+        return [_format_srt_time(s) for s in seconds]
+
+    # np.rint rounds half to even, like round()
+    total_ms = np.rint(np.asarray(seconds, dtype=np.float64) * 1000).astype(np.int64)
+    hours, rem = np.divmod(total_ms, 3_600_000)
+    minutes, rem = np.divmod(rem, 60_000)
+    secs, millis = np.divmod(rem, 1000)
+    if hours.max() >= 100:
+        return [_format_srt_time(s) for s in seconds]
+    d2, d3 = _D2, _D3
+    return [
+        f"{d2[h]}:{d2[m]}:{d2[s]},{d3[ms]}"
+        for h, m, s, ms in zip(hours.tolist(), minutes.tolist(), secs.tolist(), millis.tolist())
+    ]
 
 
 def generate_srt(segments: list[dict], output_path: str) -> str:
@@ -32,16 +68,22 @@ def generate_srt(segments: list[dict], output_path: str) -> str:
     """
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-    idx = 1
+    kept = []
+    for seg in segments:
+        text = seg["text"].strip()
+        if text:
+            kept.append((seg["start"], seg["end"], text))
+    starts = _format_srt_times([start for start, _, _ in kept])
+    ends = _format_srt_times([end for _, end, _ in kept])
+
+    # Build the whole file in memory (a few MB at most) and write it once
+    parts = [
+        f"{idx}\n{start} --> {end}\n{text}\n\n"
+        for idx, (start, end, (_, _, text)) in enumerate(zip(starts, ends, kept), 1)
+    ]
+
     with open(output_path, "w", encoding="utf-8") as f:
-        for seg in segments:
-            text = seg["text"].strip()
-            if not text:
-                continue
-            start = _format_srt_time(seg["start"])
-            end = _format_srt_time(seg["end"])
-            f.write(f"{idx}\n{start} --> {end}\n{text}\n\n")
-            idx += 1
+        f.write("".join(parts))
 
     return output_path
 
@@ -51,9 +93,17 @@ def generate_srt(segments: list[dict], output_path: str) -> str:
 # ---------------------------------------------------------------------------
 # Import chunk size from config (with fallback for standalone usage)
 try:
-    from ..config import SUBTITLE_CHUNK_SIZE as _CHUNK_SIZE
+    from ..config import (
+        SUBTITLE_CHUNK_SIZE as _CHUNK_SIZE,
+        SUBTITLE_MAX_BATCH_CHARS as _MAX_BATCH_CHARS,
+        SUBTITLE_MAX_CONCURRENT as _MAX_CONCURRENT,
+        SUBTITLE_BURN_QUALITY_MODE as _BURN_QUALITY_MODE,
+    )
 except ImportError:
-    _CHUNK_SIZE = 10  # Fallback default
+    _CHUNK_SIZE = 40  # Fallback default
+    _MAX_BATCH_CHARS = 6000
+    _MAX_CONCURRENT = 8
+    _BURN_QUALITY_MODE = False
 
 
 def _build_batch_text(indexed_segments: list[tuple[int, str]]) -> str:
@@ -62,27 +112,68 @@ def _build_batch_text(indexed_segments: list[tuple[int, str]]) -> str:
     return "\n".join(lines)
 
 
+def _pack_chunks(indexed_segments: list[tuple[int, str]], max_chars: int = _MAX_BATCH_CHARS,
+                 max_items: int = _CHUNK_SIZE) -> list[list[tuple[int, str]]]:
+    """Greedily pack segments into batches bounded by tagged character size and segment count.
+
+    A single segment longer than max_chars still gets a batch of its own.
+    """
+    batches = []
+    current = []
+    current_chars = 0
+    for idx, text in indexed_segments:
+        # Length of the "<sN>text</sN>\n" line _build_batch_text emits
+        size = len(text) + 2 * len(str(idx)) + 8
+        if current and (current_chars + size > max_chars or len(current) >= max_items):
+            batches.append(current)
+            current = []
+            current_chars = 0
+        current.append((idx, text))
+        current_chars += size
+    if current:
+        batches.append(current)
+    return batches
+
+
+# Markdown code fence Gemini sometimes wraps around output (leading ```lang line or trailing ```)
+_RE_MD_FENCE = re.compile(r"^```[a-zA-Z]*\n?|\n?```\s*$")
+# Opening <sN> tag; the body runs to the matching </sN>, located with str.find
+_RE_SEGMENT_OPEN = re.compile(r"<s(\d+)>")
+# Fallback [N] marker style, running up to the next marker
+_RE_SEGMENT_BRACKET = re.compile(r"\[(\d+)\]\s*(.*?)(?=\[\d+\]|\Z)", re.DOTALL)
+
+
 def _parse_batch_result(translated: str, expected_ids: list[int]) -> dict[int, str]:
     """Parse translated batch text with <sN>...</sN> tags back into a map."""
-    # Strip markdown code blocks that Gemini sometimes wraps around output
-    translated = re.sub(r"^```[a-zA-Z]*\n?", "", translated.strip())
-    translated = re.sub(r"\n?```\s*$", "", translated.strip())
+    translated = _RE_MD_FENCE.sub("", translated.strip()).strip()
+    expected = set(expected_ids)
     result = {}
-    for idx in expected_ids:
-        # Try XML-style tags first
-        m = re.search(rf"<s{idx}>(.*?)</s{idx}>", translated, re.DOTALL)
-        if m:
-            result[idx] = m.group(1).strip()
+    # Try XML-style tags first: one scan over the whole output, first occurrence of each ID wins.
+    # Equivalent to finditer over <s(\d+)>(.*?)</s\1>, without backtracking through the body.
+    pos = 0
+    while (m := _RE_SEGMENT_OPEN.search(translated, pos)) is not None:
+        close = translated.find(f"</s{m.group(1)}>", m.end())
+        if close < 0:
+            pos = m.start() + 1
             continue
-        # Fallback: try [N] marker style (word boundary after digits to avoid [1] matching [10])
-        m = re.search(rf"\[{idx}\](?!\d)\s*(.*?)(?=\[\d+\]|$)", translated, re.DOTALL)
-        if m:
-            result[idx] = m.group(1).strip()
+        idx = int(m.group(1))
+        if idx in expected and idx not in result:
+            result[idx] = translated[m.end():close].strip()
+        pos = close + len(m.group(1)) + 4
+    # Fallback: [N] markers, only when some IDs are still missing
+    if len(result) < len(expected):
+        for m in _RE_SEGMENT_BRACKET.finditer(translated):
+            idx = int(m.group(1))
+            if idx in expected and idx not in result:
+                result[idx] = m.group(2).strip()
     return result
 
 
-def _translate_single_with_retry(translator, idx: int, text: str, source_lang: str, target_lang: str, translation_engine: str, translated_map: dict, max_retries: int = 2):
-    """Translate a single segment with retry and engine fallback."""
+def _translate_single_with_retry(translator, idx: int, text: str, source_lang: str, target_lang: str, translation_engine: str, translated_map: dict, max_retries: int = 2) -> str | None:
+    """Translate a single segment with retry and engine fallback.
+
+    Returns the engine that produced the translation, or None if the segment failed.
+    """
     from .utils.llm import GeminiQuotaError
     engine = translation_engine
     for attempt in range(max_retries + 1):
@@ -90,7 +181,7 @@ def _translate_single_with_retry(translator, idx: int, text: str, source_lang: s
             result = translator.translate(text, source_lang, target_lang, "optimize", engine)
             if result and result.strip():
                 translated_map[idx] = result.strip()
-                return
+                return translator.last_engine() or engine
         except GeminiQuotaError:
             print(f"Gemini quota hit for segment {idx}, switching to groq")
             engine = "groq"
@@ -102,9 +193,103 @@ def _translate_single_with_retry(translator, idx: int, text: str, source_lang: s
                 time.sleep(wait)
             else:
                 print(f"Individual translation failed for segment {idx} after {max_retries+1} attempts: {e}")
+    return None
+
+
+# Appended to the system prompt when a batch reply had to be re-requested
+_STRICT_TAGS_NOTE = (
+    "\n\nCRITICAL: Your previous reply had malformed or missing tags. "
+    "Produce ONLY <sN>...</sN> lines, one per input segment, nothing else."
+)
+
 
+def _try_batch(translator, batch_text: str, system_prompt: str, expected_ids: list[int],
+               translation_engine: str, threshold_ratio: float, attempts: int = 2) -> tuple[dict[int, str], str]:
+    """Translate a batch, re-asking with a stricter prompt while the parse rate is under threshold.
 
-def translate_segments(segments: list[dict], translator, source_lang: str, target_lang: str, translation_engine: str = "gemini", progress_callback=None) -> tuple[list[dict], float]:
+    One extra batch call recovers most malformed replies, which is far cheaper than
+    translating every segment individually. Returns the best parse and the engine that produced it.
+    """
+    best = {}
+    best_engine = translation_engine
+    for attempt in range(attempts):
+        prompt = system_prompt if attempt == 0 else system_prompt + _STRICT_TAGS_NOTE
+        try:
+            translated_batch = translator.translate_raw(batch_text, prompt, translation_engine)
+        except Exception as e:
+            # translate_raw already retried; the engine itself is failing
+            print(f"Batch translation failed: {e}")
+            break
+        parsed = _parse_batch_result(translated_batch, expected_ids)
+        if len(parsed) > len(best):
+            best = parsed
+            best_engine = translator.last_engine() or translation_engine
+        if len(best) >= len(expected_ids) * threshold_ratio:
+            break
+        if attempt + 1 < attempts:
+            print(f"Batch parse below threshold ({len(parsed)}/{len(expected_ids)}), retrying with stricter prompt...")
+    return best, best_engine
+
+
+def _translate_chunk(chunk: list[tuple[int, str]], chunk_no: int, translator, system_prompt: str,
+                     source_lang: str, target_lang: str, translation_engine: str,
+                     threshold_ratio: float) -> tuple[dict[int, str], set[int]]:
+    """Translate one batch chunk, filling missing items individually.
+
+    Returns ({index: text}, indices translated by a fallback engine rather than translation_engine).
+    """
+    expected_ids = [idx for idx, _ in chunk]
+    print(f"Translating subtitle chunk {chunk_no} ({len(chunk)} segments)...")
+    parsed, batch_engine = _try_batch(translator, _build_batch_text(chunk), system_prompt, expected_ids,
+                                      translation_engine, threshold_ratio)
+
+    # Check parse success rate
+    if len(parsed) >= len(expected_ids) * threshold_ratio:
+        fallback_ids = set(parsed) if batch_engine != translation_engine else set()
+        # Fill missing items in this chunk individually if any
+        if len(parsed) < len(expected_ids):
+            missing = [c for c in chunk if c[0] not in parsed]
+            print(f"Batch missing {len(missing)} items, translating individually...")
+            fallback_ids |= _translate_individually(translator, missing, source_lang, target_lang,
+                                                    translation_engine, parsed)
+        return parsed, fallback_ids
+
+    # Fallback: translate individually for this whole chunk if batch failed completely
+    print(f"Batch parsing failed ({len(parsed)}/{len(expected_ids)}), falling back to individual translation")
+    result = {}
+    fallback_ids = _translate_individually(translator, chunk, source_lang, target_lang, translation_engine, result)
+    return result, fallback_ids
+
+
+# Shared by every chunk worker so individual fallback calls stay bounded process-wide
+# (threads start lazily on first submit)
+_SINGLE_CALL_POOL = ThreadPoolExecutor(max_workers=_MAX_CONCURRENT, thread_name_prefix="subtitle-single")
+
+
+def _translate_individually(translator, items: list[tuple[int, str]], source_lang: str, target_lang: str,
+                            translation_engine: str, translated_map: dict) -> set[int]:
+    """Translate items one call each, concurrently for API engines, into translated_map.
+
+    Returns the indices that were translated by a fallback engine.
+    """
+    if translation_engine == "local" or len(items) < 2:
+        engines = [
+            (idx, _translate_single_with_retry(translator, idx, text, source_lang, target_lang,
+                                               translation_engine, translated_map))
+            for idx, text in items
+        ]
+    else:
+        # Each call writes only its own key, so the shared dict needs no lock
+        futures = [
+            (idx, _SINGLE_CALL_POOL.submit(_translate_single_with_retry, translator, idx, text,
+                                           source_lang, target_lang, translation_engine, translated_map))
+            for idx, text in items
+        ]
+        engines = [(idx, future.result()) for idx, future in futures]
+    return {idx for idx, engine in engines if engine is not None and engine != translation_engine}
+
+
+def translate_segments(segments: list[dict], translator, source_lang: str, target_lang: str, translation_engine: str = "gemini", progress_callback=None, cache=None) -> tuple[list[dict], float]:
     """Translate all segments using batching to preserve timing context.
 
     Handles batching in chunks to avoid timeout on long videos.
@@ -112,6 +297,7 @@ def translate_segments(segments: list[dict], translator, source_lang: str, targe
 
     Args:
         progress_callback: Optional callable(current, total) for progress updates.
+        cache: Optional SegmentTranslationCache; hits skip the LLM, new translations are stored.
 
     Returns:
         Tuple of (translated_segments, success_rate) where success_rate is 0-100.
@@ -124,68 +310,69 @@ def translate_segments(segments: list[dict], translator, source_lang: str, targe
 
     # Map original index to translated text
     translated_map = {}
-    to_translate = [(i, s["text"]) for i, s in enumerate(segments) if s["text"].strip()]
+    # Strip each text once; the stripped form is what gets translated, cached and kept as fallback
+    stripped = [s["text"].strip() for s in segments]
+    to_translate = [(i, text) for i, text in enumerate(stripped) if text]
 
     if not to_translate:
-        return segments
-
-    total_chunks = (len(to_translate) + _CHUNK_SIZE - 1) // _CHUNK_SIZE
-    
-    # Process in chunks to avoid timeout and token limits
-    for chunk_idx, chunk_start in enumerate(range(0, len(to_translate), _CHUNK_SIZE)):
-        chunk = to_translate[chunk_start:chunk_start + _CHUNK_SIZE]
-        batch_text = _build_batch_text(chunk)
-        expected_ids = [idx for idx, _ in chunk]
-
-        system_prompt = (
-            f"You are a professional subtitle translator from {source_lang} to {target_lang}. "
-            "RULES: Keep the <sN>...</sN> tags exactly as-is and put the translation inside them. "
-            "Output ONLY the translated segments with tags. No explanations. No extra text.\n\n"
-            "Example input:\n<s0>Hello world</s0>\n<s1>How are you?</s1>\n\n"
-            f"Example output:\n<s0>[translation of 'Hello world' in {target_lang}]</s0>\n"
-            f"<s1>[translation of 'How are you?' in {target_lang}]</s1>"
-        )
-
-        try:
-            print(f"Translating subtitle chunk {chunk_start//_CHUNK_SIZE + 1} ({len(chunk)} segments)...")
-            translated_batch = translator.translate_raw(
-                batch_text, system_prompt, translation_engine
-            )
-            parsed = _parse_batch_result(translated_batch, expected_ids)
-        except Exception as e:
-            print(f"Batch translation failed: {e}")
-            parsed = {}
-
-        # Check parse success rate
-        # #5 Fix: Use configurable threshold
-        from ..config import SUBTITLE_BATCH_THRESHOLD
-        threshold_ratio = SUBTITLE_BATCH_THRESHOLD / 100.0
-        if len(parsed) >= len(expected_ids) * threshold_ratio:
-            translated_map.update(parsed)
-            # Fill missing items in this chunk individually if any
-            if len(parsed) < len(expected_ids):
-                missing = [c for c in chunk if c[0] not in parsed]
-                print(f"Batch missing {len(missing)} items, translating individually...")
-                for idx, text in missing:
-                    _translate_single_with_retry(translator, idx, text, source_lang, target_lang, translation_engine, translated_map)
-        else:
-            # Fallback: translate individually for this whole chunk if batch failed completely
-            print(f"Batch parsing failed ({len(parsed)}/{len(expected_ids)}), falling back to individual translation")
-            for idx, text in chunk:
-                _translate_single_with_retry(translator, idx, text, source_lang, target_lang, translation_engine, translated_map)
+        return segments, 100.0
 
-        # Report progress after each chunk
-        if progress_callback:
-            progress_callback(chunk_idx + 1, total_chunks)
+    # Reuse earlier translations of identical lines (re-runs, recurring intros/catchphrases)
+    pending = to_translate
+    if cache is not None:
+        hits = cache.get_many([text for _, text in to_translate], source_lang, target_lang, translation_engine)
+        if hits:
+            for idx, text in to_translate:
+                if text in hits:
+                    translated_map[idx] = hits[text]
+            pending = [(idx, text) for idx, text in to_translate if idx not in translated_map]
+            print(f"Subtitle cache: reused {len(translated_map)}/{len(to_translate)} segments")
+    source_texts = dict(to_translate)
+
+    # Process in size-bounded chunks to avoid timeout and token limits
+    chunks = _pack_chunks(pending)
+    total_chunks = len(chunks)
+
+    system_prompt = (
+        f"You are a professional subtitle translator from {source_lang} to {target_lang}. "
+        "RULES: Keep the <sN>...</sN> tags exactly as-is and put the translation inside them. "
+        "Output ONLY the translated segments with tags. No explanations. No extra text.\n\n"
+        "Example input:\n<s0>Hello world</s0>\n<s1>How are you?</s1>\n\n"
+        f"Example output:\n<s0>[translation of 'Hello world' in {target_lang}]</s0>\n"
+        f"<s1>[translation of 'How are you?' in {target_lang}]</s1>"
+    )
+
+    # #5 Fix: Use configurable threshold
+    from ..config import SUBTITLE_BATCH_THRESHOLD
+    threshold_ratio = SUBTITLE_BATCH_THRESHOLD / 100.0
+
+    # API calls are blocking network I/O, so chunks run on a thread pool; a local
+    # Ollama model serves one request at a time, so it gets a single worker
+    workers = 1 if translation_engine == "local" else max(1, min(_MAX_CONCURRENT, total_chunks))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_translate_chunk, chunk, chunk_no, translator, system_prompt,
+                        source_lang, target_lang, translation_engine, threshold_ratio)
+            for chunk_no, chunk in enumerate(chunks, 1)
+        ]
+        # Results are merged on this thread; each worker fills its own map
+        for done, future in enumerate(as_completed(futures), 1):
+            chunk_result, fallback_ids = future.result()
+            translated_map.update(chunk_result)
+            if cache is not None:
+                # Only cache what the requested engine produced; echoed source lines are not translations
+                cache.put_many([(source_texts[idx], text) for idx, text in chunk_result.items()
+                                if idx not in fallback_ids and text != source_texts[idx]],
+                               source_lang, target_lang, translation_engine)
+            # Report progress after each chunk
+            if progress_callback:
+                progress_callback(done, total_chunks)
 
     # Build final segments
-    translated_segments = []
-    for i, seg in enumerate(segments):
-        translated_segments.append({
-            "start": seg["start"],
-            "end": seg["end"],
-            "text": translated_map.get(i, seg["text"])
-        })
+    translated_segments = [
+        {"start": seg["start"], "end": seg["end"], "text": translated_map.get(i, stripped[i])}
+        for i, seg in enumerate(segments)
+    ]
 
     success_rate = len(translated_map) / len(to_translate) * 100 if to_translate else 100
     # Log failed segment indices for debugging
@@ -201,8 +388,20 @@ def translate_segments(segments: list[dict], translator, source_lang: str, targe
 # FFmpeg subtitle burn-in
 # ---------------------------------------------------------------------------
 
+# Set once an NVENC run fails because the GPU/driver can't encode at all; later burns go
+# straight to libx264 instead of failing through the NVENC commands again
+_nvenc_broken = False
+# ffmpeg stderr fragments meaning NVENC itself is unusable (not a per-file problem)
+_NVENC_UNAVAILABLE_MARKERS = (
+    "cannot load nvcuda", "cannot load libcuda", "cannot load libnvidia-encode",
+    "no nvenc capable devices", "no capable devices found", "driver does not support",
+    "openencodesessionex failed", "cuinit",
+)
+
+
+@functools.lru_cache(maxsize=1)
 def _has_nvenc() -> bool:
-    """Check if NVIDIA NVENC encoder is available."""
+    """Check if NVIDIA NVENC encoder is available (probed once per process)."""
     try:
         result = subprocess.run(
             ["ffmpeg", "-hide_banner", "-encoders"],
@@ -224,9 +423,12 @@ def _is_safe_ffmpeg_path(path: str) -> bool:
     return False
 
 
-def _prepare_safe_path(file_path: str, prefix: str = "vv_sub") -> tuple[str, bool]:
+def _prepare_safe_path(file_path: str, prefix: str = "vv_sub", link: bool = False) -> tuple[str, bool]:
     """Copy a file to a safe ASCII-only temp path for FFmpeg.
 
+    With link=True a hard link (same volume) or symlink is tried before copying,
+    so large videos don't have to be duplicated.
+
     Returns (safe_path, needs_cleanup).
     """
     if _is_safe_ffmpeg_path(file_path):
@@ -237,6 +439,14 @@ def _prepare_safe_path(file_path: str, prefix: str = "vv_sub") -> tuple[str, boo
     ext = os.path.splitext(file_path)[1]
     safe_name = f"{prefix}_{uuid.uuid4().hex[:12]}{ext}"
     safe_path = os.path.join(temp_dir, safe_name)
+    if link:
+        # Hard links need the same volume; symlinks need privileges on Windows
+        for make_link in (os.link, os.symlink):
+            try:
+                make_link(os.path.abspath(file_path), safe_path)
+                return safe_path, True
+            except (OSError, NotImplementedError):
+                continue
     shutil.copy2(file_path, safe_path)
     return safe_path, True
 
@@ -253,14 +463,37 @@ def _escape_srt_for_ffmpeg(srt_path: str) -> str:
     return escaped
 
 
-def _build_burn_cmd(video_path: str, escaped_srt: str, output_path: str, use_nvenc: bool) -> list[str]:
-    """Build FFmpeg command for subtitle burn-in."""
+# h264_nvenc settings; quality mode spends more encoder effort on sharp subtitle edges
+if _BURN_QUALITY_MODE:
+    _NVENC_VIDEO_ARGS = [
+        "-c:v", "h264_nvenc", "-preset", "p5", "-tune", "hq", "-rc", "vbr", "-cq", "23",
+        "-spatial_aq", "1", "-temporal_aq", "1", "-rc-lookahead", "20", "-b_ref_mode", "middle",
+    ]
+else:
+    _NVENC_VIDEO_ARGS = ["-c:v", "h264_nvenc", "-preset", "p4", "-cq", "23"]
+
+
+def _build_burn_cmd(video_path: str, escaped_srt: str, output_path: str, use_nvenc: bool,
+                    hwaccel: bool = False) -> list[str]:
+    """Build FFmpeg command for subtitle burn-in.
+
+    hwaccel (NVENC only) decodes on the GPU with NVDEC; frames leave GPU memory only
+    for the libass overlay step.
+    """
+    if use_nvenc and hwaccel:
+        return [
+            "ffmpeg", "-hwaccel", "cuda", "-hwaccel_output_format", "cuda", "-i", video_path,
+            "-vf", f"hwdownload,format=nv12,subtitles='{escaped_srt}',hwupload_cuda",
+            "-c:a", "copy",
+            *_NVENC_VIDEO_ARGS,
+            output_path, "-y"
+        ]
     if use_nvenc:
         return [
             "ffmpeg", "-i", video_path,
             "-vf", f"subtitles='{escaped_srt}'",
             "-c:a", "copy",
-            "-c:v", "h264_nvenc", "-preset", "p4", "-cq", "23",
+            *_NVENC_VIDEO_ARGS,
             output_path, "-y"
         ]
     return [
@@ -272,13 +505,83 @@ def _build_burn_cmd(video_path: str, escaped_srt: str, output_path: str, use_nve
     ]
 
 
-def burn_subtitles(video_path: str, srt_path: str, output_path: str) -> bool:
+def hard_burn_path(output_path: str) -> str:
+    """Where burn_subtitles(mode="soft_then_hard") writes the burned-in copy of output_path."""
+    base, ext = os.path.splitext(output_path)
+    return f"{base}.hard{ext}"
+
+
+def burn_subtitles(video_path: str, srt_path: str, output_path: str, mode: str = "hard",
+                   language: str = "ko", on_hard_done=None) -> bool:
+    """Add subtitles to a video.
+
+    mode:
+        "hard": burn them into the frames (full re-encode, slow)
+        "soft": embed a toggleable subtitle track (stream copy, ~1 second)
+        "soft_then_hard": embed soft subtitles into output_path and return, then burn in
+            on a background worker to hard_burn_path(output_path)
+
+    language is the subtitle track tag for the soft modes.
+    on_hard_done: optional callable(success: bool) run when the background burn of
+        "soft_then_hard" finishes (use start_hard_burn() directly to get the Future).
+    """
+    if mode == "soft":
+        return embed_soft_subtitles(video_path, srt_path, output_path, language)
+    if mode == "soft_then_hard":
+        if not embed_soft_subtitles(video_path, srt_path, output_path, language):
+            return False
+        future = start_hard_burn(video_path, srt_path, hard_burn_path(output_path))
+        if on_hard_done is not None:
+            future.add_done_callback(lambda f: on_hard_done(not f.exception() and f.result()))
+        return True
+    if mode != "hard":
+        raise ValueError(f"Unknown subtitle mode: {mode}")
+    return _hard_burn(video_path, srt_path, output_path)
+
+
+# Background burns run one at a time. The worker is not a daemon thread, so interpreter
+# shutdown waits for an encode in progress instead of killing it half-written.
+_BURN_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="subtitle-burn")
+
+
+def start_hard_burn(video_path: str, srt_path: str, output_path: str) -> "Future[bool]":
+    """Queue a hard burn to output_path on the background worker; the Future gives its result."""
+    return _BURN_POOL.submit(_burn_in_background, video_path, srt_path, output_path)
+
+
+def _burn_in_background(video_path: str, srt_path: str, output_path: str) -> bool:
+    """Hard burn to a temp name, then move it into place so a half-written file is never visible."""
+    base, ext = os.path.splitext(output_path)
+    partial_path = f"{base}.partial{ext}"
+    # Leftovers of burns cut off by a crash or forced shutdown; nothing else writes
+    # these while the single burn worker is here
+    for stale in glob.glob(os.path.join(glob.escape(os.path.dirname(output_path) or "."), "*.hard.partial.*")):
+        try:
+            os.remove(stale)
+            print(f"Removed stale partial burn: {stale}")
+        except OSError:
+            pass
+    if _hard_burn(video_path, srt_path, partial_path):
+        os.replace(partial_path, output_path)
+        print(f"Background subtitle burn complete: {output_path}")
+        return True
+    if os.path.exists(partial_path):
+        try:
+            os.remove(partial_path)
+        except OSError:
+            pass
+    print(f"Background subtitle burn failed: {output_path}")
+    return False
+
+
+def _hard_burn(video_path: str, srt_path: str, output_path: str) -> bool:
     """Burn subtitles into video using FFmpeg subtitles filter.
 
     - Copies SRT to safe ASCII path to avoid encoding/special char issues
     - Automatically uses GPU encoding (h264_nvenc) if available
     - Falls back to libx264 fast on failure
     """
+    global _nvenc_broken
     if not os.path.isfile(video_path):
         print(f"Subtitle burn failed: Video not found: {video_path}")
         return False
@@ -290,21 +593,31 @@ def burn_subtitles(video_path: str, srt_path: str, output_path: str) -> bool:
 
     # Copy SRT and video to safe paths to avoid FFmpeg path parsing issues with unicode
     safe_srt, srt_cleanup = _prepare_safe_srt(srt_path)
-    safe_video, video_cleanup = _prepare_safe_path(video_path, prefix="vv_vid")
+    safe_video, video_cleanup = _prepare_safe_path(video_path, prefix="vv_vid", link=True)
     escaped_srt = _escape_srt_for_ffmpeg(safe_srt)
-    use_nvenc = _has_nvenc()
+    use_nvenc = not _nvenc_broken and _has_nvenc()
 
     def _cleanup():
         for path, needed in [(safe_srt, srt_cleanup), (safe_video, video_cleanup)]:
-            if needed and os.path.isfile(path):
+            # lexists: a symlink is removed even if its target is already gone
+            if needed and os.path.lexists(path):
                 try:
-                    os.remove(path)
+                    os.unlink(path)
                 except OSError:
                     pass
 
     try:
         if use_nvenc:
-            print("Subtitle burn: Using NVIDIA GPU encoding (h264_nvenc)")
+            print("Subtitle burn: Using NVIDIA GPU decoding + encoding (NVDEC/h264_nvenc)")
+            try:
+                cmd = _build_burn_cmd(safe_video, escaped_srt, output_path, True, hwaccel=True)
+                subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.PIPE, timeout=600)
+                return True
+            except subprocess.CalledProcessError as e:
+                # e.g. 10-bit or NVDEC-unsupported codecs: decode on CPU, still encode with NVENC
+                stderr_msg = e.stderr.decode("utf-8", errors="replace") if e.stderr else ""
+                print(f"NVDEC path failed, retrying with CPU decoding: {stderr_msg[:200]}")
         else:
             print("Subtitle burn: Using CPU encoding (libx264 fast)")
 
@@ -323,6 +636,10 @@ def burn_subtitles(video_path: str, srt_path: str, output_path: str) -> bool:
                 cmd_cpu = _build_burn_cmd(safe_video, escaped_srt, output_path, False)
                 subprocess.run(cmd_cpu, check=True, stdout=subprocess.DEVNULL,
                                stderr=subprocess.PIPE, timeout=600)
+                lowered = stderr_msg.lower()
+                if any(marker in lowered for marker in _NVENC_UNAVAILABLE_MARKERS):
+                    _nvenc_broken = True
+                    print("Subtitle burn: NVENC unusable on this machine, using CPU encoding from now on")
                 return True
             except Exception as e2:
                 print(f"Subtitle burn CPU fallback failed: {e2}")
@@ -372,6 +689,9 @@ def embed_soft_subtitles(video_path: str, srt_path: str, output_path: str, langu
 
     cmd = [
         "ffmpeg",
+        # Stream copy keeps the source timestamps: fill in missing PTS and shift
+        # negative ones to zero so the muxer never has to fix them up
+        "-fflags", "+genpts",
         "-i", video_path,
         "-i", srt_path,
         "-c:v", "copy",
@@ -380,6 +700,8 @@ def embed_soft_subtitles(video_path: str, srt_path: str, output_path: str, langu
         "-map", "0:v",
         "-map", "0:a?",
         "-map", "1:0",
+        "-map_metadata", "0",
+        "-avoid_negative_ts", "make_zero",
         "-metadata:s:s:0", f"language={language}",
         output_path, "-y"
     ]
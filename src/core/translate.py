@@ -1,6 +1,8 @@
 import requests
+import threading
 import time
 import re
+import json
 
 from ..config import (
     OLLAMA_HOST as DEFAULT_OLLAMA_HOST,
@@ -11,7 +13,40 @@ from ..config import (
     GEMINI_API_KEY,
     GEMINI_MODEL,
 )
-from .utils.llm import GeminiQuotaError, is_quota_error
+from .utils.llm import GeminiQuotaError, is_quota_error, groq_session
+from .utils.rate_limit import gemini_key_pool, seconds_until_daily_reset, usage_tokens
+
+# Gemini clients for keys other than GEMINI_API_KEY (genai.configure() is process-global)
+_GEMINI_KEY_CLIENTS: dict[str, object] = {}
+_GEMINI_KEY_CLIENTS_LOCK = threading.Lock()
+
+
+def _gemini_key_client(api_key: str):
+    """Return the shared GenerativeServiceClient for api_key, creating it on first use."""
+    # Held across creation so concurrent subtitle workers don't each open a gRPC channel
+    with _GEMINI_KEY_CLIENTS_LOCK:
+        client = _GEMINI_KEY_CLIENTS.get(api_key)
+        if client is None:
+            from google.ai import generativelanguage as glm
+            client = glm.GenerativeServiceClient(client_options={"api_key": api_key})
+            _GEMINI_KEY_CLIENTS[api_key] = client
+        return client
+
+
+def _bind_gemini_client(model, client):
+    """Make a GenerativeModel send its requests through client instead of the global genai config.
+
+    GenerativeModel has no public per-model client or key. google-generativeai is pinned
+    (requirements.txt) to a version that creates its default client only while the private
+    _client is None; this is the single place relying on that (tests/test_translate.py).
+    """
+    if getattr(model, "_client", False) is not None:
+        raise RuntimeError(
+            "google-generativeai GenerativeModel no longer exposes _client; "
+            "GEMINI_API_KEYS key rotation needs the pinned SDK version (requirements.txt)"
+        )
+    model._client = client
+    return model
 
 GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 
@@ -46,6 +81,12 @@ class Translator:
         self.model = model or DEFAULT_OLLAMA_MODEL
         self.host = host or DEFAULT_OLLAMA_HOST
         self.timeout = timeout or DEFAULT_OLLAMA_TIMEOUT
+        # Engine that answered the latest LLM call on each thread (Gemini quota falls back to Groq)
+        self._served = threading.local()
+
+    def last_engine(self) -> str | None:
+        """Engine that produced the most recent successful LLM reply on the calling thread."""
+        return getattr(self._served, "engine", None)
 
     def strip_think_tags(self, text):
         cleaned = re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL)
@@ -93,7 +134,7 @@ class Translator:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
 
-        response = requests.post(
+        response = groq_session().post(
             GROQ_API_URL,
             headers={
                 "Authorization": f"Bearer {GROQ_API_KEY}",
@@ -138,7 +179,7 @@ class Translator:
             raise Exception("Ollama가 빈 응답을 반환했습니다")
         return cleaned
 
-    def _call_gemini(self, prompt: str, system_prompt: str = None) -> str:
+    def _call_gemini(self, prompt: str, system_prompt: str = None, response_mime_type: str = None) -> str:
         """Call Gemini API and return the response text. Raises GeminiQuotaError on 429."""
         if not GEMINI_API_KEY:
             raise Exception("GEMINI_API_KEY가 설정되지 않았습니다. .env 파일에 설정해주세요.")
@@ -148,35 +189,62 @@ class Translator:
         except ImportError:
             raise Exception("google-generativeai 패키지가 설치되지 않았습니다. pip install google-generativeai")
 
-        genai.configure(api_key=GEMINI_API_KEY)
+        # With several keys, a quota-limited key cools down and the next key is tried
+        attempts = len(gemini_key_pool)
+        for attempt in range(attempts):
+            api_key, limiter = gemini_key_pool.next()
+            model = self._gemini_model(genai, api_key, system_prompt)
+            try:
+                usage = limiter.acquire(est_tokens=(len(prompt) + len(system_prompt or "")) // 4)
+                response = model.generate_content(
+                    prompt,
+                    generation_config=genai.types.GenerationConfig(
+                        temperature=0.3,
+                        max_output_tokens=8192,
+                        **({"response_mime_type": response_mime_type} if response_mime_type else {}),
+                    ),
+                    request_options={"timeout": 60}
+                )
+                limiter.record(usage, usage_tokens(response))
+                text = response.text
+                return self.strip_think_tags(text).strip()
+            except Exception as e:
+                if not is_quota_error(e):
+                    raise
+                if attempts > 1:
+                    # A spent daily budget stays spent until Pacific midnight, not one cooldown
+                    gemini_key_pool.penalize(
+                        api_key, seconds_until_daily_reset() if limiter.daily_exhausted() else None
+                    )
+                    if attempt + 1 < attempts:
+                        print(f"Gemini key rate-limited ({attempt + 1}/{attempts}), rotating to next key")
+                        continue
+                if isinstance(e, GeminiQuotaError):
+                    raise
+                raise GeminiQuotaError(f"Gemini API 할당량 초과: {e}")
+
+    @staticmethod
+    def _gemini_model(genai, api_key: str, system_prompt: str = None):
+        """GenerativeModel bound to api_key; GEMINI_API_KEY goes through the global genai config."""
         model = genai.GenerativeModel(
             GEMINI_MODEL,
             system_instruction=system_prompt if system_prompt else None,
         )
-
-        try:
-            response = model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.3,
-                    max_output_tokens=8192,
-                ),
-                request_options={"timeout": 60}
-            )
-            text = response.text
-            return self.strip_think_tags(text).strip()
-        except Exception as e:
-            if is_quota_error(e):
-                raise GeminiQuotaError(f"Gemini API 할당량 초과: {e}")
-            raise
+        if api_key == GEMINI_API_KEY:
+            genai.configure(api_key=GEMINI_API_KEY)
+            return model
+        return _bind_gemini_client(model, _gemini_key_client(api_key))
 
     def _call_llm(self, prompt: str, engine: str = "local", system_prompt: str = None) -> str:
         """Route to the appropriate LLM backend."""
         if engine == "gemini":
-            return self._call_gemini(prompt, system_prompt=system_prompt)
-        if engine == "groq":
-            return self._call_groq(prompt, system_prompt=system_prompt)
-        return self._call_ollama(prompt)
+            result = self._call_gemini(prompt, system_prompt=system_prompt)
+        elif engine == "groq":
+            result = self._call_groq(prompt, system_prompt=system_prompt)
+        else:
+            result = self._call_ollama(prompt)
+        self._served.engine = engine
+        return result
 
     def _get_language_specific_instructions(self, target_lang: str, source_lang: str) -> str:
         """Return language-specific translation instructions."""
@@ -305,6 +373,75 @@ RULES:
         else:
             return self._translate_chunk(sanitized_text, system_prompt, engine)
 
+    def translate_and_evaluate(self, text: str, source_lang: str, target_lang: str,
+                               sync_mode: str = "optimize") -> tuple[str, dict | None]:
+        """Translate and self-evaluate in a single Gemini call.
+
+        Returns (translated_text, quality_result). quality_result is None when the
+        fused call is not possible (long text, parse failure, API error) — in that
+        case the translation comes from the regular translate() path and the caller
+        should evaluate separately.
+        """
+        if not text or not text.strip():
+            return "", None
+
+        sanitized_text = self.sanitize_input(text)
+        if not sanitized_text:
+            return "", None
+
+        # Long texts are chunked by translate(); a single fused prompt would not fit
+        if len(sanitized_text) > self.CHUNK_THRESHOLD or not GEMINI_API_KEY:
+            return self.translate(text, source_lang, target_lang, sync_mode, "gemini"), None
+
+        s_name = LANGUAGE_NAMES.get(source_lang, source_lang)
+        t_name = LANGUAGE_NAMES.get(target_lang, target_lang)
+        system_prompt = self._build_system_prompt(s_name, t_name, sync_mode, target_lang, source_lang)
+
+        prompt = f"""Translate the following text, then strictly evaluate your translation for video dubbing.
+
+<text>
+{sanitized_text}
+</text>
+
+Score accuracy, naturalness, dubbing_fit and consistency from 1-100.
+overall_score = accuracy*0.4 + naturalness*0.3 + dubbing_fit*0.2 + consistency*0.1
+List ONLY actionable issues (max 5), quoting the problematic text.
+
+Respond ONLY with this JSON object:
+{{
+  "translation": "<full translation>",
+  "quality": {{
+    "overall_score": <1-100>,
+    "breakdown": {{"accuracy": <1-100>, "naturalness": <1-100>, "dubbing_fit": <1-100>, "consistency": <1-100>}},
+    "issues": ["issue1"],
+    "recommendation": "APPROVED" or "REVIEW_NEEDED" or "REJECT"
+  }}
+}}"""
+
+        try:
+            raw = self._call_gemini(prompt, system_prompt=system_prompt, response_mime_type="application/json")
+            data = json.loads(raw)
+            translated = str(data.get("translation", "")).strip()
+            quality = data.get("quality")
+            if not translated:
+                raise ValueError("empty translation in fused response")
+        except Exception as e:
+            print(f"[Translator] Fused translate+evaluate failed ({e}), using regular translation")
+            return self.translate(text, source_lang, target_lang, sync_mode, "gemini"), None
+
+        # A bad score only loses the evaluation; the translation itself is kept
+        if not isinstance(quality, dict) or "overall_score" not in quality:
+            return translated, None
+        try:
+            score = int(float(quality["overall_score"]))
+        except (TypeError, ValueError, OverflowError):
+            print(f"[Translator] Fused evaluation score unparseable ({quality['overall_score']!r}), evaluating separately")
+            return translated, None
+        quality["overall_score"] = max(0, min(100, score))
+        if not isinstance(quality.get("issues"), list):
+            quality["issues"] = []
+        return translated, quality
+
     def translate_raw(self, user_text: str, system_prompt: str, engine: str = "local") -> str:
         """Translate with explicit system prompt and user text (no wrapping).
 
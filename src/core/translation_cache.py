@@ -3,10 +3,15 @@ Translation Cache — stores translation + quality results on disk.
 
 Cache key = hash of (original_text, source_lang, target_lang, sync_mode).
 Each entry is a JSON file under static/cache/translations/.
+
+SegmentTranslationCache keeps per-segment subtitle translations in one SQLite
+file in the same directory.
 """
 import hashlib
 import json
+import sqlite3
 import time
+from contextlib import closing
 from pathlib import Path
 
 
@@ -68,3 +73,74 @@ class TranslationCache:
             return True
         except OSError:
             return False
+
+
+class SegmentTranslationCache:
+    """Per-segment subtitle translations in a single SQLite table.
+
+    A subtitle job translates thousands of short lines, so one JSON file per entry
+    would flood the cache directory. Key = blake2b of (engine, source_lang, target_lang, text).
+    Lookup and write failures are logged and treated as misses.
+    """
+
+    # SQLite's default limit on bound parameters is 999
+    _QUERY_BATCH = 500
+
+    def __init__(self, db_path: Path, expiration_days: int = 30):
+        self.db_path = Path(db_path)
+        self.expiration_seconds = expiration_days * 86400
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS segments "
+                    "(key BLOB PRIMARY KEY, translated TEXT NOT NULL, timestamp REAL NOT NULL)"
+                )
+                conn.execute("DELETE FROM segments WHERE timestamp < ?",
+                             (time.time() - self.expiration_seconds,))
+        except sqlite3.Error as e:
+            print(f"[SegmentCache] Failed to open {self.db_path}: {e}")
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection per operation: callers run on worker threads. Use as
+        # `with closing(self._connect()) as conn, conn:` - the inner `with conn`
+        # only commits/rolls back, closing() releases the connection
+        return sqlite3.connect(str(self.db_path), timeout=10)
+
+    def _make_key(self, text: str, source_lang: str, target_lang: str, engine: str) -> bytes:
+        raw = f"{engine}\0{source_lang}\0{target_lang}\0{text}"
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+    def get_many(self, texts: list[str], source_lang: str, target_lang: str, engine: str) -> dict[str, str]:
+        """Return {text: translation} for every text with a live cache entry."""
+        keyed = {self._make_key(t, source_lang, target_lang, engine): t for t in texts}
+        found = {}
+        cutoff = time.time() - self.expiration_seconds
+        keys = list(keyed)
+        try:
+            with closing(self._connect()) as conn, conn:
+                for start in range(0, len(keys), self._QUERY_BATCH):
+                    batch = keys[start:start + self._QUERY_BATCH]
+                    rows = conn.execute(
+                        f"SELECT key, translated FROM segments WHERE timestamp >= ? "
+                        f"AND key IN ({','.join('?' * len(batch))})",
+                        (cutoff, *batch),
+                    )
+                    for key, translated in rows:
+                        found[keyed[key]] = translated
+        except sqlite3.Error as e:
+            print(f"[SegmentCache] Lookup failed: {e}")
+            return {}
+        return found
+
+    def put_many(self, pairs: list[tuple[str, str]], source_lang: str, target_lang: str, engine: str) -> None:
+        """Store (text, translation) pairs."""
+        if not pairs:
+            return
+        now = time.time()
+        rows = [(self._make_key(t, source_lang, target_lang, engine), tr, now) for t, tr in pairs]
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.executemany("INSERT OR REPLACE INTO segments VALUES (?, ?, ?)", rows)
+        except sqlite3.Error as e:
+            print(f"[SegmentCache] Failed to write: {e}")
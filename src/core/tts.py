@@ -16,6 +16,9 @@ SUPPORTED_XTTS_LANGUAGES = {
 # Maximum text length for TTS (characters)
 MAX_TEXT_LENGTH = 10000
 
+# XTTS only conditions on the first 30s of the speaker reference (max_ref_length)
+XTTS_SPEAKER_REF_SECONDS = 30
+
 
 class TTSModule:
     """Unified TTS module supporting multiple engines: xtts, edge, silero, elevenlabs, openai."""
@@ -32,7 +35,7 @@ class TTSModule:
             self.device = device
 
     def _generate_single(self, text: str, speaker_wav: str, output_path: str,
-                          language: str = "ko", voice: str = None) -> bool:
+                          language: str = "ko", voice: str = None) -> int:
         """Generate TTS for a single chunk. Internal dispatch."""
         if self.engine == "edge":
             return asyncio.run(self._generate_edge(text, output_path, language, voice))
@@ -46,7 +49,7 @@ class TTSModule:
             return self._generate_xtts(text, speaker_wav, output_path, language)
 
     def generate(self, text: str, speaker_wav: str, output_path: str,
-                 language: str = "ko", voice: str = None) -> bool:
+                 language: str = "ko", voice: str = None, cancel_event=None) -> int:
         """Generate TTS audio. Splits long text into chunks and concatenates.
 
         Args:
@@ -55,9 +58,11 @@ class TTSModule:
             output_path: Path to write the output WAV/MP3
             language: Target language code
             voice: Optional voice ID override (for edge/silero)
+            cancel_event: Optional threading.Event checked between chunks;
+                raises InterruptedError when set
 
         Returns:
-            True on success
+            Size of the written output file in bytes (> 0 on success)
         """
         text = self._validate_text(text)
         chunks = self._split_text_for_tts(text)
@@ -69,6 +74,9 @@ class TTSModule:
         print(f"TTS: Splitting {len(text)} chars into {len(chunks)} chunks")
         chunk_paths = []
         for i, chunk in enumerate(chunks):
+            if cancel_event is not None and cancel_event.is_set():
+                self._remove_files(chunk_paths)
+                raise InterruptedError("TTS generation cancelled")
             chunk_path = f"{output_path}.chunk{i}.wav"
             print(f"TTS: Generating chunk {i+1}/{len(chunks)} ({len(chunk)} chars)")
             self._generate_single(chunk, speaker_wav, chunk_path, language, voice)
@@ -77,7 +85,7 @@ class TTSModule:
         return self._concat_audio_files(chunk_paths, output_path)
 
     async def _generate_single_async(self, text: str, speaker_wav: str, output_path: str,
-                                      language: str = "ko", voice: str = None) -> bool:
+                                      language: str = "ko", voice: str = None) -> int:
         """Async single-chunk generation. Internal dispatch."""
         if self.engine == "edge":
             return await self._generate_edge(text, output_path, language, voice)
@@ -99,7 +107,7 @@ class TTSModule:
             )
 
     async def generate_async(self, text: str, speaker_wav: str, output_path: str,
-                             language: str = "ko", voice: str = None) -> bool:
+                             language: str = "ko", voice: str = None, cancel_event=None) -> int:
         """Async version of generate. Splits long text into chunks and concatenates."""
         text = self._validate_text(text)
         chunks = self._split_text_for_tts(text)
@@ -110,6 +118,9 @@ class TTSModule:
         print(f"TTS async: Splitting {len(text)} chars into {len(chunks)} chunks")
         chunk_paths = []
         for i, chunk in enumerate(chunks):
+            if cancel_event is not None and cancel_event.is_set():
+                self._remove_files(chunk_paths)
+                raise InterruptedError("TTS generation cancelled")
             chunk_path = f"{output_path}.chunk{i}.wav"
             print(f"TTS async: Generating chunk {i+1}/{len(chunks)} ({len(chunk)} chars)")
             await self._generate_single_async(chunk, speaker_wav, chunk_path, language, voice)
@@ -120,7 +131,7 @@ class TTSModule:
     # ──────────────────────────── Edge TTS ────────────────────────────
 
     async def _generate_edge(self, text: str, output_path: str,
-                             language: str, voice: str = None) -> bool:
+                             language: str, voice: str = None) -> int:
         """Edge TTS - free, high quality, no GPU required."""
         import edge_tts
 
@@ -163,12 +174,12 @@ class TTSModule:
 
         output_size = os.path.getsize(output_path)
         print(f"Edge TTS output created: {output_path} ({output_size} bytes)")
-        return True
+        return output_size
 
     # ──────────────────────────── Silero TTS ────────────────────────────
 
     def _generate_silero(self, text: str, output_path: str,
-                         language: str, voice: str = None) -> bool:
+                         language: str, voice: str = None) -> int:
         """Silero TTS - lightweight local, specialized for Russian.
 
         Falls back to Edge TTS on failure.
@@ -203,7 +214,7 @@ class TTSModule:
 
             output_size = os.path.getsize(output_path)
             print(f"Silero TTS output created: {output_path} ({output_size} bytes)")
-            return True
+            return output_size
 
         except Exception as e:
             print(f"Silero TTS 실패: {e} — Edge TTS로 폴백합니다...")
@@ -221,7 +232,7 @@ class TTSModule:
     # ──────────────────────────── XTTS v2 ────────────────────────────
 
     def _generate_xtts(self, text: str, speaker_wav: str,
-                       output_path: str, language: str) -> bool:
+                       output_path: str, language: str) -> int:
         """XTTS v2 - voice cloning with speaker reference audio."""
         validated_text = self._validate_text(text)
         self._validate_speaker_wav(speaker_wav)
@@ -250,7 +261,7 @@ class TTSModule:
                 raise RuntimeError("TTS가 빈 출력 파일을 생성했습니다")
 
             print(f"XTTS output created: {output_path} ({output_size} bytes)")
-            return True
+            return output_size
 
         except (ValueError, FileNotFoundError):
             raise
@@ -265,7 +276,7 @@ class TTSModule:
     # ──────────────────────────── ElevenLabs TTS ────────────────────────────
 
     def _generate_elevenlabs(self, text: str, speaker_wav: str,
-                             output_path: str, language: str) -> bool:
+                             output_path: str, language: str) -> int:
         """ElevenLabs TTS - high quality with voice cloning support."""
         from ..config import ELEVENLABS_API_KEY, ELEVENLABS_MODEL
         if not ELEVENLABS_API_KEY:
@@ -329,12 +340,12 @@ class TTSModule:
 
         output_size = os.path.getsize(output_path)
         print(f"ElevenLabs TTS output created: {output_path} ({output_size} bytes)")
-        return True
+        return output_size
 
     # ──────────────────────────── OpenAI TTS ────────────────────────────
 
     def _generate_openai(self, text: str, output_path: str,
-                         language: str, voice: str = None) -> bool:
+                         language: str, voice: str = None) -> int:
         """OpenAI TTS - preset voices, no cloning."""
         from ..config import OPENAI_API_KEY
         if not OPENAI_API_KEY:
@@ -362,7 +373,7 @@ class TTSModule:
 
         output_size = os.path.getsize(output_path)
         print(f"OpenAI TTS output created: {output_path} ({output_size} bytes)")
-        return True
+        return output_size
 
     # ──────────────────────────── Validation ────────────────────────────
 
@@ -385,13 +396,13 @@ class TTSModule:
             chunks.append(current.strip())
         return chunks if chunks else [text[:MAX_TEXT_LENGTH]]
 
-    def _concat_audio_files(self, audio_paths: list[str], output_path: str) -> bool:
-        """Concatenate multiple audio files into one using FFmpeg."""
+    def _concat_audio_files(self, audio_paths: list[str], output_path: str) -> int:
+        """Concatenate multiple audio files into one using FFmpeg. Returns output size in bytes."""
         import subprocess, tempfile
         if len(audio_paths) == 1:
             import shutil
             shutil.move(audio_paths[0], output_path)
-            return True
+            return os.path.getsize(output_path)
 
         # Create FFmpeg concat list file
         list_path = output_path + ".concat.txt"
@@ -403,17 +414,19 @@ class TTSModule:
 
             cmd = ["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", list_path, "-c", "copy", output_path]
             subprocess.run(cmd, check=True, capture_output=True, timeout=120)
-            return True
+            return os.path.getsize(output_path)
         except Exception as e:
             # #3 Fix: Raise error instead of silent fallback to prevent truncated audio
             print(f"Audio concat failed: {e}")
             raise RuntimeError(f"{len(audio_paths)}개 오디오 청크 병합 실패: {e}")
         finally:
-            if os.path.isfile(list_path):
-                os.remove(list_path)
-            for p in audio_paths:
-                if os.path.isfile(p):
-                    os.remove(p)
+            self._remove_files([list_path, *audio_paths])
+
+    def _remove_files(self, paths: list[str]) -> None:
+        """Remove leftover chunk/list files."""
+        for p in paths:
+            if os.path.isfile(p):
+                os.remove(p)
 
     def _validate_text(self, text: str) -> str:
         if not text:
@@ -5,10 +5,16 @@ from .vram import clear_vram, get_device, get_vram_info
 from .llm import (
     GeminiQuotaError,
     is_quota_error,
+    is_auth_error,
+    is_transient_error,
+    call_with_retry,
+    call_with_retry_async,
     call_gemini,
     call_groq,
+    groq_session,
     call_llm_with_fallback,
 )
+from .rate_limit import GeminiRateLimiter, gemini_rate_limiter, GeminiKeyPool, gemini_key_pool
 
 __all__ = [
     # VRAM utilities
@@ -18,7 +24,17 @@ __all__ = [
     # LLM utilities
     'GeminiQuotaError',
     'is_quota_error',
+    'is_auth_error',
+    'is_transient_error',
+    'call_with_retry',
+    'call_with_retry_async',
     'call_gemini',
     'call_groq',
+    'groq_session',
     'call_llm_with_fallback',
+    # Rate limiting
+    'GeminiRateLimiter',
+    'gemini_rate_limiter',
+    'GeminiKeyPool',
+    'gemini_key_pool',
 ]
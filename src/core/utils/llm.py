@@ -3,7 +3,47 @@
 
 translate.py와 quality.py에서 중복되는 Gemini/Groq 호출 로직을 통합합니다.
 """
+import asyncio
 import os
+import random
+import re
+import threading
+import time
+
+# "Please retry in 37.5s" / "retry_delay { seconds: 37 }" in Gemini 429 messages
+_RETRY_DELAY_RE = re.compile(r'retry(?:_delay)?\s*(?:in|\{\s*seconds:)\s*([\d.]+)', re.IGNORECASE)
+
+
+_groq_session = None
+_groq_session_lock = threading.Lock()
+
+
+def groq_session():
+    """
+    Shared keep-alive HTTP session for Groq calls.
+
+    Reusing the connection pool skips a TCP + TLS handshake per request;
+    502/503/504 responses are retried twice with backoff before being returned.
+    """
+    global _groq_session
+    if _groq_session is None:
+        with _groq_session_lock:
+            if _groq_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                retry = Retry(
+                    total=2,
+                    backoff_factor=0.5,
+                    status_forcelist=[502, 503, 504],
+                    allowed_methods=frozenset({"POST"}),
+                    raise_on_status=False,
+                )
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+                _groq_session = session
+    return _groq_session
 
 
 class GeminiQuotaError(Exception):
@@ -11,12 +51,91 @@ class GeminiQuotaError(Exception):
     pass
 
 
+# SDK exception class names, matched by name so the SDKs needn't be importable
+# (groq/openai RateLimitError, google-api-core ResourceExhausted / TooManyRequests)
+_QUOTA_ERROR_TYPES = frozenset({"GeminiQuotaError", "RateLimitError", "ResourceExhausted", "TooManyRequests"})
+# groq/openai AuthenticationError, google-api-core Unauthenticated
+_AUTH_ERROR_TYPES = frozenset({"AuthenticationError", "Unauthenticated"})
+
+
 def is_quota_error(error: Exception) -> bool:
     """Check if an exception indicates API quota/rate limit exceeded."""
+    if type(error).__name__ in _QUOTA_ERROR_TYPES:
+        return True
     error_str = str(error).lower()
     return any(kw in error_str for kw in ["429", "quota", "resource exhausted", "rate limit"])
 
 
+def is_auth_error(error: Exception) -> bool:
+    """Check if an exception means the API key is missing or rejected."""
+    if type(error).__name__ in _AUTH_ERROR_TYPES:
+        return True
+    error_str = str(error).lower()
+    return any(kw in error_str for kw in ["api_key", "api key", "not set", "설정되지 않았습니다"])
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Check if an exception is a server-side hiccup (503/504/500) worth retrying."""
+    if type(error).__name__ in ("ServiceUnavailable", "DeadlineExceeded", "InternalServerError"):
+        return True
+    error_str = str(error).lower()
+    return any(kw in error_str for kw in ["503", "504", "500 internal", "unavailable", "deadline exceeded"])
+
+
+def retry_after_seconds(error: Exception) -> float | None:
+    """Extract the server-suggested retry delay from a rate-limit error, if any."""
+    match = _RETRY_DELAY_RE.search(str(error))
+    return float(match.group(1)) if match else None
+
+
+def _retry_wait(error: Exception, attempt: int, base: float, max_retry_after: float) -> float:
+    """Return how long to wait before retrying error, or re-raise it if it is not retryable."""
+    if is_quota_error(error):
+        delay = retry_after_seconds(error)
+        if delay is None or delay > max_retry_after:
+            raise error
+        from .rate_limit import gemini_rate_limiter
+        gemini_rate_limiter.note_rate_limited(delay)
+        return delay + random.uniform(0, base)
+    if is_transient_error(error):
+        return random.uniform(0, base * (2 ** attempt))
+    raise error
+
+
+def call_with_retry(fn, max_attempts: int = 4, base: float = 0.5, max_retry_after: float = 30.0):
+    """
+    Call fn(), retrying transient Gemini failures with exponential backoff and jitter.
+
+    - 503/504/500: sleep uniform(0, base * 2**attempt) and retry.
+    - 429 with a short server retry delay: tell the shared rate limiter to hold
+      back every caller for that long, then retry.
+    - 429 without a usable delay (e.g. daily quota) and all other errors are
+      re-raised immediately so callers can fall back.
+    """
+    for attempt in range(max_attempts):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == max_attempts - 1:
+                raise
+            wait = _retry_wait(e, attempt, base, max_retry_after)
+            print(f"[LLM] 일시적 오류 - {wait:.1f}초 후 재시도 ({attempt + 1}/{max_attempts - 1}): {e}")
+            time.sleep(wait)
+
+
+async def call_with_retry_async(fn, max_attempts: int = 4, base: float = 0.5, max_retry_after: float = 30.0):
+    """Async counterpart of call_with_retry: awaits fn() and backs off without blocking the loop."""
+    for attempt in range(max_attempts):
+        try:
+            return await fn()
+        except Exception as e:
+            if attempt == max_attempts - 1:
+                raise
+            wait = _retry_wait(e, attempt, base, max_retry_after)
+            print(f"[LLM] 일시적 오류 - {wait:.1f}초 후 재시도 ({attempt + 1}/{max_attempts - 1}): {e}")
+            await asyncio.sleep(wait)
+
+
 def call_gemini(
     prompt: str,
     api_key: str,
@@ -59,6 +178,8 @@ def call_gemini(
         system_instruction=system_prompt if system_prompt else None,
     )
 
+    from .rate_limit import gemini_rate_limiter, usage_tokens
+    usage = gemini_rate_limiter.acquire(est_tokens=(len(prompt) + len(system_prompt or "")) // 4)
     try:
         response = model.generate_content(
             prompt,
@@ -68,6 +189,7 @@ def call_gemini(
             ),
             request_options={"timeout": timeout}
         )
+        gemini_rate_limiter.record(usage, usage_tokens(response))
         return response.text.strip()
     except Exception as e:
         if is_quota_error(e):
@@ -100,8 +222,6 @@ def call_groq(
     Raises:
         Exception: For API errors including rate limits
     """
-    import requests
-
     if not api_key:
         raise Exception("GROQ_API_KEY가 설정되지 않았습니다.")
 
@@ -110,7 +230,7 @@ def call_groq(
         messages.append({"role": "system", "content": system_prompt})
     messages.append({"role": "user", "content": prompt})
 
-    response = requests.post(
+    response = groq_session().post(
         "https://api.groq.com/openai/v1/chat/completions",
         headers={
             "Authorization": f"Bearer {api_key}",
@@ -0,0 +1,193 @@
+"""
+Gemini 요청 속도 제한기
+
+RPM/TPM은 60초 슬라이딩 윈도우, RPD는 태평양 시간 자정에 초기화되는 일일 카운터로 추적합니다.
+분당 한도에 걸리면 여유가 생길 때까지 대기하고, 일일 한도를 넘으면 GeminiQuotaError를 발생시켜
+기존 Groq 폴백 경로가 바로 동작하도록 합니다.
+한도가 0이면 해당 제한은 꺼지고(GEMINI_TIER 미설정 시 기본값), 서버 429 응답에 따른 대기만 적용됩니다.
+"""
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+
+from .llm import GeminiQuotaError
+
+try:
+    from zoneinfo import ZoneInfo
+    _PACIFIC = ZoneInfo("America/Los_Angeles")
+except Exception:
+    _PACIFIC = timezone(timedelta(hours=-8))
+
+_WINDOW_SECONDS = 60.0
+
+
+def _pacific_today():
+    return datetime.now(_PACIFIC).date()
+
+
+def seconds_until_daily_reset() -> float:
+    """Seconds until the RPD counters reset at the next Pacific midnight."""
+    now = datetime.now(_PACIFIC)
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=_PACIFIC)
+    # Compared in UTC so DST-change days come out right
+    return max(1.0, (midnight.astimezone(timezone.utc) - now.astimezone(timezone.utc)).total_seconds())
+
+
+class GeminiRateLimiter:
+    """Thread-safe RPM/TPM/RPD limiter shared by every Gemini caller in the process.
+
+    A limit of 0 disables that cap; 429 cooldowns from note_rate_limited() always apply.
+    """
+
+    def __init__(self, rpm: int, tpm: int, rpd: int, safety_margin: float = 0.9, tier: str = ""):
+        self.rpm = max(1, int(rpm * safety_margin)) if rpm > 0 else 0
+        self.tpm = max(1, int(tpm * safety_margin)) if tpm > 0 else 0
+        self.rpd = max(1, int(rpd * safety_margin)) if rpd > 0 else 0
+        self.tier = tier
+        self._requests = deque()  # request timestamps in the last minute
+        self._usage = deque()     # [timestamp, tokens] entries in the last minute
+        self._tokens_in_window = 0
+        self._day = _pacific_today()
+        self._day_count = 0
+        self._cooldown_until = 0.0
+        self._warned = False
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - _WINDOW_SECONDS
+        while self._requests and self._requests[0] <= cutoff:
+            self._requests.popleft()
+        while self._usage and self._usage[0][0] <= cutoff:
+            self._tokens_in_window -= self._usage.popleft()[1]
+
+    def acquire(self, est_tokens: int) -> list:
+        """Block until a request of est_tokens fits the minute windows.
+
+        Returns a usage handle to pass to record() once the real token count is known.
+        Raises GeminiQuotaError when the daily request budget is spent.
+        """
+        est_tokens = max(1, est_tokens)
+        while True:
+            with self._lock:
+                today = _pacific_today()
+                if today != self._day:
+                    self._day, self._day_count = today, 0
+                if self.rpd and self._day_count >= self.rpd:
+                    raise GeminiQuotaError(f"Gemini 일일 요청 한도(RPD {self.rpd}) 소진 - quota exhausted")
+
+                now = time.monotonic()
+                self._prune(now)
+                wait = self._cooldown_until - now
+                if self.rpm and len(self._requests) >= self.rpm:
+                    wait = max(wait, self._requests[0] + _WINDOW_SECONDS - now)
+                if self.tpm and self._usage and self._tokens_in_window + est_tokens > self.tpm:
+                    wait = max(wait, self._usage[0][0] + _WINDOW_SECONDS - now)
+
+                if wait <= 0:
+                    entry = [now, est_tokens]
+                    self._requests.append(now)
+                    self._usage.append(entry)
+                    self._tokens_in_window += est_tokens
+                    self._day_count += 1
+                    return entry
+
+                if not self._warned:
+                    self._warned = True
+                    print(f"[RateLimit] Gemini 분당 한도 도달 - {wait:.1f}초 대기 "
+                          f"(GEMINI_TIER={self.tier or '미설정'}, RPM {self.rpm or '-'}, TPM {self.tpm or '-'})")
+            time.sleep(min(wait, 5.0))
+
+    def daily_exhausted(self) -> bool:
+        """True while today's request budget (RPD) is spent."""
+        with self._lock:
+            return bool(self.rpd) and self._day == _pacific_today() and self._day_count >= self.rpd
+
+    def note_rate_limited(self, delay: float) -> None:
+        """Hold back every caller for delay seconds after the server answered 429."""
+        with self._lock:
+            self._cooldown_until = max(self._cooldown_until, time.monotonic() + delay)
+
+    def record(self, entry: list, actual_tokens: int | None) -> None:
+        """Replace the estimate in a usage handle with the real token count."""
+        if not actual_tokens:
+            return
+        with self._lock:
+            if entry[0] > time.monotonic() - _WINDOW_SECONDS:
+                self._tokens_in_window += actual_tokens - entry[1]
+            entry[1] = actual_tokens
+
+
+def _create_default_limiter() -> GeminiRateLimiter:
+    try:
+        from ...config import GEMINI_TIER, GEMINI_RPM_LIMIT, GEMINI_TPM_LIMIT, GEMINI_RPD_LIMIT
+    except ImportError:
+        GEMINI_TIER, GEMINI_RPM_LIMIT, GEMINI_TPM_LIMIT, GEMINI_RPD_LIMIT = "", 0, 0, 0
+    return GeminiRateLimiter(GEMINI_RPM_LIMIT, GEMINI_TPM_LIMIT, GEMINI_RPD_LIMIT, tier=GEMINI_TIER)
+
+
+# Global instance shared by translate.py, quality.py and llm.py
+gemini_rate_limiter = _create_default_limiter()
+
+
+class GeminiKeyPool:
+    """Round-robin over several Gemini API keys, each with its own rate limiter.
+
+    The first key shares gemini_rate_limiter with the rest of the process. A key that
+    hits its quota sits out for the cooldown; GeminiQuotaError is raised only when
+    every key is cooling down, so the usual Groq fallback still applies.
+    """
+
+    def __init__(self, keys: list[str], cooldown: float = 60.0):
+        self._keys = list(keys)
+        self._limiters = {
+            key: gemini_rate_limiter if i == 0 else _create_default_limiter()
+            for i, key in enumerate(self._keys)
+        }
+        self._cooldown_until = dict.fromkeys(self._keys, 0.0)
+        self._cooldown = cooldown
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def next(self) -> tuple[str, GeminiRateLimiter]:
+        """Return the next (key, limiter) that is not cooling down."""
+        with self._lock:
+            now = time.monotonic()
+            for _ in range(len(self._keys)):
+                key = self._keys[self._next]
+                self._next = (self._next + 1) % len(self._keys)
+                if self._cooldown_until[key] <= now:
+                    return key, self._limiters[key]
+        raise GeminiQuotaError("모든 Gemini API 키가 대기 중 - quota exhausted")
+
+    def penalize(self, key: str, seconds: float = None) -> None:
+        """Take key out of rotation for seconds (default: the pool cooldown)."""
+        with self._lock:
+            if key in self._cooldown_until:
+                self._cooldown_until[key] = time.monotonic() + (self._cooldown if seconds is None else seconds)
+
+
+def _create_default_key_pool() -> GeminiKeyPool:
+    try:
+        from ...config import GEMINI_API_KEYS, GEMINI_KEY_COOLDOWN
+    except ImportError:
+        import os
+        GEMINI_API_KEYS = [os.environ["GEMINI_API_KEY"]] if os.environ.get("GEMINI_API_KEY") else []
+        GEMINI_KEY_COOLDOWN = 60.0
+    return GeminiKeyPool(GEMINI_API_KEYS, cooldown=GEMINI_KEY_COOLDOWN)
+
+
+# Global key pool used by translate.py
+gemini_key_pool = _create_default_key_pool()
+
+
+def usage_tokens(response) -> int | None:
+    """Total token count reported by a Gemini response, if available."""
+    try:
+        return response.usage_metadata.total_token_count or None
+    except Exception:
+        # Missing on some SDK versions and on streams that were stopped early
+        return None
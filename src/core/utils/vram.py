@@ -1,4 +1,3 @@
-import torch
 import gc
 
 
@@ -9,6 +8,9 @@ def clear_vram(component_name: str = "System"):
     # Always run garbage collection
     gc.collect()
 
+    # torch is imported on use so importing utils does not pull it in
+    import torch
+
     # Only perform CUDA operations if available
     if torch.cuda.is_available():
         torch.cuda.empty_cache()
@@ -21,11 +23,13 @@ def clear_vram(component_name: str = "System"):
 
 def get_device() -> str:
     """Get the best available device (cuda or cpu)."""
+    import torch
     return "cuda" if torch.cuda.is_available() else "cpu"
 
 
 def get_vram_info() -> dict:
     """Get VRAM usage information."""
+    import torch
     if not torch.cuda.is_available():
         return {"available": False, "device": "cpu"}
 
@@ -1,4 +1,7 @@
 import os
+import queue
+import logging
+import logging.handlers
 import requests
 import asyncio
 
@@ -37,6 +40,30 @@ app.include_router(router)
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
+# Application log records (e.g. pipeline failure tracebacks) are queued and
+# written to stderr by a background thread so the event loop never blocks on I/O
+_log_queue = queue.SimpleQueue()
+_log_listener = None
+
+@app.on_event("startup")
+async def startup_logging():
+    """Route application loggers through a queue drained by a background thread."""
+    global _log_listener
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s [%(name)s] %(levelname)s: %(message)s"))
+    app_logger = logging.getLogger(__name__.split(".")[0])
+    app_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    app_logger.setLevel(logging.INFO)
+    app_logger.propagate = False
+    _log_listener = logging.handlers.QueueListener(_log_queue, handler)
+    _log_listener.start()
+
+@app.on_event("shutdown")
+async def shutdown_logging():
+    """Flush queued log records before exit."""
+    if _log_listener is not None:
+        _log_listener.stop()
+
 @app.on_event("startup")
 async def startup_cleanup():
     """Clean up expired jobs and orphan files on server startup."""
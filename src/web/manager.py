@@ -20,6 +20,10 @@ JOBS_PERSIST_FILE = os.path.join("static", "jobs.json")
 
 
 class JobManager:
+    # Pipeline steps a job can report, and the states each step moves through
+    VALID_STEPS = frozenset({"extract", "transcribe", "translate", "tts", "merge", "subtitle", "burn"})
+    VALID_STEP_STATUSES = frozenset({"pending", "processing", "done", "failed"})
+
     def __init__(self):
         self._jobs: Dict[str, Dict] = {}
         self._cancelled: set = set()  # Track cancelled job IDs
@@ -312,13 +316,11 @@ class JobManager:
             return False
 
         # Validate step key
-        valid_steps = {"extract", "transcribe", "translate", "tts", "merge", "subtitle", "burn"}
-        if step_key not in valid_steps:
+        if step_key not in self.VALID_STEPS:
             return False
 
         # Validate status
-        valid_statuses = {"pending", "processing", "done", "failed"}
-        if status not in valid_statuses:
+        if status not in self.VALID_STEP_STATUSES:
             return False
 
         with self._lock:
@@ -329,33 +331,56 @@ class JobManager:
                 self._jobs[job_id]["current_step"] = step_key
             return True
 
-    def append_log(self, job_id: str, message: str) -> bool:
+    def complete_step(self, job_id: str, step_key: str, progress: int, message: str = None) -> bool:
+        """Mark a step done, set progress and optionally log, all under one lock acquisition."""
         if not self._validate_job_id(job_id):
             return False
 
+        if step_key not in self.VALID_STEPS:
+            return False
+
+        progress = max(0, min(100, progress))
+
         with self._lock:
             if job_id not in self._jobs:
                 return False
+            job = self._jobs[job_id]
+            job["steps"][step_key] = "done"
+            job["progress"] = progress
+            if message:
+                self._append_log_locked(job_id, message)
+            return True
 
-            logs = self._jobs[job_id]["logs"]
-
-            # Truncate message if too long
-            if len(message) > 500:
-                message = message[:500] + "..."
-
-            # Keep only last MAX_LOGS_PER_JOB entries
-            if len(logs) >= MAX_LOGS_PER_JOB:
-                # Remove oldest 10% when limit reached
-                remove_count = MAX_LOGS_PER_JOB // 10
-                self._jobs[job_id]["logs"] = logs[remove_count:]
+    def append_log(self, job_id: str, message: str) -> bool:
+        if not self._validate_job_id(job_id):
+            return False
 
-            # Store log with timestamp
-            self._jobs[job_id]["logs"].append({
-                "timestamp": datetime.now(),
-                "message": message
-            })
+        with self._lock:
+            if job_id not in self._jobs:
+                return False
+            self._append_log_locked(job_id, message)
             return True
 
+    def _append_log_locked(self, job_id: str, message: str) -> None:
+        """Append a log entry. Must be called with lock held."""
+        logs = self._jobs[job_id]["logs"]
+
+        # Truncate message if too long
+        if len(message) > 500:
+            message = message[:500] + "..."
+
+        # Keep only last MAX_LOGS_PER_JOB entries
+        if len(logs) >= MAX_LOGS_PER_JOB:
+            # Remove oldest 10% when limit reached
+            remove_count = MAX_LOGS_PER_JOB // 10
+            self._jobs[job_id]["logs"] = logs[remove_count:]
+
+        # Store log with timestamp
+        self._jobs[job_id]["logs"].append({
+            "timestamp": datetime.now(),
+            "message": message
+        })
+
     def set_output_file(self, job_id: str, output_file: str) -> bool:
         """Set the output file path for a completed job."""
         if not self._validate_job_id(job_id):
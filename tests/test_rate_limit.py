@@ -0,0 +1,138 @@
+"""Unit tests for the Gemini rate limiter and API key pool (no network)."""
+import datetime
+import types
+
+import pytest
+
+from src.core.utils import rate_limit
+from src.core.utils.llm import GeminiQuotaError
+from src.core.utils.rate_limit import GeminiKeyPool, GeminiRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock; sleep() advances it instead of blocking."""
+    state = types.SimpleNamespace(now=1000.0)
+
+    def sleep(seconds):
+        state.now += seconds
+
+    monkeypatch.setattr(rate_limit, "time", types.SimpleNamespace(monotonic=lambda: state.now, sleep=sleep))
+    return state
+
+
+@pytest.fixture
+def today(monkeypatch):
+    """Controllable Pacific date for the RPD counter."""
+    state = types.SimpleNamespace(date=datetime.date(2026, 1, 1))
+    monkeypatch.setattr(rate_limit, "_pacific_today", lambda: state.date)
+    return state
+
+
+def _limiter(rpm=0, tpm=0, rpd=0):
+    return GeminiRateLimiter(rpm, tpm, rpd, safety_margin=1.0)
+
+
+def test_rpm_window_blocks_until_oldest_request_expires(clock, today):
+    limiter = _limiter(rpm=3)
+    for _ in range(3):
+        limiter.acquire(10)
+    assert clock.now == 1000.0
+
+    limiter.acquire(10)
+    assert clock.now == pytest.approx(1060.0)
+
+
+def test_rpm_window_slides(clock, today):
+    limiter = _limiter(rpm=2)
+    limiter.acquire(10)
+    clock.now += 30
+    limiter.acquire(10)
+    clock.now += 31  # first request is now older than the window
+    limiter.acquire(10)
+    assert clock.now == pytest.approx(1061.0)
+
+
+def test_tpm_window_uses_recorded_tokens(clock, today):
+    limiter = _limiter(tpm=100)
+    entry = limiter.acquire(80)
+    limiter.record(entry, 20)
+    limiter.acquire(70)  # 20 + 70 fits once the estimate is corrected
+    assert clock.now == 1000.0
+
+    limiter.acquire(30)  # 90 + 30 does not
+    assert clock.now == pytest.approx(1060.0)
+
+
+def test_429_cooldown_survives_full_rpm_window(clock, today):
+    limiter = _limiter(rpm=1)
+    limiter.acquire(10)
+    limiter.note_rate_limited(120)
+
+    limiter.acquire(10)
+    assert clock.now == pytest.approx(1120.0)
+
+
+def test_unset_limits_only_apply_429_cooldown(clock, today):
+    limiter = _limiter()
+    for _ in range(1000):
+        limiter.acquire(10_000)
+    assert clock.now == 1000.0
+    assert not limiter.daily_exhausted()
+
+    limiter.note_rate_limited(30)
+    limiter.acquire(10)
+    assert clock.now == pytest.approx(1030.0)
+
+
+def test_rpd_raises_until_pacific_day_changes(clock, today):
+    limiter = _limiter(rpd=2)
+    limiter.acquire(10)
+    limiter.acquire(10)
+    assert limiter.daily_exhausted()
+    with pytest.raises(GeminiQuotaError):
+        limiter.acquire(10)
+
+    today.date += datetime.timedelta(days=1)
+    assert not limiter.daily_exhausted()
+    limiter.acquire(10)
+
+
+def test_seconds_until_daily_reset_is_within_a_day():
+    assert 0 < rate_limit.seconds_until_daily_reset() <= 25 * 3600
+
+
+def test_key_pool_rotates_round_robin(clock):
+    pool = GeminiKeyPool(["a", "b", "c"], cooldown=60)
+    assert len(pool) == 3
+    assert [pool.next()[0] for _ in range(4)] == ["a", "b", "c", "a"]
+
+
+def test_key_pool_first_key_shares_process_limiter(clock):
+    pool = GeminiKeyPool(["a", "b"])
+    assert pool.next()[1] is rate_limit.gemini_rate_limiter
+    assert pool.next()[1] is not rate_limit.gemini_rate_limiter
+
+
+def test_key_pool_skips_penalized_key_until_cooldown_ends(clock):
+    pool = GeminiKeyPool(["a", "b", "c"], cooldown=60)
+    pool.penalize("b")
+    assert [pool.next()[0] for _ in range(3)] == ["a", "c", "a"]
+
+    clock.now += 61
+    assert [pool.next()[0] for _ in range(3)] == ["b", "c", "a"]
+
+
+def test_key_pool_custom_penalty(clock):
+    pool = GeminiKeyPool(["a", "b"], cooldown=60)
+    pool.penalize("a", seconds=3600)
+    clock.now += 61
+    assert [pool.next()[0] for _ in range(2)] == ["b", "b"]
+
+
+def test_key_pool_raises_when_every_key_cools_down(clock):
+    pool = GeminiKeyPool(["a", "b"], cooldown=60)
+    pool.penalize("a")
+    pool.penalize("b")
+    with pytest.raises(GeminiQuotaError):
+        pool.next()
@@ -0,0 +1,72 @@
+"""Tests for the per-key Gemini client plumbing in translate.py (no network)."""
+import threading
+import time
+
+import pytest
+
+from src.core import translate
+
+
+def test_bind_gemini_client_routes_requests_through_client():
+    # Guards the private GenerativeModel._client override against SDK upgrades
+    genai = pytest.importorskip("google.generativeai")
+    protos = genai.protos
+
+    class FakeClient:
+        def __init__(self):
+            self.requests = []
+
+        def generate_content(self, request, **kwargs):
+            self.requests.append(request)
+            return protos.GenerateContentResponse(candidates=[
+                protos.Candidate(
+                    content=protos.Content(role="model", parts=[protos.Part(text="ok")]),
+                    finish_reason=protos.Candidate.FinishReason.STOP,
+                )
+            ])
+
+    client = FakeClient()
+    model = translate._bind_gemini_client(genai.GenerativeModel("gemini-2.5-flash"), client)
+
+    assert model.generate_content("hi").text == "ok"
+    assert len(client.requests) == 1
+    assert client.requests[0].model == "models/gemini-2.5-flash"
+
+
+def test_bind_gemini_client_fails_loudly_on_unexpected_model():
+    class NoPrivateClient:
+        pass
+
+    class ClientAlreadySet:
+        _client = object()
+
+    for model in (NoPrivateClient(), ClientAlreadySet()):
+        with pytest.raises(RuntimeError):
+            translate._bind_gemini_client(model, object())
+
+
+def test_gemini_key_client_is_created_once_per_key(monkeypatch):
+    glm = pytest.importorskip("google.ai.generativelanguage")
+    created = []
+
+    def fake_client(client_options):
+        time.sleep(0.01)  # widen the window for a race
+        created.append(client_options["api_key"])
+        return object()
+
+    monkeypatch.setattr(glm, "GenerativeServiceClient", fake_client)
+    monkeypatch.setattr(translate, "_GEMINI_KEY_CLIENTS", {})
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(translate._gemini_key_client("key-b")))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert created == ["key-b"]
+    assert len({id(r) for r in results}) == 1
+    assert translate._gemini_key_client("key-c") is not results[0]
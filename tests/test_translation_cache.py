@@ -0,0 +1,69 @@
+"""Tests for the SQLite-backed SegmentTranslationCache."""
+import sqlite3
+
+import pytest
+
+from src.core import translation_cache
+from src.core.translation_cache import SegmentTranslationCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SegmentTranslationCache(tmp_path / "segments.db", expiration_days=1)
+
+
+def test_round_trip(cache):
+    cache.put_many([("Hello", "안녕하세요"), ("Bye", "잘 가요")], "en", "ko", "gemini")
+
+    assert cache.get_many(["Hello", "Bye", "Unknown"], "en", "ko", "gemini") == {
+        "Hello": "안녕하세요",
+        "Bye": "잘 가요",
+    }
+
+
+def test_entries_are_scoped_by_engine_and_languages(cache):
+    cache.put_many([("Hello", "안녕하세요")], "en", "ko", "gemini")
+
+    assert cache.get_many(["Hello"], "en", "ko", "groq") == {}
+    assert cache.get_many(["Hello"], "en", "ja", "gemini") == {}
+
+
+def test_expired_entries_are_misses_and_purged_on_open(cache, tmp_path, monkeypatch):
+    cache.put_many([("Hello", "안녕하세요")], "en", "ko", "gemini")
+    real_time = translation_cache.time.time
+    monkeypatch.setattr(translation_cache.time, "time", lambda: real_time() + 2 * 86400)
+
+    assert cache.get_many(["Hello"], "en", "ko", "gemini") == {}
+
+    SegmentTranslationCache(tmp_path / "segments.db", expiration_days=1)
+    with sqlite3.connect(str(tmp_path / "segments.db")) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM segments").fetchone()[0] == 0
+
+
+def test_get_many_batches_past_sqlite_parameter_limit(cache):
+    texts = [f"line {i}" for i in range(1200)]
+    cache.put_many([(t, t.upper()) for t in texts], "en", "ko", "gemini")
+
+    found = cache.get_many(texts, "en", "ko", "gemini")
+
+    assert len(found) == 1200
+    assert found["line 1199"] == "LINE 1199"
+
+
+def test_connections_are_closed(cache, monkeypatch):
+    opened = []
+    connect = cache._connect
+
+    def tracking_connect():
+        conn = connect()
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(cache, "_connect", tracking_connect)
+    cache.put_many([("Hello", "안녕하세요")], "en", "ko", "gemini")
+    cache.get_many(["Hello"], "en", "ko", "gemini")
+
+    assert len(opened) == 2
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")